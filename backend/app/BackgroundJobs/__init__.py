@@ -0,0 +1,9 @@
+from flask import Blueprint
+
+BackgroundJobs_bp = Blueprint(
+    "BackgroundJobs",
+    __name__,
+    url_prefix=""
+)
+
+from . import routes
@@ -0,0 +1,30 @@
+from . import BackgroundJobs_bp
+from flask import jsonify
+from app.models import backgroundJob
+from app.jobs import job_to_dict, fail_abandoned_jobs
+from app.auth import require_auth
+
+# Poll the progress of a background admin job
+@BackgroundJobs_bp.route("/api/admin/jobs/<job_id>/status", methods=['GET'])
+@require_auth("admin")
+def get_job_status(job_id):
+    try:
+        # a job whose worker went away is reported failed instead of running forever
+        fail_abandoned_jobs(job_id)
+        job = backgroundJob.query.get(job_id)
+        
+        if not job:
+            return jsonify({
+                "success": False,
+                "message": "Job not found"
+            }), 404
+        
+        return jsonify({
+            "success": True,
+            "job": job_to_dict(job)
+        }), 200
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "message": f"Error fetching job status: {str(e)}"
+        }), 500
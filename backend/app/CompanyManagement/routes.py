@@ -1,40 +1,79 @@
 from . import CompanyManagement_bp
-from flask import request, jsonify
+from flask import request, jsonify, current_app
 from app.models import companyVerification, companyAuth, CompanyProfile, db
-import pandas as pd
+from app.cache import invalidate_job_feed
+from app.upload_utils import save_upload, check_upload_columns, open_upload_chunks
+from app.jobs import submit_job
+from app.pagination import get_page_args, keyset_page, listing_page, search_filter
+from app.auth import require_auth
 from werkzeug.utils import secure_filename
 from werkzeug.security import generate_password_hash, check_password_hash
 import os
 import secrets
 
+REQUIRED_COLUMNS = ['passkey', 'mailId', 'name']
+# sort keys of the registered companies listing (each backed by an index, ending with the primary key)
+REGISTERED_SORTS = {
+    'id': [companyAuth.id],
+    'email': [companyAuth.email, companyAuth.id]
+}
+
 # Get all companies from verification table
 @CompanyManagement_bp.route("/admin/companies/verification", methods=['GET'])
+@require_auth("admin")
 def get_verification_companies():
     try:
-        companies = companyVerification.query.all()
-        companies_list = [{
-            'passkey': company.passkey,  # Plain passkey
-            'mailId': company.mailId,
-            'name': company.name,
-            'registered': False  # Default to not registered
-        } for company in companies]
+        cursor, limit = get_page_args(request.args)
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+    search = (request.args.get('search') or '').strip()
+    
+    try:
+        # One row per registered email, flagging whether any of its accounts has a profile
+        accounts = db.session.query(
+            companyAuth.email.label('email'),
+            db.func.max(db.case((CompanyProfile.id.isnot(None), 1), else_=0)).label('hasProfile')
+        ).outerjoin(
+            CompanyProfile, CompanyProfile.id == companyAuth.id
+        ).group_by(companyAuth.email).subquery()
+        
+        companies_query = db.session.query(
+            companyVerification.passkey,
+            companyVerification.mailId,
+            companyVerification.name,
+            accounts.c.email.label('registeredEmail'),
+            accounts.c.hasProfile
+        ).outerjoin(accounts, accounts.c.email == companyVerification.mailId)
+        
+        if search:
+            companies_query = companies_query.filter(db.or_(
+                companyVerification.name.icontains(search, autoescape=True),
+                companyVerification.mailId.icontains(search, autoescape=True)
+            ))
+        
+        companies, next_cursor = keyset_page(
+            companies_query, [companyVerification.passkey, companyVerification.mailId], cursor, limit
+        )
         
-        # Check which companies are registered
-        for company in companies_list:
-            registered = companyAuth.query.filter_by(email=company['mailId']).first()
-            if registered:
-                company['registered'] = True
-                # Get company profile if exists
-                profile = CompanyProfile.query.filter_by(id=registered.id).first()
-                if profile:
-                    company['profileComplete'] = True
-                else:
-                    company['profileComplete'] = False
+        companies_list = []
+        for company in companies:
+            company_data = {
+                'passkey': company.passkey,  # Plain passkey
+                'mailId': company.mailId,
+                'name': company.name,
+                'registered': company.registeredEmail is not None
+            }
+            if company_data['registered']:
+                company_data['profileComplete'] = bool(company.hasProfile)
+            companies_list.append(company_data)
         
         return jsonify({
             "success": True,
-            "companies": companies_list
+            "companies": companies_list,
+            "nextCursor": next_cursor
         }), 200
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
     except Exception as e:
         return jsonify({
             "success": False,
@@ -43,10 +82,17 @@ def get_verification_companies():
 
 # Get registered companies
 @CompanyManagement_bp.route("/admin/companies/registered", methods=['GET'])
+@require_auth("admin")
 def get_registered_companies():
+    """
+    Page through registered companies (limit, cursor, sort=id|email)
+
+    Filters: universityId, status (complete / incomplete profile), search (email or name)
+    """
+    data = request.args
     try:
         # Join companyAuth with CompanyProfile to get full company details
-        registered = db.session.query(
+        registered_query = db.session.query(
             companyAuth.id,
             companyAuth.email,
             companyAuth.universityid,
@@ -56,8 +102,24 @@ def get_registered_companies():
             CompanyProfile.about
         ).outerjoin(
             CompanyProfile, companyAuth.id == CompanyProfile.id
-        ).all()
+        )
+        
+        if data.get('universityId'):
+            registered_query = registered_query.filter(companyAuth.universityid == data.get('universityId', type=int))
+        if data.get('status') == 'complete':
+            registered_query = registered_query.filter(CompanyProfile.id.isnot(None))
+        elif data.get('status') == 'incomplete':
+            registered_query = registered_query.filter(CompanyProfile.id.is_(None))
+        if data.get('search'):
+            registered_query = registered_query.filter(
+                search_filter([companyAuth.email, CompanyProfile.name], data['search'].strip())
+            )
         
+        page = listing_page(registered_query, data, REGISTERED_SORTS, 'id')
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+    
+    try:
         companies_list = [{
             'id': company.id,
             'email': company.email,
@@ -67,11 +129,14 @@ def get_registered_companies():
             'location': company.location if company.location else '',
             'about': company.about if company.about else '',
             'profileComplete': bool(company.name)
-        } for company in registered]
+        } for company in page['rows']]
         
         return jsonify({
             "success": True,
-            "companies": companies_list
+            "companies": companies_list,
+            "nextCursor": page['nextCursor'],
+            "total": page['total'],
+            "totalEstimated": page['totalEstimated']
         }), 200
     except Exception as e:
         return jsonify({
@@ -81,6 +146,7 @@ def get_registered_companies():
 
 # Add company manually
 @CompanyManagement_bp.route("/admin/companies/add", methods=['POST'])
+@require_auth("admin")
 def add_company_manual():
     try:
         data = request.get_json()
@@ -130,6 +196,7 @@ def add_company_manual():
 
 # Upload companies via CSV/Excel
 @CompanyManagement_bp.route("/admin/companies/upload", methods=['POST'])
+@require_auth("admin")
 def upload_companies():
     try:
         if 'file' not in request.files:
@@ -145,92 +212,147 @@ def upload_companies():
                 "message": "No file selected"
             }), 400
         
-        # Read the file based on extension
+        # Keep the file past the request and validate its columns before queueing
         filename = secure_filename(file.filename)
-        if filename.endswith('.csv'):
-            df = pd.read_csv(file)
-        elif filename.endswith(('.xlsx', '.xls')):
-            df = pd.read_excel(file)
-        else:
+        path = save_upload(file, filename)
+        try:
+            check_upload_columns(path, filename, REQUIRED_COLUMNS)
+        except Exception as e:
+            os.remove(path)
+            message = str(e) if isinstance(e, ValueError) else f"Error reading file: {str(e)}"
             return jsonify({
                 "success": False,
-                "message": "Invalid file format. Only CSV and Excel files are allowed"
+                "message": message
             }), 400
         
-        # Validate required columns
-        required_columns = ['passkey', 'mailId', 'name']
-        if not all(col in df.columns for col in required_columns):
-            return jsonify({
-                "success": False,
-                "message": f"File must contain columns: {', '.join(required_columns)}"
-            }), 400
+        job_id = submit_job("company_upload", import_companies, path, filename)
         
+        return jsonify({
+            "success": True,
+            "message": "Company upload started",
+            "jobId": job_id
+        }), 202
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({
+            "success": False,
+            "message": f"Error uploading file: {str(e)}"
+        }), 500
+
+def import_companies(progress, path, filename):
+    """
+    Background job: ingest a saved company upload chunk by chunk
+
+    Each chunk is committed on its own, so a failure late in the file keeps earlier chunks;
+    the job then fails with the partial counts left in its result.
+    """
+    try:
         added = 0
         updated = 0
         errors = []
         added_companies = []  # Track newly added companies with plain passkeys
+        processed = 0
         
-        for index, row in df.iterrows():
+        chunks = open_upload_chunks(path, filename, REQUIRED_COLUMNS, current_app.config["UPLOAD_CHUNK_ROWS"])
+        for chunk in chunks:
+            chunk_added, chunk_updated, chunk_errors, chunk_companies = ingest_company_chunk(chunk)
             try:
-                passkey = str(row['passkey']).strip()
-                mailId = str(row['mailId']).strip()
-                name = str(row['name']).strip()
-                
-                if not passkey or not mailId or not name:
-                    errors.append(f"Row {index + 2}: Missing required fields")
-                    continue
-                
-                # Check if company exists by passkey
-                existing = companyVerification.query.filter_by(passkey=passkey).first()
-                
-                if existing:
-                    # Update existing company
-                    existing.mailId = mailId
-                    existing.name = name
-                    updated += 1
-                else:
-                    # Add new company with plain passkey
-                    new_company = companyVerification(
-                        passkey=passkey,
-                        mailId=mailId,
-                        name=name
-                    )
-                    db.session.add(new_company)
-                    added += 1
-                    # Add to response list
-                    added_companies.append({
-                        "passkey": passkey,
-                        "mailId": mailId,
-                        "name": name
-                    })
-                    
+                # Commit per chunk so earlier chunks survive a failure later in the file
+                db.session.commit()
             except Exception as e:
-                errors.append(f"Row {index + 2}: {str(e)}")
-        
-        db.session.commit()
+                db.session.rollback()
+                message = f"Upload stopped at rows {chunk[0][0]}-{chunk[-1][0]}: {str(e)}. "
+                message += f"Added {added} and updated {updated} companies before the failure"
+                raise RuntimeError(message)
+            added += chunk_added
+            updated += chunk_updated
+            errors.extend(chunk_errors)
+            added_companies.extend(chunk_companies)
+            processed += len(chunk)
+            progress.update(processed=processed, result={
+                "added": added,
+                "updated": updated,
+                "errors": errors,
+                "addedCompanies": added_companies
+            })
         
         message = f"Successfully added {added} and updated {updated} companies"
         if errors:
             message += f". {len(errors)} errors occurred"
         
-        return jsonify({
-            "success": True,
+        return {
             "message": message,
             "added": added,
             "updated": updated,
             "errors": errors,
             "addedCompanies": added_companies  # Return companies with plain passkeys
-        }), 200
-        
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({
-            "success": False,
-            "message": f"Error uploading file: {str(e)}"
-        }), 500
+        }
+    finally:
+        os.remove(path)
+
+def ingest_company_chunk(chunk):
+    """
+    Stage one chunk of uploaded rows in the session (the caller commits)
+
+    Returns:
+        tuple: (added, updated, errors, added_companies)
+    """
+    added = 0
+    updated = 0
+    errors = []
+    added_companies = []
+    
+    # One lookup for every passkey in the chunk instead of one per row
+    passkeys = [str(values['passkey']).strip() for _, values in chunk]
+    existing_companies = {
+        company.passkey: company
+        for company in companyVerification.query.filter(companyVerification.passkey.in_(passkeys))
+    }
+    
+    for row_number, values in chunk:
+        try:
+            passkey = str(values['passkey']).strip()
+            mailId = str(values['mailId']).strip()
+            name = str(values['name']).strip()
+            
+            if not passkey or not mailId or not name:
+                errors.append(f"Row {row_number}: Missing required fields")
+                continue
+            
+            # Check if company exists by passkey
+            existing = existing_companies.get(passkey)
+            
+            if existing:
+                # Update existing company
+                existing.mailId = mailId
+                existing.name = name
+                updated += 1
+            else:
+                # Add new company with plain passkey
+                new_company = companyVerification(
+                    passkey=passkey,
+                    mailId=mailId,
+                    name=name
+                )
+                db.session.add(new_company)
+                existing_companies[passkey] = new_company
+                added += 1
+                # Add to response list
+                added_companies.append({
+                    "passkey": passkey,
+                    "mailId": mailId,
+                    "name": name
+                })
+                
+        except Exception as e:
+            errors.append(f"Row {row_number}: {str(e)}")
+    
+    return added, updated, errors, added_companies
 
-# Delete company from verification table and all related records
+# Delete company from verification table and all related records (runs as a background job)
 @CompanyManagement_bp.route("/admin/companies/<passkey>", methods=['DELETE'])
+@require_auth("admin")
 def delete_company(passkey):
     try:
         # Find company in verification table by passkey
@@ -242,37 +364,13 @@ def delete_company(passkey):
                 "message": "Company not found in verification table"
             }), 404
         
-        # Find the registered company auth record by email
-        company_auth = companyAuth.query.filter_by(email=company_verification.mailId).first()
-        
-        if company_auth:
-            # Find company profile
-            company_profile = CompanyProfile.query.filter_by(id=company_auth.id).first()
-            
-            if company_profile:
-                # Import JobApplication and JobDetails models
-                from app.models import JobApplication, JobDetails
-                
-                # Delete all job applications for this company's jobs
-                JobApplication.query.filter_by(companyid=company_profile.id).delete()
-                
-                # Delete all job details posted by this company
-                JobDetails.query.filter_by(companyid=company_profile.id).delete()
-                
-                # Delete company profile
-                db.session.delete(company_profile)
-            
-            # Delete company auth record
-            db.session.delete(company_auth)
-        
-        # Delete from verification table
-        db.session.delete(company_verification)
-        db.session.commit()
+        job_id = submit_job("company_delete", remove_company, passkey)
         
         return jsonify({
             "success": True,
-            "message": "Company and all related records deleted successfully"
-        }), 200
+            "message": "Company deletion started",
+            "jobId": job_id
+        }), 202
     except Exception as e:
         db.session.rollback()
         return jsonify({
@@ -280,8 +378,54 @@ def delete_company(passkey):
             "message": f"Error deleting company: {str(e)}"
         }), 500
 
+def remove_company(progress, passkey):
+    """Background job: delete a company, its profile, jobs and applications"""
+    company_verification = companyVerification.query.filter_by(passkey=passkey).first()
+    
+    if not company_verification:
+        raise RuntimeError("Company not found in verification table")
+    
+    deleted = {"jobApplications": 0, "jobs": 0}
+    
+    # Find the registered company auth record by email
+    company_auth = companyAuth.query.filter_by(email=company_verification.mailId).first()
+    
+    if company_auth:
+        # Find company profile
+        company_profile = CompanyProfile.query.filter_by(id=company_auth.id).first()
+        
+        if company_profile:
+            # Import JobApplication and JobDetails models
+            from app.models import JobApplication, JobDetails
+            
+            # Delete all job applications for this company's jobs
+            deleted["jobApplications"] = JobApplication.query.filter_by(companyid=company_profile.id).delete()
+            
+            # Delete all job details posted by this company
+            deleted["jobs"] = JobDetails.query.filter_by(companyid=company_profile.id).delete()
+            
+            # Delete company profile
+            db.session.delete(company_profile)
+        
+        # Delete company auth record
+        db.session.delete(company_auth)
+    
+    # Delete from verification table
+    db.session.delete(company_verification)
+    db.session.commit()
+    
+    # Drop the cached job feed of the university whose jobs were removed
+    if company_auth:
+        invalidate_job_feed(company_auth.universityid)
+    
+    return {
+        "message": "Company and all related records deleted successfully",
+        "deleted": deleted
+    }
+
 # Generate passkey
 @CompanyManagement_bp.route("/admin/companies/generate-passkey", methods=['GET'])
+@require_auth("admin")
 def generate_passkey():
     try:
         # Generate a unique passkey
@@ -1,8 +1,11 @@
 from . import CompanyProfileSetup_bp
 from flask import request,jsonify
 from app.models import CompanyProfile,db,companyAuth
+from app.auth import require_auth
+from app.cache import invalidate_job_feed
 
 @CompanyProfileSetup_bp.route("/check/CompanyProfile",methods = ['POST','GET','OPTIONS'])
+@require_auth("company", subject_field="company_id")
 def CheckCompanyProfile():
     if request.method == 'OPTIONS':
         return jsonify({}), 200
@@ -34,6 +37,7 @@ def CheckCompanyProfile():
 
 
 @CompanyProfileSetup_bp.route("/setup/CompanyProfile",methods = ['POST','OPTIONS'])
+@require_auth("company", subject_field="company_id")
 def CompanyProfileSetup():
     if request.method == 'OPTIONS':
         return jsonify({}), 200
@@ -71,6 +75,7 @@ def CompanyProfileSetup():
     return jsonify({"success": True, "message": "Profile Created Successfully"}),200
 
 @CompanyProfileSetup_bp.route("/update/CompanyProfile",methods = ['POST','OPTIONS'])
+@require_auth("company", subject_field="company_id")
 def CompanyProfileUpdate():
     if request.method == 'OPTIONS':
         return jsonify({}), 200
@@ -96,11 +101,15 @@ def CompanyProfileUpdate():
     if not name or not website or not location or not about:
         return jsonify({"success": False, "message": "All details are required"}),400
     
+    # the company name is shown on every cached feed page with this company's jobs
+    name_changed = company_data.name != name
     company_data.name = name
     company_data.website = website
     company_data.location = location
     company_data.about = about
     db.session.commit()
+    if name_changed:
+        invalidate_job_feed(university_id)
     return jsonify({"success": True, "message": "Profile Updated Successfully"}),200
 
 
@@ -1,13 +1,15 @@
 from . import CompanySignin_bp
-from flask import request,jsonify,current_app
-from werkzeug.security import check_password_hash, generate_password_hash
+from flask import request,jsonify
+from app.password_hashing import hash_password, verify_password
 from app.models import companyAuth, passwordResetToken
-from datetime import datetime, timezone, timedelta
-import jwt
+from datetime import datetime, timezone
+from app.auth import issue_token
+from app.rate_limit import rate_limit
 from app.extensions import db
 
 #login route=========================================================
 @CompanySignin_bp.route("/auth/CompanyLogin",methods = ['POST'])
+@rate_limit("login")
 def StudentSignin():
     data = request.get_json()
     email = data.get("email")
@@ -26,20 +28,15 @@ def StudentSignin():
         return jsonify({"success": False, "message": "Email not registered in this university"}),400
     
     #check if password is correct
-    if not check_password_hash(user.password, password):
+    valid, upgraded_hash = verify_password(user.password, password)
+    if not valid:
         return jsonify({"success": False, "message": "Incorrect Password"}),401
+    #stored under older hashing parameters
+    if upgraded_hash:
+        user.password = upgraded_hash
+        db.session.commit()
     #setup jwt token
-    token = jwt.encode(
-        {
-            "email": email,
-            "universityId": user.universityid,
-            "exp": datetime.now(timezone.utc) + timedelta(
-                minutes=current_app.config["JWT_EXP_MINUTES"]
-            )
-        },
-        current_app.config["JWT_SECRET"],
-        algorithm="HS256"
-    )
+    token = issue_token("company", user.id, email, user.universityid)
     #token
     return jsonify({
         "success": True,
@@ -51,6 +48,7 @@ def StudentSignin():
 
 #forgot password - request reset token=========================================
 @CompanySignin_bp.route("/auth/CompanyRequestPasswordReset", methods=['POST'])
+@rate_limit("otp")
 def request_password_reset():
     data = request.get_json()
     email = data.get("email")
@@ -91,6 +89,7 @@ def request_password_reset():
 
 #verify reset token=========================================
 @CompanySignin_bp.route("/auth/CompanyVerifyResetToken", methods=['POST'])
+@rate_limit("otp")
 def verify_reset_token():
     data = request.get_json()
     token = data.get("token")
@@ -126,6 +125,7 @@ def verify_reset_token():
 
 #reset password=========================================
 @CompanySignin_bp.route("/auth/CompanyResetPassword", methods=['POST'])
+@rate_limit("otp")
 def reset_password():
     data = request.get_json()
     token = data.get("token")
@@ -167,7 +167,7 @@ def reset_password():
         return jsonify({"success": False, "message": "User not found"}), 404
     
     # Update password
-    user.password = generate_password_hash(new_password)
+    user.password = hash_password(new_password)
     
     # Mark token as used
     reset_token.used = True
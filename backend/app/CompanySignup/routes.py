@@ -1,12 +1,15 @@
 from . import CompanySignup_bp
 from flask import request,jsonify,current_app
-from app.models import companyAuth,otpVerification,companyVerification,db
+from app.models import companyAuth,companyVerification,db
 import random
-from datetime import datetime, timezone, timedelta
-import jwt
-from werkzeug.security import generate_password_hash,check_password_hash
+import time
+from app.auth import issue_token
+from app.rate_limit import rate_limit
+from app.password_hashing import hash_password, HashingBusy
+from app.otp_store import issue_otp, find_otp, check_otp, discard_otp, OTP_ERRORS
 #HANDLE COMPNAY SIGNUP ==========================================================================
 @CompanySignup_bp.route("/auth/CompanySignup",methods = ['POST'])
+@rate_limit("signup")
 def StudentSignUp():
     data = request.get_json()
     #extract data
@@ -30,15 +33,8 @@ def StudentSignUp():
         return jsonify({"success": False, "message": "Email already registered in this university"}),400        
     #mail sending-------------------------------------------------
     otp = str(random.randint(100000, 999999)) #create otp
-    # Remove previous OTPs for this email in this university
-    otpVerification.query.filter_by(email=email, universityid=universityId).delete()
-    db.session.commit()
-    
-    #add otp in the model (don't create student account yet)
-    otp_data = otpVerification(email=email, otp=otp)
-    otp_data.universityid = universityId
-    db.session.add(otp_data)
-    db.session.commit()
+    #store the otp, replacing any earlier one for this email in this university (don't create the account yet)
+    issue_otp(email, universityId, otp)
     
     # Return OTP to frontend - frontend will send email via EmailJS
     return jsonify({
@@ -50,6 +46,7 @@ def StudentSignUp():
 
 #HANDLE OTP VERIFICATION ===========================================================================    
 @CompanySignup_bp.route("/auth/CompanyVerifyOTP",methods = ['POST'])
+@rate_limit("otp")
 def VerifyOTP():
     try:
         data = request.get_json()
@@ -57,56 +54,32 @@ def VerifyOTP():
         email = data.get("email")
         otp = data.get("otp")
         password = data.get("password")
+        university_id = data.get("universityId")
         
-        if not all([email, otp, password]):
-            return jsonify({"error": "Email, OTP and password are required"}), 400
-        
-        #get the OTP record===============================================
-        record = otpVerification.query.filter_by(email=email).first()
-        #check if record exists========================================
-        if not record:
-            return jsonify({"error": "OTP not found or expired"}), 404
-        #check expiry of otp========================================
-        # Make expires_at timezone-aware if it's naive
-        expires_at = record.expires_at
-        if expires_at.tzinfo is None:
-            expires_at = expires_at.replace(tzinfo=timezone.utc)
-        
-        if datetime.now(timezone.utc) > expires_at:
-            otpVerification.query.filter_by(email=email).delete()
-            db.session.commit()
-            return jsonify({"error": "OTP expired"}), 400
-        #check if otp is valid====================================
-        if record.otp != otp:
-            return jsonify({"error": "Invalid OTP"}), 400    
+        if not all([email, otp, password, university_id]):
+            return jsonify({"error": "Email, OTP, password and university ID are required"}), 400
         
-        # Get university ID from OTP record
-        university_id = record.universityid
+        #check the otp (wrong guesses are counted and lock the otp after OTP_MAX_ATTEMPTS)========
+        status = check_otp(email, university_id, otp)
+        if status != "valid":
+            message, code = OTP_ERRORS[status]
+            return jsonify({"error": message}), code
         
         # OTP is valid → now create the student account============================
         companyAuth_data = companyAuth(
             email=email, 
-            password=generate_password_hash(password),
+            password=hash_password(password),
             universityid=university_id
         )
         db.session.add(companyAuth_data)
         
-        # Delete OTP after successful verification============================
-        otpVerification.query.filter_by(email=email).delete()
         db.session.commit()
         
+        # Delete OTP after successful verification============================
+        discard_otp(email, university_id)
+        
         #setup jwt token
-        token = jwt.encode(
-            {
-                "email": email,
-                "universityId": university_id,
-                "exp": datetime.now(timezone.utc) + timedelta(
-                    minutes=current_app.config["JWT_EXP_MINUTES"]
-                )
-            },
-            current_app.config["JWT_SECRET"],
-            algorithm="HS256"
-        )
+        token = issue_token("company", companyAuth_data.id, email, university_id)
 
         return jsonify({
             "message": "OTP verified successfully", 
@@ -115,6 +88,9 @@ def VerifyOTP():
             "university_id": university_id
         }), 200
         
+    except HashingBusy:
+        # answered with 503 + Retry-After by the app's error handler
+        raise
     except Exception as e:
         db.session.rollback()
         print(f"Error in VerifyOTP: {str(e)}")
@@ -122,6 +98,7 @@ def VerifyOTP():
 
 #HANDLE RESEND OTP ===========================================================================    
 @CompanySignup_bp.route("/auth/CompanyResendOTP",methods = ['POST'])
+@rate_limit("otp")
 def ResendOTP():
     try:
         data = request.get_json()
@@ -132,35 +109,26 @@ def ResendOTP():
             return jsonify({"error": "Email and university ID are required"}), 400
         
         # Get the existing OTP record
-        record = otpVerification.query.filter_by(email=email, universityid=university_id).first()
+        record = find_otp(email, university_id)
         
         if not record:
             return jsonify({"error": "No OTP request found. Please signup again."}), 404
         
-        # Check if 10 minutes have passed since the OTP was created
-        created_at = record.created_at
-        if created_at.tzinfo is None:
-            created_at = created_at.replace(tzinfo=timezone.utc)
+        # Check if OTP_RESEND_SECONDS have passed since the OTP was created
+        time_elapsed = time.time() - record["createdAt"]
+        resend_after = current_app.config["OTP_RESEND_SECONDS"]
         
-        time_elapsed = datetime.now(timezone.utc) - created_at
-        
-        if time_elapsed < timedelta(minutes=10):
+        if time_elapsed < resend_after:
             # Calculate remaining time
-            remaining_seconds = int((timedelta(minutes=10) - time_elapsed).total_seconds())
+            remaining_seconds = int(resend_after - time_elapsed)
             return jsonify({
                 "error": "Please wait before requesting a new OTP",
                 "remainingSeconds": remaining_seconds
             }), 429
         
-        # Generate new OTP
+        # Generate new OTP (replaces the old one and resets its attempts)
         new_otp = str(random.randint(100000, 999999))
-        
-        # Update the existing record
-        record.otp = new_otp
-        current_time = datetime.now(timezone.utc)
-        record.created_at = current_time
-        record.expires_at = current_time + timedelta(minutes=10)
-        db.session.commit()
+        issue_otp(email, university_id, new_otp)
         
         # Return OTP to frontend - frontend will send email via EmailJS
         return jsonify({
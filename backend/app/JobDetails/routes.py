@@ -1,7 +1,12 @@
-from flask import request,jsonify
+from flask import request,jsonify,Response,g
 from app.models import db,JobDetails,CompanyProfile,JobApplication,StudentProfile
 from . import JobDetails_bp
+from app.pagination import get_page_args, keyset_page
+from app.cache import job_feed_key, get_cached_job_feed, cache_job_feed, invalidate_job_feed
+from app.auth import require_auth
+from app.job_search import search_jobs
 from datetime import datetime, timezone
+import hashlib
 
 # Helper function to ensure datetime is timezone-aware
 def ensure_timezone_aware(dt):
@@ -12,6 +17,7 @@ def ensure_timezone_aware(dt):
 
 #=================== set job details from the company side ===========================================
 @JobDetails_bp.route("/set/JobDetails",methods =['POST'])
+@require_auth("company", subject_field="companyid")
 def setJobDetails():
     data = request.get_json()
     companyid = data.get("companyid")
@@ -47,6 +53,7 @@ def setJobDetails():
                 )
                 db.session.add(JobData)
                 db.session.commit() 
+                invalidate_job_feed(universityId)
                 return jsonify({"success": True, "message": "Added Job"}), 200
             else:
                 return jsonify({"success": False, "message": "enddate cannot be a previous date or current date"}), 400 
@@ -57,44 +64,125 @@ def setJobDetails():
 
 #=============================== show job details on the student side =========================================    
 @JobDetails_bp.route("/get/JobDetails",methods = ['POST','GET'])
+@require_auth("student", "company")
 def getJobDetails():
-    data = request.get_json() if request.method == 'POST' else {}
+    data = request.get_json() if request.method == 'POST' else request.args
     university_id = data.get("universityId")
     
     if not university_id:
         return jsonify({"success": False, "message": "University ID is required"}), 400
     
-    # Filter jobs by university ID
-    jobs = JobDetails.query.filter_by(universityid=university_id).all()
-    job_list = []
-    current_date = datetime.now(timezone.utc)
+    try:
+        cursor, limit = get_page_args(data)
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+    
+    feed_key = job_feed_key(university_id, data.get("cursor"), limit)
+    cached = get_cached_job_feed(feed_key)
+    if cached is not None:
+        return jsonify(cached), 200
+    
+    # Active jobs of this university with their company name, filtered and joined in one query
+    # (enddate is stored as naive UTC, so compare against naive UTC now)
+    current_date = datetime.now(timezone.utc).replace(tzinfo=None)
+    jobs_query = JobDetails.query.join(
+        CompanyProfile,
+        (JobDetails.companyid == CompanyProfile.id) & (CompanyProfile.universityid == university_id)
+    ).filter(
+        JobDetails.universityid == university_id,
+        JobDetails.enddate > current_date
+    ).with_entities(
+        JobDetails.id,
+        JobDetails.title,
+        JobDetails.type,
+        JobDetails.salary,
+        JobDetails.description,
+        JobDetails.requirements,
+        JobDetails.enddate,
+        JobDetails.companyid,
+        CompanyProfile.name.label('companyname')
+    )
     
-    for jobs_details in jobs:
-        companyquery = CompanyProfile.query.filter_by(id=jobs_details.companyid, universityid=university_id).first()
-        if companyquery:
-            companyname = companyquery.name
-            job_enddate = ensure_timezone_aware(jobs_details.enddate)
-            if job_enddate > current_date:
-                job_data = {
-                    "id": jobs_details.id,
-                    "title": jobs_details.title,
-                    "type": jobs_details.type,
-                    "salary": jobs_details.salary,
-                    "description": jobs_details.description,
-                    "requirements": jobs_details.requirements,
-                    "enddate": jobs_details.enddate.isoformat(),
-                    "companyname": companyname,
-                    "companyid":jobs_details.companyid
-                }
-                job_list.append(job_data)
+    try:
+        jobs, next_cursor = keyset_page(jobs_query, [JobDetails.id], cursor, limit)
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+    
+    job_list = [{
+        "id": job.id,
+        "title": job.title,
+        "type": job.type,
+        "salary": job.salary,
+        "description": job.description,
+        "requirements": job.requirements,
+        "enddate": job.enddate.isoformat(),
+        "companyname": job.companyname,
+        "companyid": job.companyid
+    } for job in jobs]
     
     if job_list:
-        return jsonify({"success": True, "message": "Retrieved Data", "data": job_list}), 200
+        payload = {"success": True, "message": "Retrieved Data", "data": job_list, "nextCursor": next_cursor}
     else:
-        return jsonify({"success": True, "message": "No New Job Openings. Keep Checking!!", "data": []}), 200
+        payload = {"success": True, "message": "No New Job Openings. Keep Checking!!", "data": [], "nextCursor": None}
+    
+    # the page stays valid until its first job expires or the feed is invalidated
+    nearest_enddate = min((job.enddate for job in jobs), default=None)
+    cache_job_feed(feed_key, payload, nearest_enddate)
+    return jsonify(payload), 200
+    
+#=============================== search job details on the student side =========================================
+@JobDetails_bp.route("/search/jobs", methods=['POST', 'GET'])
+@require_auth("student", "company")
+def searchJobs():
+    data = request.get_json() if request.method == 'POST' else request.args
+    university_id = data.get("universityId")
+    
+    if not university_id:
+        return jsonify({"success": False, "message": "University ID is required"}), 400
     
+    try:
+        cursor, limit = get_page_args(data)
+        matches, next_cursor = search_jobs(university_id, data.get("q"), cursor, limit)
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+    
+    # details of the page's jobs in one query, returned in rank order
+    ranks = dict(matches)
+    jobs = JobDetails.query.join(
+        CompanyProfile, JobDetails.companyid == CompanyProfile.id
+    ).filter(
+        JobDetails.id.in_(list(ranks))
+    ).with_entities(
+        JobDetails.id,
+        JobDetails.title,
+        JobDetails.type,
+        JobDetails.salary,
+        JobDetails.description,
+        JobDetails.requirements,
+        JobDetails.enddate,
+        JobDetails.companyid,
+        CompanyProfile.name.label('companyname')
+    ).all() if ranks else []
+    
+    job_list = sorted(({
+        "id": job.id,
+        "title": job.title,
+        "type": job.type,
+        "salary": job.salary,
+        "description": job.description,
+        "requirements": job.requirements,
+        "enddate": job.enddate.isoformat(),
+        "companyname": job.companyname,
+        "companyid": job.companyid,
+        "rank": ranks[job.id]
+    } for job in jobs), key=lambda job: (-job["rank"], -job["id"]))
+    
+    message = "Retrieved Data" if job_list else "No jobs match your search"
+    return jsonify({"success": True, "message": message, "data": job_list, "nextCursor": next_cursor}), 200
+
 #===================================== show previuos job of the company =============================
 @JobDetails_bp.route("/get/CompanyJobs", methods=['POST'])
+@require_auth("company", subject_field="company_id")
 def getCompanyJobs():
     data = request.get_json()
     company_id = data.get("company_id")
@@ -129,6 +217,7 @@ def getCompanyJobs():
 
 #==================================== handle applicants ============================================
 @JobDetails_bp.route("/get/applicants",methods = ['POST'])
+@require_auth("student", subject_field="studentid")
 def showApplicants():
     data = request.get_json()
     studentid = data.get("studentid")
@@ -165,6 +254,7 @@ def showApplicants():
 
 #========================= get student's applied jobs =========================================
 @JobDetails_bp.route("/get/student/appliedJobs", methods=['POST'])
+@require_auth("student", subject_field="studentid")
 def getStudentAppliedJobs():
     data = request.get_json()
     studentid = data.get("studentid")
@@ -180,51 +270,76 @@ def getStudentAppliedJobs():
 
 #========================= retrieve job application (company side) ===================================
 @JobDetails_bp.route("/set/jobApplicantData/companyportal",methods =['POST','GET'])
+@require_auth("company", subject_field="companyid")
 def setJobApplicantStatus():
-    data = request.get_json()
+    data = request.get_json() if request.method == 'POST' else request.args
     companyid = data.get("companyid")
+    jobid = data.get("jobid")
+    status = data.get("status")
     
     if not companyid:
         return jsonify({"success": False, "message": "Company ID is required"}), 400
     
-    # Get all applications for this company
-    applicant_applications = JobApplication.query.filter_by(companyid=companyid).all()
-    
-    if not applicant_applications:
-        return jsonify({"success": True, "message": "No applicants found", "data": []}), 200
-    
-    applicants_list = []
+    try:
+        cursor, limit = get_page_args(data)
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+    
+    # Applications for this company with the applicant's profile and the job title in one query
+    applicants_query = JobApplication.query.join(
+        StudentProfile, StudentProfile.id == JobApplication.studentid
+    ).outerjoin(
+        JobDetails, JobDetails.id == JobApplication.jobid
+    ).filter(
+        JobApplication.companyid == companyid
+    )
+    if jobid:
+        applicants_query = applicants_query.filter(JobApplication.jobid == jobid)
+    if status:
+        applicants_query = applicants_query.filter(JobApplication.status == status)
+    
+    applicants_query = applicants_query.with_entities(
+        JobApplication.id,
+        JobApplication.studentid,
+        JobApplication.jobid,
+        JobApplication.status,
+        StudentProfile.fullName,
+        StudentProfile.about,
+        StudentProfile.skills,
+        StudentProfile.github,
+        StudentProfile.linkedin,
+        StudentProfile.resume,
+        JobDetails.title.label('jobtitle')
+    )
     
-    for application in applicant_applications:
-        studentid = application.studentid
-        
-        # Get student profile
-        student_profile = StudentProfile.query.filter_by(id=studentid).first()
-        
-        if student_profile:
-            # Get job details
-            job = JobDetails.query.filter_by(id=application.jobid).first()
-            
-            student_data = {
-                "studentid": studentid,
-                "name": student_profile.fullName,
-                "about": student_profile.about,
-                "skills": student_profile.skills,
-                "github": student_profile.github,
-                "linkedin": student_profile.linkedin,
-                "resumename": "resume",
-                "resumepath": student_profile.resume,
-                "status": application.status,
-                "jobid": application.jobid,
-                "jobtitle": job.title if job else "N/A",
-                "applicationid": application.id
-            }
-            applicants_list.append(student_data)
-    
-    return jsonify({"success": True, "message": "Data Retrieved Successfully", "data": applicants_list}), 200
+    try:
+        applications, next_cursor = keyset_page(applicants_query, [JobApplication.id], cursor, limit)
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+    
+    if not applications and cursor is None:
+        return jsonify({"success": True, "message": "No applicants found", "data": [], "nextCursor": None}), 200
+    
+    applicants_list = [{
+        "studentid": application.studentid,
+        "name": application.fullName,
+        "about": application.about,
+        "skills": application.skills,
+        "github": application.github,
+        "linkedin": application.linkedin,
+        "resumename": "resume",
+        "resumepath": application.resume,
+        "status": application.status,
+        "jobid": application.jobid,
+        "jobtitle": application.jobtitle if application.jobtitle else "N/A",
+        "applicationid": application.id
+    } for application in applications]
+    
+    return jsonify({"success": True, "message": "Data Retrieved Successfully", "data": applicants_list, "nextCursor": next_cursor}), 200
 
 #========================= update application status ===================================
 @JobDetails_bp.route("/update/applicationStatus", methods=['POST'])
+@require_auth("company")
 def updateApplicationStatus():
     data = request.get_json()
     application_id = data.get("application_id")
@@ -246,6 +361,9 @@ def updateApplicationStatus():
     
     if not application:
         return jsonify({"success": False, "message": "Application not found"}), 404
+
+    if application.companyid != g.user_id:
+        return jsonify({"success": False, "message": "Not allowed to update another company's application"}), 403
     
     application.status = new_status
     db.session.commit()
@@ -253,62 +371,77 @@ def updateApplicationStatus():
     return jsonify({"success": True, "message": f"Application status updated to {new_status}"}), 200
 
 #========================= get student's applied jobs with details ===================================
-@JobDetails_bp.route("/get/student/appliedJobsDetails", methods=['POST'])
+@JobDetails_bp.route("/get/student/appliedJobsDetails", methods=['POST', 'GET'])
+@require_auth("student", subject_field="studentid")
 def getStudentAppliedJobsDetails():
-    data = request.get_json()
+    data = request.get_json() if request.method == 'POST' else request.args
     studentid = data.get("studentid")
     
     if not studentid:
         return jsonify({"success": False, "message": "Student ID is required"}), 400
     
-    # Get all applications for this student
-    applications = JobApplication.query.filter_by(studentid=studentid).all()
-    
-    if not applications:
-        return jsonify({"success": True, "message": "No applications found", "data": []}), 200
-    
-    applications_list = []
-    
-    for application in applications:
-        # Get job details
-        job = JobDetails.query.filter_by(id=application.jobid).first()
-        
-        if job:
-            # Get company details
-            company = CompanyProfile.query.filter_by(id=job.companyid).first()
-            
-            application_data = {
-                "applicationid": application.id,
-                "jobid": job.id,
-                "jobtitle": job.title,
-                "jobtype": job.type,
-                "salary": job.salary,
-                "description": job.description,
-                "requirements": job.requirements,
-                "enddate": job.enddate.isoformat(),
-                "companyname": company.name if company else "Unknown Company",
-                "companyid": job.companyid,
-                "status": application.status
-            }
-            applications_list.append(application_data)
-    
-    return jsonify({"success": True, "message": "Applications retrieved successfully", "data": applications_list}), 200
-
-
-        
-
-
-
-
-
-
-
-
-
-    
-
-        
-    
-
-
-    
+    # Cheap version check over the same rows the page shows: the ETag changes whenever an
+    # application is added, removed or updated, or one of its jobs or companies is edited
+    version = JobApplication.query.join(
+        JobDetails, JobDetails.id == JobApplication.jobid
+    ).outerjoin(
+        CompanyProfile, CompanyProfile.id == JobDetails.companyid
+    ).filter(
+        JobApplication.studentid == studentid
+    ).with_entities(
+        db.func.count(JobApplication.id),
+        db.func.max(JobApplication.id),
+        db.func.max(JobApplication.updated_at),
+        db.func.max(JobDetails.updated_at),
+        db.func.max(CompanyProfile.updated_at)
+    ).first()
+    etag = hashlib.sha1(":".join(str(part) for part in (studentid, *version)).encode()).hexdigest()
+    
+    if etag in request.if_none_match:
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+    
+    # Applications with their job and company in one query
+    applications = JobApplication.query.join(
+        JobDetails, JobDetails.id == JobApplication.jobid
+    ).outerjoin(
+        CompanyProfile, CompanyProfile.id == JobDetails.companyid
+    ).filter(
+        JobApplication.studentid == studentid
+    ).with_entities(
+        JobApplication.id,
+        JobApplication.status,
+        JobDetails.id.label('jobid'),
+        JobDetails.title,
+        JobDetails.type,
+        JobDetails.salary,
+        JobDetails.description,
+        JobDetails.requirements,
+        JobDetails.enddate,
+        JobDetails.companyid,
+        CompanyProfile.name.label('companyname')
+    ).order_by(JobApplication.id).all()
+    
+    applications_list = [{
+        "applicationid": application.id,
+        "jobid": application.jobid,
+        "jobtitle": application.title,
+        "jobtype": application.type,
+        "salary": application.salary,
+        "description": application.description,
+        "requirements": application.requirements,
+        "enddate": application.enddate.isoformat(),
+        "companyname": application.companyname if application.companyname else "Unknown Company",
+        "companyid": application.companyid,
+        "status": application.status
+    } for application in applications]
+    
+    if applications_list:
+        response = jsonify({"success": True, "message": "Applications retrieved successfully", "data": applications_list})
+    else:
+        response = jsonify({"success": True, "message": "No applications found", "data": []})
+    response.set_etag(etag)
+    # let the browser keep the body but revalidate it on every visit
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response, 200
@@ -0,0 +1,9 @@
+from flask import Blueprint
+
+Monitoring_bp = Blueprint(
+    "Monitoring",
+    __name__,
+    url_prefix=""
+)
+
+from . import routes
@@ -0,0 +1,21 @@
+from . import Monitoring_bp
+from flask import jsonify, current_app
+from app.extensions import db
+from app.engine_profiles import pool_metrics
+from app.auth import require_auth
+
+# Connection pool checkout wait times for this worker process
+@Monitoring_bp.route("/api/admin/db/pool", methods=['GET'])
+@require_auth("admin")
+def get_pool_metrics():
+    try:
+        return jsonify({
+            "success": True,
+            "profile": current_app.config["DB_ENGINE_PROFILE"],
+            "metrics": pool_metrics(db.engine)
+        }), 200
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "message": f"Error fetching pool metrics: {str(e)}"
+        }), 500
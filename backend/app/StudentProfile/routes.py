@@ -1,16 +1,112 @@
 from . import StudentProfile_bp
-from flask import request, jsonify
-from app.models import StudentProfile, db, studentAuth
+from flask import request, jsonify, current_app
+from app.models import StudentProfile, db, studentAuth, backgroundJob
 from werkzeug.utils import secure_filename
-from app.storage_utils import upload_file_to_supabase, delete_file_from_supabase
+from app.storage_utils import (
+    stage_upload, storage_file_path, upload_path_to_supabase, delete_file_from_supabase, UploadRejected
+)
+from app.jobs import submit_job, ACTIVE_STATUSES
+from app.auth import require_auth
+import glob
 import os
+import tempfile
+import uuid
 
 ALLOWED_EXTENSIONS = {'pdf', 'doc', 'docx'}
+RESUME_CONTENT_TYPES = {
+    'application/pdf',
+    'application/msword',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+}
 
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+def stage_resume(file):
+    """
+    Check a resume against the size and content-type limits and save it for the background upload
+
+    Returns:
+        tuple: (upload token, path, filename, content type). The token goes on the profile
+        (resume_upload) so only the latest upload is applied, and is also the id of the
+        background job and part of the staged file's name.
+    """
+    upload_token = uuid.uuid4().hex
+    path, content_type = stage_upload(
+        file,
+        allowed_types=RESUME_CONTENT_TYPES,
+        max_bytes=current_app.config["RESUME_MAX_BYTES"],
+        prefix=staged_resume_prefix(upload_token)
+    )
+    return upload_token, path, file.filename, content_type
+
+def staged_resume_prefix(upload_token):
+    return f"resume_{upload_token}_"
+
+def fail_abandoned_resumes():
+    """
+    Mark pending resumes whose upload job is no longer queued or running failed
+
+    Their job was abandoned (see app.jobs.fail_abandoned_jobs) or failed before the profile
+    was updated. Staged files left behind on this machine are deleted.
+
+    Returns:
+        int: Profiles marked failed
+    """
+    active_jobs = db.session.query(backgroundJob.id).filter(backgroundJob.status.in_(ACTIVE_STATUSES))
+    profiles = StudentProfile.query.filter(
+        StudentProfile.resume_status == 'pending',
+        StudentProfile.resume_upload.notin_(active_jobs)
+    ).all()
+    for profile in profiles:
+        profile.resume_status = 'failed'
+    db.session.commit()
+    
+    for profile in profiles:
+        pattern = os.path.join(tempfile.gettempdir(), staged_resume_prefix(profile.resume_upload) + "*")
+        for path in glob.glob(pattern):
+            os.remove(path)
+    return len(profiles)
+
+def process_resume(progress, student_id, university_id, upload_token, path, filename, content_type):
+    """Background job: upload a staged resume and point the profile at it, unless a newer upload replaced it"""
+    try:
+        # every upload gets its own object, so a superseded job never overwrites or deletes a newer file
+        file_path = storage_file_path('resumes', filename, f"{student_id}_{upload_token[:8]}")
+        success, result = upload_path_to_supabase(path, file_path, content_type)
+        
+        # row lock: a newer upload cannot be staged between this check and the commit below
+        profile = StudentProfile.query.filter_by(
+            id=student_id, universityid=university_id, resume_upload=upload_token
+        ).with_for_update().first()
+        if not profile:
+            # superseded by a newer upload (or the profile is gone)
+            if success:
+                delete_file_from_supabase(result)
+            return {"resume": None, "superseded": True}
+        
+        if not success:
+            profile.resume_status = 'failed'
+            db.session.commit()
+            raise RuntimeError(f"Resume upload failed: {result}")
+        
+        old_resume = profile.resume
+        profile.resume = result  # This is the full path in Supabase
+        profile.resume_status = 'ready'
+        db.session.commit()
+        
+        # Delete old resume from Supabase if it was stored under another name
+        if old_resume and old_resume != result:
+            delete_file_from_supabase(old_resume)
+        
+        return {"resume": result}
+    finally:
+        # already gone when the sweeper gave up on this upload
+        if os.path.exists(path):
+            os.remove(path)
+
 @StudentProfile_bp.route("/check/StudentProfile", methods=['POST', 'GET', 'OPTIONS'])
+@require_auth("student", subject_field="student_id")
 def CheckStudentProfile():
     if request.method == 'OPTIONS':
         return jsonify({}), 200
@@ -36,7 +132,8 @@ def CheckStudentProfile():
                 "skills": profile.skills,
                 "github": profile.github,
                 "linkedin": profile.linkedin,
-                "resume": profile.resume
+                "resume": profile.resume,
+                "resumeStatus": profile.resume_status
             }
         }), 200
     else:
@@ -44,6 +141,7 @@ def CheckStudentProfile():
 
 
 @StudentProfile_bp.route("/setup/StudentProfile", methods=['POST', 'OPTIONS'])
+@require_auth("student", subject_field="student_id")
 def StudentProfileSetup():
     if request.method == 'OPTIONS':
         return jsonify({}), 200
@@ -69,17 +167,15 @@ def StudentProfileSetup():
     if not fullName:
         return jsonify({"success": False, "message": "Full name is required"}), 400
     
-    # Handle resume upload
-    resume_filename = None
+    # Handle resume upload (checked now, sent to Supabase in the background)
+    staged_resume = None
     if 'resume' in request.files:
         file = request.files['resume']
         if file and file.filename and allowed_file(file.filename):
-            # Upload to Supabase
-            success, result = upload_file_to_supabase(file, 'resumes', student_id)
-            if success:
-                resume_filename = result  # This is the full path in Supabase
-            else:
-                return jsonify({"success": False, "message": f"Resume upload failed: {result}"}), 500
+            try:
+                staged_resume = stage_resume(file)
+            except UploadRejected as e:
+                return jsonify({"success": False, "message": str(e)}), e.status_code
     
     StudentProfileData = StudentProfile(
         id=student_id,
@@ -88,15 +184,21 @@ def StudentProfileSetup():
         skills=skills,
         github=github,
         linkedin=linkedin,
-        resume=resume_filename,
+        resume=None,
+        resume_status='pending' if staged_resume else None,
+        resume_upload=staged_resume[0] if staged_resume else None,
         universityid=university_id
     )
     db.session.add(StudentProfileData)
+    if staged_resume:
+        # commits the pending profile together with its job, so the sweeper never sees one without the other
+        submit_job("resume_upload", process_resume, student_id, university_id, *staged_resume, job_id=staged_resume[0])
     db.session.commit()
     return jsonify({"success": True, "message": "Profile Created Successfully"}), 200
 
 
 @StudentProfile_bp.route("/update/StudentProfile", methods=['POST', 'OPTIONS'])
+@require_auth("student", subject_field="student_id")
 def StudentProfileUpdate():
     if request.method == 'OPTIONS':
         return jsonify({}), 200
@@ -130,20 +232,20 @@ def StudentProfileUpdate():
     student_data.github = github
     student_data.linkedin = linkedin
     
-    # Handle resume upload if new file provided
+    # Handle resume upload if new file provided (checked now, sent to Supabase in the background)
+    staged_resume = None
     if 'resume' in request.files:
         file = request.files['resume']
         if file and file.filename and allowed_file(file.filename):
-            # Delete old resume from Supabase if exists
-            if student_data.resume:
-                delete_file_from_supabase(student_data.resume)
-            
-            # Upload new resume to Supabase
-            success, result = upload_file_to_supabase(file, 'resumes', student_id)
-            if success:
-                student_data.resume = result  # This is the full path in Supabase
-            else:
-                return jsonify({"success": False, "message": f"Resume upload failed: {result}"}), 500
+            try:
+                staged_resume = stage_resume(file)
+            except UploadRejected as e:
+                return jsonify({"success": False, "message": str(e)}), e.status_code
+            student_data.resume_status = 'pending'
+            student_data.resume_upload = staged_resume[0]
     
+    if staged_resume:
+        # commits the pending profile together with its job, so the sweeper never sees one without the other
+        submit_job("resume_upload", process_resume, student_id, university_id, *staged_resume, job_id=staged_resume[0])
     db.session.commit()
     return jsonify({"success": True, "message": "Profile Updated Successfully"}), 200
@@ -1,8 +1,9 @@
-from flask import Flask,blueprints, send_from_directory
+from flask import Flask,blueprints, send_from_directory, jsonify
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
 from .extensions import db,mail
 from .config import Config
+from .engine_profiles import default_profile, engine_options
 import os
 
 
@@ -45,9 +46,11 @@ def create_app():
     #postgrss config
     app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv("DATABASE_URL")
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
-    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
-        "connect_args": {"sslmode": "require"}
-    }
+    # pool settings come from the deployment's engine profile
+    database_url = app.config["SQLALCHEMY_DATABASE_URI"]
+    profile = app.config["DB_ENGINE_PROFILE"] or default_profile(database_url, os.environ)
+    app.config["DB_ENGINE_PROFILE"] = profile
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(profile, database_url, app.config)
     app.config["SECRET_KEY"] = os.getenv("SECRET_KEY")
 
     #initializing the extensions file 
@@ -85,24 +88,64 @@ def create_app():
     from app.CompanyManagement import CompanyManagement_bp
     app.register_blueprint(CompanyManagement_bp)
 
+    from app.BackgroundJobs import BackgroundJobs_bp
+    app.register_blueprint(BackgroundJobs_bp)
+
+    from app.Monitoring import Monitoring_bp
+    app.register_blueprint(Monitoring_bp)
+
     # Route to serve uploaded resume files from Supabase
     @app.route('/uploads/resumes/<path:filename>')
     def serve_resume(filename):
         from app.storage_utils import get_file_url_from_supabase
         from flask import redirect
         
-        # Get the public URL from Supabase
+        # Get the public URL from Supabase (built locally, no storage call)
         file_url = get_file_url_from_supabase(f"resumes/{filename}")
         if file_url:
-            return redirect(file_url)
+            response = redirect(file_url)
+            # the path -> URL mapping never changes, so browsers can skip the redirect next time
+            response.headers["Cache-Control"] = f"public, max-age={app.config['RESUME_REDIRECT_MAX_AGE']}"
+            return response
         else:
             return jsonify({"error": "File not found"}), 404
 
-    # Import models before creating tables
+    # login peaks: hashing slots all taken, ask the client to retry instead of queueing
+    from app.password_hashing import HashingBusy
+
+    @app.errorhandler(HashingBusy)
+    def hashing_busy(error):
+        return jsonify({"success": False, "message": str(error)}), error.status_code, {"Retry-After": "1"}
+
+    # schema migration commands (flask --app run schema upgrade)
+    from app.migrations import schema_cli
+    app.cli.add_command(schema_cli)
+
+    # housekeeping commands (flask --app run maintenance sweep) and the optional scheduled sweep
+    from app.sweeper import maintenance_cli, ensure_sweeper
+    app.cli.add_command(maintenance_cli)
+    if app.config["SWEEP_INTERVAL_SECONDS"] > 0:
+        app.before_request(lambda: ensure_sweeper(app))
+
+    # Register the models with SQLAlchemy. Tables are only created and migrated by
+    # `flask --app run schema upgrade`; requests just check the stamped schema version
     from . import models
     
-    with app.app_context():
-        db.create_all()
+    @app.before_request
+    def check_schema_version():
+        # one query per process, skipped entirely when SCHEMA_CHECK is off
+        if not app.config["SCHEMA_CHECK"] or app.extensions.get("schema_checked"):
+            return None
+        from app.migrations import stamped_revision, head_revision
+        current, head = stamped_revision(), head_revision()
+        if current is None or current < head:
+            app.logger.error("Database schema is at revision %s, the app needs %s", current, head)
+            return jsonify({
+                "success": False,
+                "message": f"Database schema is out of date (revision {current}, expected {head}); run `flask --app run schema upgrade`"
+            }), 503
+        app.extensions["schema_checked"] = True
+        return None
 
 
     return app
\ No newline at end of file
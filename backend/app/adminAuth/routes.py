@@ -1,19 +1,28 @@
 from . import adminAuth_bp
-from flask import request,jsonify,current_app
-from werkzeug.security import check_password_hash
-from app.models import adminAuth, studentAuth, StudentProfile, universitytable, JobDetails, CompanyProfile
-from datetime import datetime, timezone, timedelta
-import jwt
+from flask import request,jsonify
+from app.password_hashing import verify_password
+from app.models import db, adminAuth, studentAuth, StudentProfile, universitytable, JobDetails, CompanyProfile
+from app.pagination import listing_page, search_filter
+from app.exports import export_response
+from datetime import datetime, timezone
+from app.auth import issue_token, require_auth
+from app.rate_limit import rate_limit
 
-# Helper function to ensure datetime is timezone-aware
-def ensure_timezone_aware(dt):
-    """Convert naive datetime to timezone-aware (UTC) if needed"""
-    if dt and dt.tzinfo is None:
-        return dt.replace(tzinfo=timezone.utc)
-    return dt
+# sort keys of the admin listings (each backed by an index, ending with the primary key)
+STUDENT_SORTS = {
+    'id': [studentAuth.id],
+    'email': [studentAuth.mailId, studentAuth.id]
+}
+JOB_SORTS = {
+    'id': [JobDetails.id],
+    'enddate': [JobDetails.enddate, JobDetails.id]
+}
+# admin job listings carry a description preview instead of the full text
+JOB_DESCRIPTION_PREVIEW_CHARS = 200
 
 #login route=========================================================
 @adminAuth_bp.route("/auth/AdminLogin",methods = ['POST'])
+@rate_limit("login")
 def AdminSignin():
     data = request.get_json()
     email = data.get("email")
@@ -24,19 +33,15 @@ def AdminSignin():
     if not user:
         return jsonify({"success": False, "message": "Email Not Registered"}),400
     #check if user exists
-    if not check_password_hash(user.password, password):
+    valid, upgraded_hash = verify_password(user.password, password)
+    if not valid:
         return jsonify({"success": False, "message": "Incorrect Password"}),401
+    #stored under older hashing parameters
+    if upgraded_hash:
+        user.password = upgraded_hash
+        db.session.commit()
     #setup jwt token
-    token = jwt.encode(
-        {
-            "email": email,
-            "exp": datetime.now(timezone.utc) + timedelta(
-                minutes=current_app.config["JWT_EXP_MINUTES"]
-            )
-        },
-        current_app.config["JWT_SECRET"],
-        algorithm="HS256"
-    )
+    token = issue_token("admin", user.id, email)
     #token
     return jsonify({
         "success": True,
@@ -45,26 +50,81 @@ def AdminSignin():
         "admin_id": user.id
     }), 200
 
+def filtered_students(data):
+    """
+    Students joined with their profile and university, filtered by the request
+
+    Filters: universityId, status (complete / incomplete profile), search (email or name)
+    """
+    # Join studentAuth with StudentProfile and universitytable to get all student details
+    students_query = studentAuth.query.join(
+        universitytable, studentAuth.universityid == universitytable.id
+    ).outerjoin(
+        StudentProfile, studentAuth.id == StudentProfile.id
+    ).with_entities(
+        studentAuth.id,
+        studentAuth.mailId,
+        StudentProfile.fullName,
+        universitytable.universityName,
+        studentAuth.universityid
+    )
+    
+    if data.get("universityId"):
+        students_query = students_query.filter(studentAuth.universityid == data.get("universityId", type=int))
+    if data.get("status") == "complete":
+        students_query = students_query.filter(StudentProfile.id.isnot(None))
+    elif data.get("status") == "incomplete":
+        students_query = students_query.filter(StudentProfile.id.is_(None))
+    if data.get("search"):
+        students_query = students_query.filter(
+            search_filter([studentAuth.mailId, StudentProfile.fullName], data["search"].strip())
+        )
+    return students_query
+
+def filtered_jobs(data, current_date):
+    """
+    Jobs joined with their company and university, filtered by the request
+
+    Filters: universityId, companyId, status (active / inactive), search (title or company name)
+    """
+    # Join JobDetails with CompanyProfile and universitytable to get all job details
+    jobs_query = JobDetails.query.join(
+        CompanyProfile, JobDetails.companyid == CompanyProfile.id
+    ).join(
+        universitytable, JobDetails.universityid == universitytable.id
+    )
+    
+    if data.get("universityId"):
+        jobs_query = jobs_query.filter(JobDetails.universityid == data.get("universityId", type=int))
+    if data.get("companyId"):
+        jobs_query = jobs_query.filter(JobDetails.companyid == data.get("companyId", type=int))
+    if data.get("status") == "active":
+        jobs_query = jobs_query.filter(JobDetails.enddate > current_date)
+    elif data.get("status") == "inactive":
+        jobs_query = jobs_query.filter(JobDetails.enddate <= current_date)
+    if data.get("search"):
+        jobs_query = jobs_query.filter(
+            search_filter([JobDetails.title, CompanyProfile.name], data["search"].strip())
+        )
+    return jobs_query
+
 #get all students route=========================================================
 @adminAuth_bp.route("/students",methods = ['GET'])
+@require_auth("admin")
 def getStudents():
+    """Page through students (limit, cursor, sort=id|email, filters as in filtered_students)"""
+    data = request.args
     try:
-        # Join studentAuth with StudentProfile and universitytable to get all student details
-        students = studentAuth.query.join(
-            universitytable, studentAuth.universityid == universitytable.id
-        ).outerjoin(
-            StudentProfile, studentAuth.id == StudentProfile.id
-        ).with_entities(
-            studentAuth.id,
-            studentAuth.mailId,
-            StudentProfile.fullName,
-            universitytable.universityName,
-            studentAuth.universityid
-        ).all()
+        students_query = filtered_students(data)
         
+        page = listing_page(students_query, data, STUDENT_SORTS, "id")
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+    
+    try:
         # Format the results
         students_list = []
-        for student in students:
+        for student in page["rows"]:
             students_list.append({
                 "id": student.id,
                 "email": student.mailId,
@@ -75,7 +135,10 @@ def getStudents():
         
         return jsonify({
             "success": True,
-            "students": students_list
+            "students": students_list,
+            "nextCursor": page["nextCursor"],
+            "total": page["total"],
+            "totalEstimated": page["totalEstimated"]
         }), 200
         
     except Exception as e:
@@ -86,43 +149,44 @@ def getStudents():
 
 #get all job postings route=========================================================
 @adminAuth_bp.route("/api/admin/jobs",methods = ['GET'])
+@require_auth("admin")
 def getJobs():
+    """Page through job postings (limit, cursor, sort=id|enddate, filters as in filtered_jobs)"""
+    data = request.args
+    # enddate is stored as naive UTC, so compare against naive UTC now
+    current_date = datetime.now(timezone.utc).replace(tzinfo=None)
     try:
-        # Join JobDetails with CompanyProfile and universitytable to get all job details
-        jobs = JobDetails.query.join(
-            CompanyProfile, JobDetails.companyid == CompanyProfile.id
-        ).join(
-            universitytable, JobDetails.universityid == universitytable.id
-        ).with_entities(
+        jobs_query = filtered_jobs(data, current_date).with_entities(
             JobDetails.id,
             JobDetails.title,
             JobDetails.type,
             JobDetails.salary,
-            JobDetails.description,
-            JobDetails.requirements,
+            db.func.substr(JobDetails.description, 1, JOB_DESCRIPTION_PREVIEW_CHARS).label('descriptionPreview'),
             JobDetails.enddate,
             CompanyProfile.name.label('companyName'),
             CompanyProfile.id.label('companyId'),
             universitytable.universityName,
             universitytable.id.label('universityId')
-        ).all()
+        )
         
+        page = listing_page(jobs_query, data, JOB_SORTS, "id")
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+    
+    try:
         # Format the results
         jobs_list = []
-        current_date = datetime.now(timezone.utc)
         
-        for job in jobs:
+        for job in page["rows"]:
             # Determine if job is active or inactive based on end date
-            job_enddate = ensure_timezone_aware(job.enddate)
-            status = "active" if job_enddate > current_date else "inactive"
+            status = "active" if job.enddate > current_date else "inactive"
             
             jobs_list.append({
                 "id": job.id,
                 "title": job.title,
                 "type": job.type,
                 "salary": job.salary,
-                "description": job.description,
-                "requirements": job.requirements,
+                "descriptionPreview": job.descriptionPreview,
                 "enddate": job.enddate.isoformat(),
                 "companyName": job.companyName,
                 "companyId": job.companyId,
@@ -133,11 +197,65 @@ def getJobs():
         
         return jsonify({
             "success": True,
-            "jobs": jobs_list
+            "jobs": jobs_list,
+            "nextCursor": page["nextCursor"],
+            "total": page["total"],
+            "totalEstimated": page["totalEstimated"]
         }), 200
         
     except Exception as e:
         return jsonify({
             "success": False,
             "message": f"Error fetching jobs: {str(e)}"
-        }), 500
\ No newline at end of file
+        }), 500
+
+#export routes (streamed, format=ndjson|csv|xlsx)===================================
+@adminAuth_bp.route("/api/admin/exports/students",methods = ['GET'])
+@require_auth("admin")
+def exportStudents():
+    """Stream every student matching the listing filters as a download"""
+    try:
+        return export_response(filtered_students(request.args).order_by(studentAuth.id), [
+            ("id", "id"),
+            ("mailId", "email"),
+            ("fullName", "name"),
+            ("universityName", "universityName"),
+            ("universityid", "universityId")
+        ], request.args.get("format", "csv"), "students")
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+
+@adminAuth_bp.route("/api/admin/exports/jobs",methods = ['GET'])
+@require_auth("admin")
+def exportJobs():
+    """Stream every job posting matching the listing filters as a download, with full descriptions"""
+    current_date = datetime.now(timezone.utc).replace(tzinfo=None)
+    jobs_query = filtered_jobs(request.args, current_date).with_entities(
+        JobDetails.id,
+        JobDetails.title,
+        JobDetails.type,
+        JobDetails.salary,
+        JobDetails.description,
+        JobDetails.requirements,
+        JobDetails.enddate,
+        CompanyProfile.name.label('companyName'),
+        CompanyProfile.id.label('companyId'),
+        universitytable.universityName,
+        universitytable.id.label('universityId')
+    ).order_by(JobDetails.id)
+    try:
+        return export_response(jobs_query, [
+            ("id", "id"),
+            ("title", "title"),
+            ("type", "type"),
+            ("salary", "salary"),
+            ("description", "description"),
+            ("requirements", "requirements"),
+            ("enddate", "enddate"),
+            ("companyName", "companyName"),
+            ("companyId", "companyId"),
+            ("universityName", "universityName"),
+            ("universityId", "universityId")
+        ], request.args.get("format", "csv"), "jobs")
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
@@ -0,0 +1,110 @@
+import time
+from datetime import datetime, timezone, timedelta
+from functools import lru_cache, wraps
+import jwt
+from flask import request, jsonify, current_app, g
+
+# decoded tokens kept per worker; a token is only ever verified once in its lifetime
+TOKEN_CACHE_SIZE = 4096
+
+def issue_token(role: str, subject_id, email: str, university_id=None):
+    """
+    Sign a login token
+
+    Args:
+        role: 'student', 'company' or 'admin'
+        subject_id: studentAuth / companyAuth / adminAuth id of the user
+        email: Login email
+        university_id: Tenant of the user (None for admins)
+
+    Returns:
+        str: HS256 JWT carrying sub, role, email, universityId and exp
+    """
+    claims = {
+        "sub": str(subject_id),
+        "role": role,
+        "email": email,
+        "exp": datetime.now(timezone.utc) + timedelta(
+            minutes=current_app.config["JWT_EXP_MINUTES"]
+        )
+    }
+    if university_id is not None:
+        claims["universityId"] = int(university_id)
+    return jwt.encode(claims, current_app.config["JWT_SECRET"], algorithm="HS256")
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def verified_claims(token: str, secret: str):
+    # invalid tokens raise, and exceptions are never cached
+    return jwt.decode(token, secret, algorithms=["HS256"], options={"require": ["exp", "sub", "role"]})
+
+def decode_token(token: str):
+    """
+    Verify a token, reusing the decoded claims of tokens seen before until they expire
+
+    Raises:
+        jwt.InvalidTokenError: If the token is malformed, forged or expired
+    """
+    claims = verified_claims(token, current_app.config["JWT_SECRET"])
+    if claims["exp"] <= time.time():
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    return claims
+
+def request_value(field):
+    """A field from the URL, query string, form or JSON body of the current request"""
+    if request.view_args and field in request.view_args:
+        return request.view_args[field]
+    if field in request.args:
+        return request.args[field]
+    if field in request.form:
+        return request.form[field]
+    body = request.get_json(silent=True)
+    return body.get(field) if isinstance(body, dict) else None
+
+def auth_error(message, status):
+    return jsonify({"success": False, "message": message}), status
+
+def require_auth(*roles, subject_field=None, tenant_field="universityId"):
+    """
+    Require a valid Bearer token from one of roles and put its claims on g
+
+    Sets g.user_id (int), g.role, g.email and g.university_id. When the request names a
+    subject (subject_field, e.g. 'student_id') or tenant (tenant_field) it must be the
+    token's own, so routes can trust those ids without looking the user up.
+    OPTIONS preflight requests pass through untouched.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method == "OPTIONS":
+                return view(*args, **kwargs)
+
+            header = request.headers.get("Authorization", "")
+            if not header.startswith("Bearer "):
+                return auth_error("Authentication required", 401)
+            try:
+                claims = decode_token(header[len("Bearer "):].strip())
+            except jwt.ExpiredSignatureError:
+                return auth_error("Session expired, please log in again", 401)
+            except jwt.InvalidTokenError:
+                return auth_error("Invalid token", 401)
+
+            if roles and claims["role"] not in roles:
+                return auth_error("Not allowed for this account type", 403)
+
+            g.user_id = int(claims["sub"])
+            g.role = claims["role"]
+            g.email = claims.get("email")
+            g.university_id = claims.get("universityId")
+
+            if subject_field:
+                subject = request_value(subject_field)
+                if subject not in (None, "") and str(subject) != claims["sub"]:
+                    return auth_error("Not allowed to act for another account", 403)
+            if tenant_field and g.university_id is not None:
+                tenant = request_value(tenant_field)
+                if tenant not in (None, "") and str(tenant) != str(g.university_id):
+                    return auth_error("Not allowed to act for another university", 403)
+
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
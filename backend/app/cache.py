@@ -0,0 +1,118 @@
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from flask import current_app
+
+#============================== backends ===============================================
+class InProcessCache:
+    """Thread-safe LRU cache with per-entry expiry, local to one worker process"""
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+class SharedCache:
+    """Cache stored in the shared key-value store, visible to every worker"""
+
+    def __init__(self, client, prefix="startin:cache:"):
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key):
+        raw = self.client.get(self.prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key, value, ttl=None):
+        self.client.set(self.prefix + key, json.dumps(value), ex=int(ttl) if ttl else None)
+
+    def delete(self, key):
+        self.client.delete(self.prefix + key)
+
+def get_cache():
+    """Return the app's cache backend, chosen by CACHE_BACKEND ("memory" or "shared")"""
+    cache = current_app.extensions.get("cache")
+    if cache is None:
+        if current_app.config.get("CACHE_BACKEND") == "shared":
+            from app.shared_store import get_shared_client
+            cache = SharedCache(get_shared_client())
+        else:
+            cache = InProcessCache(current_app.config.get("CACHE_MAX_ENTRIES", 1024))
+        current_app.extensions["cache"] = cache
+    return cache
+
+#============================== job feed ===============================================
+# Feed pages are stored under a per-university generation token. Invalidating a university
+# swaps the token, which orphans every cached page for it at once (they then age out by LRU/TTL).
+
+def job_feed_generation(university_id, renew=False):
+    cache = get_cache()
+    key = f"jobfeed:{university_id}:generation"
+    generation = None if renew else cache.get(key)
+    if generation is None:
+        generation = uuid.uuid4().hex
+        cache.set(key, generation)
+    return generation
+
+def job_feed_key(university_id, cursor, limit):
+    """
+    Cache key of a feed page under the university's current generation
+
+    Build it once per request, before the feed query: a page read while the feed is being
+    invalidated is then stored under the old generation and never served.
+    """
+    return f"jobfeed:{university_id}:{job_feed_generation(university_id)}:{cursor or ''}:{limit}"
+
+def get_cached_job_feed(key):
+    """Return a cached feed page payload, or None"""
+    return get_cache().get(key)
+
+def cache_job_feed(key, payload, nearest_enddate=None):
+    """
+    Cache a feed page payload until the first job on it expires (or JOB_FEED_CACHE_MAX_TTL)
+
+    Args:
+        key: job_feed_key built before the page was queried
+        nearest_enddate: Earliest enddate among the jobs on the page (naive UTC), if any
+    """
+    ttl = current_app.config.get("JOB_FEED_CACHE_MAX_TTL", 300)
+    if nearest_enddate is not None:
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        ttl = min(ttl, (nearest_enddate - now).total_seconds())
+    if ttl >= 1:
+        get_cache().set(key, payload, ttl)
+
+def invalidate_job_feed(university_id):
+    """Drop every cached feed page of a university"""
+    job_feed_generation(university_id, renew=True)
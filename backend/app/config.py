@@ -15,9 +15,69 @@ class Config:
     #setup jwt token
     JWT_SECRET = os.getenv("JWT_SECRET", "your_jwt_secret")
     JWT_EXP_MINUTES = int(os.getenv("JWT_EXP_MINUTES", 10))
+
+    #setup university passkey fingerprints (keyed lookup before the hash check); a dedicated
+    #secret with no default, since changing it invalidates every stored fingerprint
+    PASSKEY_FINGERPRINT_KEY = os.getenv("PASSKEY_FINGERPRINT_KEY")
+    PASSKEY_HASH_WORKERS = int(os.getenv("PASSKEY_HASH_WORKERS", os.cpu_count() or 1))
+
+    #setup password hashing (werkzeug method string; stored hashes are upgraded on login)
+    #run `python -m benchmarks.password_hash_bench` to pick the cost for the hardware
+    PASSWORD_HASH_METHOD = os.getenv("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 1))
+    PASSWORD_HASH_QUEUE_TIMEOUT = float(os.getenv("PASSWORD_HASH_QUEUE_TIMEOUT", 5))
     
     #setup supabase
     SUPABASE_URL = os.getenv("SUPABASE_URL")
     SUPABASE_KEY = os.getenv("SUPABASE_KEY")
     SUPABASE_SERVICE_KEY = os.getenv("SUPABASE_SERVICE_KEY")
-    SUPABASE_BUCKET = os.getenv("SUPABASE_BUCKET", "uploads")
\ No newline at end of file
+    SUPABASE_BUCKET = os.getenv("SUPABASE_BUCKET", "uploads")
+    RESUME_MAX_BYTES = int(os.getenv("RESUME_MAX_BYTES", 5 * 1024 * 1024))
+    RESUME_REDIRECT_MAX_AGE = int(os.getenv("RESUME_REDIRECT_MAX_AGE", 86400))
+
+    #setup database engine (profiles: serverless, worker, local; see app/engine_profiles.py)
+    #defaults to local for sqlite, serverless on Vercel and worker otherwise
+    DB_ENGINE_PROFILE = os.getenv("DB_ENGINE_PROFILE")
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 30))
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+    DB_POOL_SLOW_CHECKOUT_MS = float(os.getenv("DB_POOL_SLOW_CHECKOUT_MS", 100))
+
+    #setup schema version check (one query per process on the first request; turn off in production
+    #once deploys always run `flask --app run schema upgrade`)
+    SCHEMA_CHECK = os.getenv("SCHEMA_CHECK", "True") == "True"
+
+    #setup cache (memory = per worker LRU, shared = SHARED_STORE_URL)
+    CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")
+    CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", 1024))
+    JOB_FEED_CACHE_MAX_TTL = int(os.getenv("JOB_FEED_CACHE_MAX_TTL", 300))
+    SHARED_STORE_URL = os.getenv("SHARED_STORE_URL")
+
+    #setup signup OTPs (memory = per worker, shared = SHARED_STORE_URL, database = otpVerification table)
+    #OTPs are valid for OTP_TTL_SECONDS and kept for OTP_RETENTION_SECONDS so they can be resent
+    OTP_STORE_BACKEND = os.getenv("OTP_STORE_BACKEND", "shared" if os.getenv("SHARED_STORE_URL") else "database")
+    OTP_TTL_SECONDS = int(os.getenv("OTP_TTL_SECONDS", 600))
+    OTP_RETENTION_SECONDS = int(os.getenv("OTP_RETENTION_SECONDS", 3600))
+    OTP_RESEND_SECONDS = int(os.getenv("OTP_RESEND_SECONDS", 600))
+    OTP_MAX_ATTEMPTS = int(os.getenv("OTP_MAX_ATTEMPTS", 5))
+
+    #setup sweeper for expired OTPs and reset tokens (`flask --app run maintenance sweep`;
+    #SWEEP_INTERVAL_SECONDS > 0 also sweeps from a thread in each worker, 0 = off)
+    SWEEP_BATCH_ROWS = int(os.getenv("SWEEP_BATCH_ROWS", 1000))
+    SWEEP_INTERVAL_SECONDS = int(os.getenv("SWEEP_INTERVAL_SECONDS", 0))
+
+    #setup rate limiting (memory = per worker token buckets, shared = SHARED_STORE_URL; rules in app/rate_limit.py)
+    #RATE_LIMIT_PROXY_HOPS = proxies in front of the app whose X-Forwarded-For entry is trusted
+    RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "True") == "True"
+    RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")
+    RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", 10000))
+    RATE_LIMIT_PROXY_HOPS = int(os.getenv("RATE_LIMIT_PROXY_HOPS", 1 if os.getenv("VERCEL") else 0))
+
+    #setup admin uploads (rows read and committed per chunk)
+    UPLOAD_CHUNK_ROWS = int(os.getenv("UPLOAD_CHUNK_ROWS", 500))
+    BACKGROUND_JOB_WORKERS = int(os.getenv("BACKGROUND_JOB_WORKERS", 2))
+    #background jobs run in the worker's threads (long-lived workers only, see app/jobs.py); jobs whose
+    #heartbeat is older than BACKGROUND_JOB_STALE_SECONDS are marked failed by the sweeper and status polls
+    BACKGROUND_JOB_HEARTBEAT_SECONDS = int(os.getenv("BACKGROUND_JOB_HEARTBEAT_SECONDS", 30))
+    BACKGROUND_JOB_STALE_SECONDS = int(os.getenv("BACKGROUND_JOB_STALE_SECONDS", 300))
@@ -0,0 +1,133 @@
+"""
+Database engine profiles
+
+    serverless  NullPool: every checkout opens a fresh connection and closing really closes
+                it, so frozen or recycled instances never hold idle connections. Works
+                behind a transaction pooler (e.g. Supabase's port 6543).
+    worker      Sized QueuePool for long-running gunicorn workers, with pool_pre_ping and
+                pool_recycle so connections dropped by the server are replaced transparently.
+    local       Tests and development on SQLite or a local Postgres, without SSL.
+
+The default is local for SQLite and localhost URLs, serverless on Vercel and worker
+elsewhere. serverless and worker require SSL unless the URL sets its own sslmode.
+
+Every profile's pool records how long each checkout waited (connect time for NullPool),
+reported by pool_metrics().
+"""
+import threading
+import time
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import NullPool, QueuePool, StaticPool
+
+ENGINE_PROFILES = ("serverless", "worker", "local")
+LOCAL_HOSTS = ("localhost", "127.0.0.1", "::1")
+
+class CheckoutMetrics:
+    """Checkout wait-time counters shared by a pool and the pools it is recreated as"""
+
+    def __init__(self, slow_ms):
+        self.slow_ms = slow_ms
+        self.lock = threading.Lock()
+        self.checkouts = 0
+        self.slow_checkouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait):
+        with self.lock:
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            if wait * 1000 >= self.slow_ms:
+                self.slow_checkouts += 1
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "checkouts": self.checkouts,
+                "slowCheckouts": self.slow_checkouts,
+                "slowThresholdMs": self.slow_ms,
+                "waitTotalMs": round(self.total_wait * 1000, 3),
+                "waitAvgMs": round(self.total_wait * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                "waitMaxMs": round(self.max_wait * 1000, 3)
+            }
+
+class TimedPoolMixin:
+    """Times _do_get, the part of a checkout that waits for (or opens) a connection"""
+    checkout_metrics = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.checkout_metrics.record(time.perf_counter() - start)
+
+def timed_pool_class(pool_class, metrics):
+    # a class per engine, so the metrics survive pool.recreate() (which reuses the class)
+    return type(f"Timed{pool_class.__name__}", (TimedPoolMixin, pool_class), {"checkout_metrics": metrics})
+
+def default_profile(database_url, environ):
+    if database_url and database_url.startswith("sqlite"):
+        return "local"
+    if environ.get("VERCEL"):
+        return "serverless"
+    if database_url and make_url(database_url).host in LOCAL_HOSTS:
+        return "local"
+    return "worker"
+
+def ssl_connect_args(database_url):
+    """connect_args requiring SSL, unless the URL already picks an sslmode"""
+    if database_url and "sslmode" in make_url(database_url).query:
+        return {}
+    return {"sslmode": "require"}
+
+def engine_options(profile, database_url, config):
+    """
+    SQLALCHEMY_ENGINE_OPTIONS for a profile
+
+    Raises:
+        ValueError: If the profile is unknown
+    """
+    metrics = CheckoutMetrics(config["DB_POOL_SLOW_CHECKOUT_MS"])
+
+    if profile == "serverless":
+        return {
+            "poolclass": timed_pool_class(NullPool, metrics),
+            "connect_args": ssl_connect_args(database_url)
+        }
+
+    if profile == "worker":
+        return {
+            "poolclass": timed_pool_class(QueuePool, metrics),
+            "pool_size": config["DB_POOL_SIZE"],
+            "max_overflow": config["DB_MAX_OVERFLOW"],
+            "pool_timeout": config["DB_POOL_TIMEOUT"],
+            "pool_recycle": config["DB_POOL_RECYCLE"],
+            "pool_pre_ping": True,
+            "connect_args": ssl_connect_args(database_url)
+        }
+
+    if profile == "local":
+        if database_url in ("sqlite://", "sqlite:///:memory:"):
+            # one shared connection, otherwise every checkout sees a new empty database
+            return {
+                "poolclass": timed_pool_class(StaticPool, metrics),
+                "connect_args": {"check_same_thread": False}
+            }
+        return {
+            "poolclass": timed_pool_class(QueuePool, metrics),
+            "pool_size": config["DB_POOL_SIZE"],
+            "max_overflow": config["DB_MAX_OVERFLOW"],
+            "pool_pre_ping": True
+        }
+
+    raise ValueError(f"Unknown DB_ENGINE_PROFILE {profile!r}, expected one of: {', '.join(ENGINE_PROFILES)}")
+
+def pool_metrics(engine):
+    """Checkout wait-time metrics and current state of an engine's pool"""
+    pool = engine.pool
+    metrics = pool.checkout_metrics.snapshot() if isinstance(pool, TimedPoolMixin) else {}
+    metrics["pool"] = type(pool).__name__
+    metrics["status"] = pool.status()
+    return metrics
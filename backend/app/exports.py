@@ -0,0 +1,103 @@
+import csv
+import io
+import json
+import os
+import tempfile
+from datetime import date, datetime
+from flask import Response, stream_with_context
+from app.extensions import db
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+}
+# rows fetched per round trip from the server-side cursor
+EXPORT_BATCH_ROWS = 1000
+XLSX_CHUNK_BYTES = 64 * 1024
+
+def export_value(value):
+    return value.isoformat() if isinstance(value, (datetime, date)) else value
+
+def stream_rows(query, columns):
+    """
+    Yield each row of a query as a list of values, in the order of columns
+
+    Rows are read through a server-side cursor (yield_per) EXPORT_BATCH_ROWS at a time,
+    so memory stays constant however many rows the export has.
+    """
+    result = db.session.execute(query.statement, execution_options={"yield_per": EXPORT_BATCH_ROWS})
+    try:
+        for row in result:
+            yield [export_value(getattr(row, key)) for key, _ in columns]
+    finally:
+        result.close()
+
+def ndjson_lines(columns, rows):
+    headers = [header for _, header in columns]
+    for row in rows:
+        yield json.dumps(dict(zip(headers, row)), separators=(",", ":")) + "\n"
+
+def csv_lines(columns, rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([header for _, header in columns])
+    for count, row in enumerate(rows, 1):
+        writer.writerow(row)
+        if count % EXPORT_BATCH_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+def xlsx_chunks(columns, rows):
+    """
+    Write rows to a write-only workbook on disk, then stream the file
+
+    An xlsx file is a zip archive, so it is only complete once every row has been written;
+    write-only mode keeps memory constant while it is built.
+    """
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append([header for _, header in columns])
+    for row in rows:
+        sheet.append(row)
+
+    handle, path = tempfile.mkstemp(prefix="export_", suffix=".xlsx")
+    os.close(handle)
+    try:
+        workbook.save(path)
+        with open(path, "rb") as exported:
+            while True:
+                chunk = exported.read(XLSX_CHUNK_BYTES)
+                if not chunk:
+                    break
+                yield chunk
+    finally:
+        os.remove(path)
+
+def export_response(query, columns, export_format, name):
+    """
+    Stream a query as an NDJSON, CSV or XLSX download
+
+    Args:
+        query: SQLAlchemy query selecting the exported columns
+        columns: (row attribute, header) pairs, in export order
+        export_format: One of EXPORT_FORMATS
+        name: Download file name without extension
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Invalid format, expected one of: {', '.join(EXPORT_FORMATS)}")
+
+    writers = {"ndjson": ndjson_lines, "csv": csv_lines, "xlsx": xlsx_chunks}
+    body = writers[export_format](columns, stream_rows(query, columns))
+    return Response(
+        stream_with_context(body),
+        mimetype=EXPORT_FORMATS[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{export_format}"'}
+    )
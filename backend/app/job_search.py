@@ -0,0 +1,135 @@
+"""
+Ranked full-text search over active job postings
+
+On Postgres, job_details.search_vector (a generated tsvector column with a GIN index, see
+migration v0010) weights title (A) above requirements (B) above description (C). Queries
+use websearch syntax ("python -java", "\"data engineer\"", "react or vue") and are ranked
+with ts_rank_cd.
+
+Other databases (SQLite test runs) use JobSearchIndex, an in-memory inverted index built
+from the university's active jobs with the same field weights, so the endpoint behaves
+the same in tests.
+
+Both return pages keyed on (rank, id), highest rank first.
+"""
+import math
+import re
+from collections import defaultdict
+from datetime import datetime, timezone
+from sqlalchemy import Float, cast, func, literal_column, tuple_
+from app.extensions import db
+from app.models import JobDetails
+from app.pagination import encode_cursor, keyset_page
+
+# field weights of the tsvector (ts_rank's defaults for A, B, C)
+SEARCH_WEIGHTS = {"title": 1.0, "requirements": 0.4, "description": 0.2}
+MAX_QUERY_LENGTH = 200
+
+def active_jobs_query(university_id):
+    # enddate is stored as naive UTC, so compare against naive UTC now
+    current_date = datetime.now(timezone.utc).replace(tzinfo=None)
+    return JobDetails.query.filter(
+        JobDetails.universityid == university_id,
+        JobDetails.enddate > current_date
+    )
+
+#============================== postgres ===============================================
+def search_postgres(university_id, text, cursor, limit):
+    tsquery = func.websearch_to_tsquery("english", text)
+    search_vector = literal_column("job_details.search_vector")
+    # double precision, so the rank survives the round trip through the cursor exactly
+    rank = cast(func.ts_rank_cd(search_vector, tsquery), Float).label("rank")
+
+    query = active_jobs_query(university_id).filter(
+        search_vector.op("@@")(tsquery)
+    ).with_entities(JobDetails.id, rank)
+    rows, next_cursor = keyset_page(query, [rank, JobDetails.id], cursor, limit, descending=True)
+    return [(row.id, row.rank) for row in rows], next_cursor
+
+#============================== fallback ===============================================
+STOP_WORDS = frozenset(
+    "a an and are as at be by for from in is it of on or the to with".split()
+)
+
+def stem(word):
+    # crude suffix stripping, close enough to the english stemmer for tests
+    for suffix in ("ing", "ed", "es", "s"):
+        if len(word) > len(suffix) + 2 and word.endswith(suffix):
+            return word[:-len(suffix)]
+    return word
+
+def tokenize(text):
+    return [stem(word) for word in re.findall(r"[a-z0-9+#]+", (text or "").lower()) if word not in STOP_WORDS]
+
+class JobSearchIndex:
+    """Inverted index of term -> {job id: weighted term frequency}"""
+
+    def __init__(self, jobs):
+        self.postings = defaultdict(lambda: defaultdict(float))
+        self.lengths = {}
+        for job in jobs:
+            length = 0
+            for field, weight in SEARCH_WEIGHTS.items():
+                terms = tokenize(getattr(job, field))
+                length += len(terms)
+                for term in terms:
+                    self.postings[term][job.id] += weight
+            self.lengths[job.id] = length
+
+    def search(self, text):
+        """
+        Jobs containing every query term, ranked by weighted term frequency
+
+        Returns:
+            list: (rank, job id) pairs, highest rank first
+        """
+        terms = set(tokenize(text))
+        if not terms:
+            return []
+        matches = set.intersection(*(set(self.postings.get(term, ())) for term in terms))
+        ranked = [
+            (sum(self.postings[term][job_id] for term in terms) / math.log2(2 + self.lengths[job_id]), job_id)
+            for job_id in matches
+        ]
+        return sorted(ranked, reverse=True)
+
+def search_fallback(university_id, text, cursor, limit):
+    jobs = active_jobs_query(university_id).with_entities(
+        JobDetails.id, *(getattr(JobDetails, field) for field in SEARCH_WEIGHTS)
+    ).all()
+    ranked = JobSearchIndex(jobs).search(text)
+
+    if cursor is not None:
+        if len(cursor) != 2:
+            raise ValueError("Invalid cursor")
+        ranked = [entry for entry in ranked if entry < tuple(cursor)]
+
+    page = ranked[:limit]
+    next_cursor = encode_cursor(page[-1]) if len(ranked) > limit else None
+    return [(job_id, rank) for rank, job_id in page], next_cursor
+
+def search_jobs(university_id, text, cursor, limit):
+    """
+    One page of a university's active jobs matching a search, best match first
+
+    Args:
+        university_id: University whose jobs are searched
+        text: Search text in websearch syntax
+        cursor: Decoded cursor values from the previous page, or None
+        limit: Page size
+
+    Returns:
+        tuple: (matches: list of (job id, rank), next_cursor: str or None)
+
+    Raises:
+        ValueError: If the search text or cursor is invalid
+    """
+    text = (text or "").strip()
+    if not text:
+        raise ValueError("Search text is required")
+    if len(text) > MAX_QUERY_LENGTH:
+        raise ValueError(f"Search text is limited to {MAX_QUERY_LENGTH} characters")
+
+    if db.engine.dialect.name == "postgresql":
+        return search_postgres(university_id, text, cursor, limit)
+    return search_fallback(university_id, text, cursor, limit)
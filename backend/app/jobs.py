@@ -0,0 +1,185 @@
+"""
+Background jobs for long admin operations and resume uploads
+
+Jobs run on a thread pool inside the web worker that accepted them, so they only finish on
+deploys with long-lived worker processes. On serverless platforms (Vercel) the instance can
+be frozen or recycled once the response is sent, taking its queued and running jobs with
+it. Each worker therefore touches updated_at of its own jobs every
+BACKGROUND_JOB_HEARTBEAT_SECONDS, and a job whose heartbeat is older than
+BACKGROUND_JOB_STALE_SECONDS is marked failed by the sweeper (and by its status poll)
+instead of staying "running" forever.
+"""
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone, timedelta
+from flask import current_app
+from app.extensions import db
+from app.models import backgroundJob
+
+# a job in one of these states still belongs to the worker that accepted it
+ACTIVE_STATUSES = ("queued", "running")
+ABANDONED_MESSAGE = "Abandoned: the worker running this job stopped before it finished"
+
+_executor = None
+_executor_pid = None
+_executor_lock = threading.Lock()
+# ids of the jobs queued or running in this process, kept alive by its heartbeat thread
+_active_jobs = set()
+
+def get_executor():
+    """Process-wide thread pool for background jobs (and its heartbeat), rebuilt after a fork"""
+    global _executor, _executor_pid
+    with _executor_lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(
+                max_workers=current_app.config.get("BACKGROUND_JOB_WORKERS", 2),
+                thread_name_prefix="background-job"
+            )
+            _executor_pid = os.getpid()
+            # jobs inherited from the parent process are not running here
+            _active_jobs.clear()
+            threading.Thread(
+                target=run_heartbeat,
+                args=(current_app._get_current_object(), current_app.config["BACKGROUND_JOB_HEARTBEAT_SECONDS"]),
+                name="background-job-heartbeat", daemon=True
+            ).start()
+        return _executor
+
+def run_heartbeat(app, interval):
+    """Touch updated_at of this process's queued and running jobs every interval seconds"""
+    table = backgroundJob.__table__
+    while True:
+        time.sleep(interval)
+        with _executor_lock:
+            job_ids = list(_active_jobs)
+        if not job_ids:
+            continue
+        with app.app_context():
+            try:
+                with db.engine.begin() as connection:
+                    connection.execute(
+                        db.update(table)
+                        .where(table.c.id.in_(job_ids), table.c.status.in_(ACTIVE_STATUSES))
+                        .values(updated_at=datetime.now(timezone.utc))
+                    )
+            except Exception:
+                app.logger.exception("Background job heartbeat failed")
+
+class JobProgress:
+    """
+    Handle a running job uses to report progress
+
+    Updates go through their own short transaction, so they are visible to status polls
+    right away and never commit (or roll back) the job's own work in db.session. Once the
+    job has finished (or was marked abandoned) further updates are ignored.
+    """
+
+    def __init__(self, job_id):
+        self.job_id = job_id
+
+    def update(self, **fields):
+        """Set any of processed, total, result, message, status on the job row"""
+        fields["updated_at"] = datetime.now(timezone.utc)
+        with db.engine.begin() as connection:
+            connection.execute(
+                db.update(backgroundJob.__table__)
+                .where(
+                    backgroundJob.__table__.c.id == self.job_id,
+                    backgroundJob.__table__.c.status.in_(ACTIVE_STATUSES)
+                )
+                .values(**fields)
+            )
+
+def submit_job(kind, func, *args, job_id=None, **kwargs):
+    """
+    Record a job and run func(progress, *args, **kwargs) on the background pool
+
+    func runs inside an app context and returns a JSON-serialisable result dict.
+    An exception marks the job failed; a result reported through progress is kept.
+    The job row is committed together with whatever is pending in db.session.
+
+    Args:
+        job_id: Id for the job (32 hex characters) when the caller has already stored one
+
+    Returns:
+        str: Job id to poll at /api/admin/jobs/<id>/status
+    """
+    now = datetime.now(timezone.utc)
+    job = backgroundJob(
+        id=job_id or uuid.uuid4().hex,
+        kind=kind,
+        status="queued",
+        processed=0,
+        created_at=now,
+        updated_at=now
+    )
+    db.session.add(job)
+    db.session.commit()
+
+    app = current_app._get_current_object()
+    executor = get_executor()
+    with _executor_lock:
+        _active_jobs.add(job.id)
+    executor.submit(run_job, app, job.id, func, args, kwargs)
+    return job.id
+
+def run_job(app, job_id, func, args, kwargs):
+    with app.app_context():
+        progress = JobProgress(job_id)
+        try:
+            progress.update(status="running")
+            result = func(progress, *args, **kwargs)
+            progress.update(status="succeeded", result=result, finished_at=datetime.now(timezone.utc))
+        except Exception as e:
+            db.session.rollback()
+            app.logger.exception("Background job %s failed", job_id)
+            progress.update(status="failed", message=str(e), finished_at=datetime.now(timezone.utc))
+        finally:
+            with _executor_lock:
+                _active_jobs.discard(job_id)
+            db.session.remove()
+
+def fail_abandoned_jobs(job_id=None):
+    """
+    Mark queued or running jobs whose heartbeat is older than BACKGROUND_JOB_STALE_SECONDS failed
+
+    Args:
+        job_id: Only check this job (for its status poll); every job when None
+
+    Returns:
+        list: Ids of the jobs marked failed
+    """
+    table = backgroundJob.__table__
+    now = datetime.now(timezone.utc)
+    cutoff = (now - timedelta(seconds=current_app.config["BACKGROUND_JOB_STALE_SECONDS"])).replace(tzinfo=None)
+    condition = db.and_(table.c.status.in_(ACTIVE_STATUSES), table.c.updated_at < cutoff)
+    if job_id is not None:
+        condition = db.and_(condition, table.c.id == job_id)
+    
+    with db.engine.begin() as connection:
+        job_ids = [row.id for row in connection.execute(db.select(table.c.id).where(condition))]
+        if job_ids:
+            # the condition is checked again: a job whose heartbeat arrived meanwhile is alive
+            connection.execute(
+                db.update(table)
+                .where(condition, table.c.id.in_(job_ids))
+                .values(status="failed", message=ABANDONED_MESSAGE, updated_at=now, finished_at=now)
+            )
+    return job_ids
+
+def job_to_dict(job):
+    return {
+        "id": job.id,
+        "kind": job.kind,
+        "status": job.status,
+        "processed": job.processed,
+        "total": job.total,
+        "result": job.result,
+        "message": job.message,
+        "createdAt": job.created_at.isoformat(),
+        "updatedAt": job.updated_at.isoformat(),
+        "finishedAt": job.finished_at.isoformat() if job.finished_at else None
+    }
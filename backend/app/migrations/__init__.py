@@ -0,0 +1,150 @@
+"""
+Versioned schema migrations
+
+Migrations live in app/migrations/versions as modules with a revision number, a description
+and an upgrade() function. Applied revisions are recorded in the schema_version table.
+
+Usage (from the backend folder):
+    flask --app run schema upgrade          apply every pending migration
+    flask --app run schema current          show the applied revision
+    flask --app run schema check-indexes    fail if a route filter has no covering index
+"""
+import importlib
+import pkgutil
+import sys
+from datetime import datetime, timezone
+import click
+from flask.cli import AppGroup
+from sqlalchemy.exc import DBAPIError
+from app.extensions import db
+
+schema_cli = AppGroup("schema", help="Database schema migrations")
+
+def load_migrations():
+    """Import every migration module, ordered by revision"""
+    from . import versions
+    modules = [
+        importlib.import_module(f"{versions.__name__}.{name}")
+        for _, name, _ in pkgutil.iter_modules(versions.__path__)
+    ]
+    modules.sort(key=lambda module: module.revision)
+
+    revisions = [module.revision for module in modules]
+    if revisions != list(range(1, len(modules) + 1)):
+        raise RuntimeError(f"Migration revisions must run 1..N without gaps, found {revisions}")
+    return modules
+
+def head_revision():
+    return len(load_migrations())
+
+def current_revision():
+    """Highest applied revision, or None if the schema_version table does not exist yet"""
+    from app.models import schemaVersion
+    if not db.inspect(db.engine).has_table(schemaVersion.__tablename__):
+        return None
+    return db.session.query(db.func.max(schemaVersion.version)).scalar() or 0
+
+def stamped_revision():
+    """
+    Applied revision read with a single query, or None if the schema_version table is missing
+
+    Used by the startup schema check, which must stay cheap on every cold start.
+    """
+    from app.models import schemaVersion
+    try:
+        return db.session.query(db.func.max(schemaVersion.version)).scalar() or 0
+    except DBAPIError:
+        db.session.rollback()
+        return None
+
+def upgrade(target=None):
+    """
+    Apply pending migrations up to target (default: latest)
+
+    Missing tables are created first; migrations then bring existing tables up to date.
+
+    Returns:
+        list: Revisions that were applied
+    """
+    from app.models import schemaVersion
+    db.create_all()
+
+    current = current_revision() or 0
+    applied = []
+    for migration in load_migrations():
+        if migration.revision <= current or (target is not None and migration.revision > target):
+            continue
+        migration.upgrade()
+        db.session.add(schemaVersion(
+            version=migration.revision,
+            description=migration.description,
+            applied_at=datetime.now(timezone.utc)
+        ))
+        db.session.commit()
+        applied.append(migration.revision)
+    return applied
+
+@schema_cli.command("upgrade")
+@click.option("--to", "target", type=int, default=None, help="Stop at this revision")
+def upgrade_command(target):
+    """Apply pending migrations"""
+    applied = upgrade(target)
+    if applied:
+        click.echo(f"Applied revisions {', '.join(str(revision) for revision in applied)}")
+    click.echo(f"Schema is at revision {current_revision()} (latest {head_revision()})")
+
+@schema_cli.command("current")
+def current_command():
+    """Show the applied revision"""
+    click.echo(f"Schema is at revision {current_revision()} (latest {head_revision()})")
+
+@schema_cli.command("check-indexes")
+def check_indexes_command():
+    """Fail if any route filter has no covering index"""
+    from .index_check import uncovered_filters
+    missing = uncovered_filters()
+    for location, table, columns in missing:
+        click.echo(f"{location}: {table}({', '.join(columns)}) has no covering index")
+    if missing:
+        sys.exit(1)
+    click.echo("Every route filter has a covering index")
+
+@schema_cli.command("backfill-passkeys")
+@click.argument("path")
+def backfill_passkeys_command(path):
+    """
+    Fill universitytable.passkeyFingerprint from the original CSV/Excel upload
+
+    Stored passkeys are salted hashes, so fingerprints can only be computed from the plain
+    passkeys. Required after upgrading from a schema without fingerprints: rows that are not
+    backfilled (or uploaded again) cannot be verified.
+    """
+    import pandas as pd
+    from werkzeug.security import check_password_hash
+    from app.models import universitytable
+    from app.passkey_utils import passkey_fingerprint
+
+    df = pd.read_csv(path) if path.lower().endswith(".csv") else pd.read_excel(path)
+    universities = {uni.universityName: uni for uni in universitytable.query.all()}
+    filled = 0
+
+    for index, row in df.iterrows():
+        university_name = str(row["universityName"]).strip()
+        passkey = str(row["passkey"]).strip()
+        university = universities.get(university_name)
+
+        if not university or university.passkeyFingerprint:
+            continue
+        # Only stamp rows whose stored hash still matches this passkey
+        if check_password_hash(university.passkey, passkey):
+            university.passkeyFingerprint = passkey_fingerprint(passkey)
+            filled += 1
+        else:
+            click.echo(f"Row {index + 2}: passkey does not match stored hash for {university_name}, skipped")
+
+    db.session.commit()
+    remaining = universitytable.query.filter(universitytable.passkeyFingerprint.is_(None)).count()
+    click.echo(f"Backfilled {filled} fingerprints")
+    if remaining:
+        click.echo(f"{remaining} universities still have no fingerprint and cannot be verified until backfilled or uploaded again")
+        sys.exit(1)
@@ -0,0 +1,101 @@
+import ast
+import os
+from app.extensions import db
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def model_classes():
+    """Map model class names (as written in the routes) to their classes"""
+    from app import models
+    return {
+        name: value for name, value in vars(models).items()
+        if isinstance(value, type) and issubclass(value, db.Model) and value is not db.Model
+    }
+
+def query_model(node, models):
+    """Walk down a call chain like Model.query.join(...).filter_by(...) to find Model"""
+    while True:
+        if isinstance(node, ast.Call):
+            node = node.func
+        elif isinstance(node, ast.Attribute):
+            if node.attr == "query" and isinstance(node.value, ast.Name) and node.value.id in models:
+                return models[node.value.id]
+            node = node.value
+        else:
+            return None
+
+def equality_columns(node, models):
+    """Collect Model.column == value comparisons from the arguments of a .filter() call"""
+    found = {}
+    for arg in node.args:
+        for compare in ast.walk(arg):
+            if not isinstance(compare, ast.Compare) or not isinstance(compare.ops[0], ast.Eq):
+                continue
+            left = compare.left
+            if isinstance(left, ast.Attribute) and isinstance(left.value, ast.Name) and left.value.id in models:
+                found.setdefault(models[left.value.id], set()).add(left.attr)
+    return found
+
+def route_filters():
+    """
+    Find every equality filter the app runs against a model
+
+    Yields:
+        tuple: (location: str, model, columns: frozenset)
+    """
+    models = model_classes()
+    for root, dirs, files in os.walk(APP_DIR):
+        dirs[:] = [d for d in dirs if d not in ("migrations", "__pycache__")]
+        for filename in files:
+            if not filename.endswith(".py"):
+                continue
+            path = os.path.join(root, filename)
+            with open(path, encoding="utf-8") as source:
+                tree = ast.parse(source.read(), path)
+            location = os.path.relpath(path, os.path.dirname(APP_DIR))
+
+            for node in ast.walk(tree):
+                if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Attribute):
+                    continue
+                if node.func.attr == "filter_by":
+                    model = query_model(node.func.value, models)
+                    if model and node.keywords:
+                        yield f"{location}:{node.lineno}", model, frozenset(k.arg for k in node.keywords)
+                elif node.func.attr == "filter" and query_model(node.func.value, models):
+                    # only filters chained onto Model.query are access paths; later
+                    # .filter() refinements on a query variable are residual filters
+                    for model, columns in equality_columns(node, models).items():
+                        yield f"{location}:{node.lineno}", model, frozenset(columns)
+
+def table_indexes(table):
+    """Column lists of every index on a table, with a flag for unique ones"""
+    indexes = [([c.name for c in table.primary_key.columns], True)]
+    for index in table.indexes:
+        indexes.append(([c.name for c in index.columns], bool(index.unique)))
+    for constraint in table.constraints:
+        if isinstance(constraint, db.UniqueConstraint):
+            indexes.append(([c.name for c in constraint.columns], True))
+    return indexes
+
+def is_covered(table, columns):
+    """
+    An equality filter is covered when an index starts with exactly the filtered columns,
+    or when a unique index is fully pinned by them (a point lookup)
+    """
+    columns = {table.c[key].name for key in columns if key in table.c}
+    if not columns:
+        return True
+    for index_columns, unique in table_indexes(table):
+        if set(index_columns[:len(columns)]) == columns:
+            return True
+        if unique and set(index_columns) <= columns:
+            return True
+    return False
+
+def uncovered_filters():
+    """List (location, table name, columns) for every route filter without a covering index"""
+    missing = []
+    for location, model, columns in route_filters():
+        if not is_covered(model.__table__, columns):
+            missing.append((location, model.__tablename__, sorted(columns)))
+    return missing
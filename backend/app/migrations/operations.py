@@ -0,0 +1,33 @@
+from app.extensions import db
+
+# Every operation checks the live schema first, so a migration can be re-run safely and
+# also applies cleanly on a database whose tables were just created by db.create_all().
+# Migrations spell out their own DDL (tables, columns, indexes as of their revision) instead
+# of reading it off app.models, so later model changes cannot rewrite an old revision.
+
+def create_table(table_name, *columns):
+    """Create a table from explicit columns (e.g. create_table("job", db.Column("id", db.Integer, primary_key=True))) if it does not exist"""
+    db.Table(table_name, db.MetaData(), *columns).create(bind=db.engine, checkfirst=True)
+
+def has_column(table_name, column_name):
+    inspector = db.inspect(db.engine)
+    return column_name in {column["name"] for column in inspector.get_columns(table_name)}
+
+def add_column(table_name, column_name, ddl_type):
+    """Add a column (e.g. add_column("universitytable", "passkeyFingerprint", "VARCHAR(64)")) if missing"""
+    if not has_column(table_name, column_name):
+        db.session.execute(db.text(f'ALTER TABLE {table_name} ADD COLUMN "{column_name}" {ddl_type}'))
+        db.session.commit()
+
+def create_index(name, table_name, columns, unique=False):
+    """Create an index (e.g. create_index("ix_admin_auth_mailId", "admin_auth", ["mailId"])) if it does not exist"""
+    column_list = ", ".join(f'"{column}"' for column in columns)
+    db.session.execute(db.text(
+        f'CREATE {"UNIQUE " if unique else ""}INDEX IF NOT EXISTS "{name}" ON {table_name} ({column_list})'
+    ))
+    db.session.commit()
+
+def drop_index(name):
+    """Drop an index by name if it exists"""
+    db.session.execute(db.text(f'DROP INDEX IF EXISTS "{name}"'))
+    db.session.commit()
@@ -0,0 +1 @@
+# Each module here is one migration: revision (int), description (str) and upgrade()
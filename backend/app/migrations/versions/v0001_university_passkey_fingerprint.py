@@ -0,0 +1,8 @@
+from app.migrations.operations import add_column, create_index
+
+revision = 1
+description = "universitytable.passkeyFingerprint lookup column"
+
+def upgrade():
+    add_column("universitytable", "passkeyFingerprint", "VARCHAR(64)")
+    create_index("ix_universitytable_passkeyFingerprint", "universitytable", ["passkeyFingerprint"])
@@ -0,0 +1,24 @@
+from app.migrations.operations import create_index
+
+revision = 2
+description = "secondary indexes matching each route's filters"
+
+def upgrade():
+    create_index("ix_admin_auth_mailId", "admin_auth", ["mailId"])
+    # plain index; revision 4 makes it unique
+    create_index("ix_universitytable_universityName", "universitytable", ["universityName"])
+    create_index("ix_student_auth_universityid_mailId", "student_auth", ["universityid", "mailId"])
+    create_index("ix_otp_verification_email_universityid", "otp_verification", ["email", "universityid"])
+    create_index("ix_otp_verification_universityid", "otp_verification", ["universityid"])
+    create_index("ix_company_auth_email_universityid", "company_auth", ["email", "universityid"])
+    create_index("ix_company_auth_universityid", "company_auth", ["universityid"])
+    create_index(
+        "ix_password_reset_token_email_universityid_user_type_used", "password_reset_token",
+        ["email", "universityid", "user_type", "used"]
+    )
+    create_index("ix_company_profile_universityid", "company_profile", ["universityid"])
+    create_index("ix_student_profile_universityid", "student_profile", ["universityid"])
+    create_index("ix_job_details_universityid_id", "job_details", ["universityid", "id"])
+    create_index("ix_job_details_companyid_universityid", "job_details", ["companyid", "universityid"])
+    create_index("ix_job_application_companyid_id", "job_application", ["companyid", "id"])
+    create_index("ix_job_application_universityid", "job_application", ["universityid"])
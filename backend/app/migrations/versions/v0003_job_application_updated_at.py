@@ -0,0 +1,7 @@
+from app.migrations.operations import add_column
+
+revision = 3
+description = "job_application.updated_at for applied-jobs ETags"
+
+def upgrade():
+    add_column("job_application", "updated_at", "TIMESTAMP")
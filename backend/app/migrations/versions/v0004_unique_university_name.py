@@ -0,0 +1,20 @@
+from app.extensions import db
+from app.migrations.operations import create_index, drop_index
+
+revision = 4
+description = "unique universitytable.universityName for bulk upserts"
+
+def upgrade():
+    duplicates = db.session.execute(db.text(
+        'SELECT "universityName" FROM universitytable GROUP BY "universityName" HAVING COUNT(*) > 1'
+    )).scalars().all()
+    if duplicates:
+        names = ", ".join(duplicates)
+        raise RuntimeError(f"Merge or rename duplicate universities before upgrading: {names}")
+
+    # replaces the plain index from revision 2 under the same name
+    inspector = db.inspect(db.engine)
+    for index in inspector.get_indexes("universitytable"):
+        if index["name"] == "ix_universitytable_universityName" and not index["unique"]:
+            drop_index("ix_universitytable_universityName")
+    create_index("ix_universitytable_universityName", "universitytable", ["universityName"], unique=True)
@@ -0,0 +1,20 @@
+from app.extensions import db
+from app.migrations.operations import create_table
+
+revision = 5
+description = "background_job table for long admin operations"
+
+def upgrade():
+    create_table(
+        "background_job",
+        db.Column("id", db.String(32), primary_key=True),
+        db.Column("kind", db.String(100), nullable=False),
+        db.Column("status", db.String(20), nullable=False),
+        db.Column("processed", db.Integer, nullable=False),
+        db.Column("total", db.Integer, nullable=True),
+        db.Column("result", db.JSON, nullable=True),
+        db.Column("message", db.Text, nullable=True),
+        db.Column("created_at", db.DateTime, nullable=False),
+        db.Column("updated_at", db.DateTime, nullable=False),
+        db.Column("finished_at", db.DateTime, nullable=True)
+    )
@@ -0,0 +1,7 @@
+from app.migrations.operations import add_column
+
+revision = 6
+description = "student_profile.resume_status for background resume uploads"
+
+def upgrade():
+    add_column("student_profile", "resume_status", "VARCHAR(20)")
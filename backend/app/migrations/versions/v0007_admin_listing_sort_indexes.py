@@ -0,0 +1,8 @@
+from app.migrations.operations import create_index
+
+revision = 7
+description = "indexes behind the admin listing sort keys"
+
+def upgrade():
+    create_index("ix_student_auth_mailId_id", "student_auth", ["mailId", "id"])
+    create_index("ix_job_details_enddate_id", "job_details", ["enddate", "id"])
@@ -0,0 +1,7 @@
+from app.migrations.operations import add_column
+
+revision = 8
+description = "otp_verification.attempts for the OTP store's wrong-guess limit"
+
+def upgrade():
+    add_column("otp_verification", "attempts", "INTEGER NOT NULL DEFAULT 0")
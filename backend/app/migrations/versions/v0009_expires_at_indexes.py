@@ -0,0 +1,8 @@
+from app.migrations.operations import create_index
+
+revision = 9
+description = "expires_at indexes for the OTP / reset token sweeper"
+
+def upgrade():
+    create_index("ix_otp_verification_expires_at", "otp_verification", ["expires_at"])
+    create_index("ix_password_reset_token_expires_at", "password_reset_token", ["expires_at"])
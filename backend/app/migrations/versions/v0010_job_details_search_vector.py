@@ -0,0 +1,25 @@
+from app.extensions import db
+from app.migrations.operations import has_column
+
+revision = 10
+description = "job_details.search_vector (weighted tsvector) with a GIN index for /search/jobs (Postgres only)"
+
+# title (A) > requirements (B) > description (C); kept up to date by Postgres itself
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(requirements, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
+
+def upgrade():
+    # other databases search with the in-memory fallback in app/job_search.py
+    if db.engine.dialect.name != "postgresql":
+        return
+    if not has_column("job_details", "search_vector"):
+        db.session.execute(db.text(
+            f"ALTER TABLE job_details ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({SEARCH_VECTOR}) STORED"
+        ))
+    db.session.execute(db.text(
+        'CREATE INDEX IF NOT EXISTS "ix_job_details_search_vector" ON job_details USING GIN (search_vector)'
+    ))
+    db.session.commit()
@@ -0,0 +1,7 @@
+from app.migrations.operations import add_column
+
+revision = 11
+description = "student_profile.resume_upload token so only the latest background resume upload is applied"
+
+def upgrade():
+    add_column("student_profile", "resume_upload", "VARCHAR(32)")
@@ -0,0 +1,7 @@
+from app.migrations.operations import create_index
+
+revision = 12
+description = "index behind the registered companies listing's email sort key"
+
+def upgrade():
+    create_index("ix_company_auth_email_id", "company_auth", ["email", "id"])
@@ -0,0 +1,8 @@
+from app.migrations.operations import add_column
+
+revision = 13
+description = "job_details.updated_at and company_profile.updated_at for applied-jobs ETags"
+
+def upgrade():
+    add_column("job_details", "updated_at", "TIMESTAMP")
+    add_column("company_profile", "updated_at", "TIMESTAMP")
@@ -0,0 +1,7 @@
+from app.migrations.operations import create_index
+
+revision = 14
+description = "(used, id) index for the sweeper's used reset token pass"
+
+def upgrade():
+    create_index("ix_password_reset_token_used_id", "password_reset_token", ["used", "id"])
@@ -0,0 +1,21 @@
+from app.extensions import db
+from app.migrations.operations import create_index, drop_index
+
+revision = 15
+description = "unique otp_verification (email, universityid) so the OTP store can upsert"
+
+def upgrade():
+    # the store replaced the row of an email on every signup, but two concurrent signups could
+    # leave two; only the newest OTP can still be the one the user received
+    db.session.execute(db.text(
+        "DELETE FROM otp_verification WHERE id NOT IN "
+        "(SELECT MAX(id) FROM otp_verification GROUP BY email, universityid)"
+    ))
+    db.session.commit()
+
+    # replaces the plain index from revision 2 under the same name
+    inspector = db.inspect(db.engine)
+    for index in inspector.get_indexes("otp_verification"):
+        if index["name"] == "ix_otp_verification_email_universityid" and not index["unique"]:
+            drop_index("ix_otp_verification_email_universityid")
+    create_index("ix_otp_verification_email_universityid", "otp_verification", ["email", "universityid"], unique=True)
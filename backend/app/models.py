@@ -12,17 +12,31 @@ class adminAuth(db.Model):
     id = db.Column(db.Integer,primary_key = True,nullable = False)
     mailId = db.Column(db.String(255),nullable = False)
     password = db.Column(db.String(255),nullable = False)
+
+    __table_args__ = (db.Index('ix_admin_auth_mailId', 'mailId'),)
 #=============================== univeristy table ==========================================
 class universitytable(db.Model):
     id = db.Column(db.Integer,primary_key = True,nullable = False)
     universityName = db.Column(db.String(500),nullable = False)
     passkey = db.Column(db.String(500),nullable = False)
+    # HMAC of the plain passkey so verification is one indexed lookup plus one hash check
+    passkeyFingerprint = db.Column(db.String(64),nullable = True,index = True)
+
+    # unique so admin uploads can upsert on the name
+    __table_args__ = (db.Index('ix_universitytable_universityName', 'universityName', unique=True),)
 #================================= Student Auth Table ========================================
 class studentAuth(db.Model):
     id = db.Column(db.Integer,primary_key = True)
     mailId = db.Column(db.String(100),nullable = False)
     password = db.Column(db.String(500),nullable=False)
     universityid = db.Column(db.Integer,db.ForeignKey("universitytable.id"),nullable = False)
+
+    # login/signup look up (mailId, universityid); university deletion filters on universityid alone
+    __table_args__ = (
+        db.Index('ix_student_auth_universityid_mailId', 'universityid', 'mailId'),
+        # admin student listing sorted by email
+        db.Index('ix_student_auth_mailId_id', 'mailId', 'id'),
+    )
 #=============================== OTP Verification Table (for both) ===========================    
 class otpVerification(db.Model):
     id = db.Column(db.Integer,primary_key = True)
@@ -30,7 +44,16 @@ class otpVerification(db.Model):
     email = db.Column(db.String(255),nullable = False)
     expires_at = db.Column(db.DateTime, nullable=False)
     created_at = db.Column(db.DateTime, nullable=False)  # Track when OTP was sent
+    attempts = db.Column(db.Integer, nullable=False, default=0, server_default="0")  # wrong guesses
     universityid = db.Column(db.Integer,db.ForeignKey("universitytable.id"),nullable = False)
+
+    __table_args__ = (
+        # one OTP per email within a university, replaced by an upsert on every signup
+        db.Index('ix_otp_verification_email_universityid', 'email', 'universityid', unique=True),
+        db.Index('ix_otp_verification_universityid', 'universityid'),
+        # sweeper: expired rows picked in expires_at order
+        db.Index('ix_otp_verification_expires_at', 'expires_at'),
+    )
     #validate OTP for 10min then invalidate it
     def __init__(self, email, otp):
         self.email = email
@@ -44,6 +67,13 @@ class companyAuth(db.Model):
     email =db.Column(db.String(255),nullable = False)
     password = db.Column(db.String(255),nullable = False)
     universityid = db.Column(db.Integer,db.ForeignKey("universitytable.id"),nullable = False)
+
+    __table_args__ = (
+        db.Index('ix_company_auth_email_universityid', 'email', 'universityid'),
+        db.Index('ix_company_auth_universityid', 'universityid'),
+        # admin registered companies listing sorted by email
+        db.Index('ix_company_auth_email_id', 'email', 'id'),
+    )
 #=============================== Password Reset Token Table ===========================    
 class passwordResetToken(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -54,6 +84,13 @@ class passwordResetToken(db.Model):
     created_at = db.Column(db.DateTime, nullable=False)
     used = db.Column(db.Boolean, default=False, nullable=False)
     universityid = db.Column(db.Integer, db.ForeignKey("universitytable.id"), nullable=False)
+
+    __table_args__ = (
+        db.Index('ix_password_reset_token_email_universityid_user_type_used', 'email', 'universityid', 'user_type', 'used'),
+        # sweeper: expired rows picked in expires_at order, used rows in id order
+        db.Index('ix_password_reset_token_expires_at', 'expires_at'),
+        db.Index('ix_password_reset_token_used_id', 'used', 'id'),
+    )
     
     def __init__(self, email, user_type, universityid):
         self.email = email
@@ -72,6 +109,15 @@ class CompanyProfile (db.Model):
     location = db.Column(db.String(255),nullable = False)
     about = db.Column(db.Text,nullable = False)
     universityid = db.Column(db.Integer,db.ForeignKey("universitytable.id"),nullable = False)
+    # bumped on every change: the company name is part of the student's applied-jobs ETag
+    updated_at = db.Column(
+        db.DateTime,
+        nullable=True,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc)
+    )
+
+    __table_args__ = (db.Index('ix_company_profile_universityid', 'universityid'),)
 
     jobs = db.relationship(
     "JobDetails",
@@ -88,7 +134,11 @@ class StudentProfile(db.Model):
     github = db.Column(db.String(255), nullable=True)
     linkedin = db.Column(db.String(255), nullable=True)
     resume = db.Column(db.String(500), nullable=True)  # Store file path or name
+    resume_status = db.Column(db.String(20), nullable=True)  # pending, ready or failed (None without a resume)
+    resume_upload = db.Column(db.String(32), nullable=True)  # token of the latest staged resume; older uploads are discarded
     universityid = db.Column(db.Integer,db.ForeignKey("universitytable.id"),nullable = False) 
+
+    __table_args__ = (db.Index('ix_student_profile_universityid', 'universityid'),)
 #===================== Job details ====================================================
 class JobDetails(db.Model):
     id = db.Column(db.Integer,primary_key = True)
@@ -100,6 +150,22 @@ class JobDetails(db.Model):
     enddate = db.Column(db.DateTime,nullable = False)
     companyid = db.Column(db.Integer,db.ForeignKey("company_profile.id"),nullable = False)
     universityid = db.Column(db.Integer,db.ForeignKey("universitytable.id"),nullable = False)
+    # bumped on every change: the job fields are part of the student's applied-jobs ETag
+    updated_at = db.Column(
+        db.DateTime,
+        nullable=True,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc)
+    )
+    # on Postgres the table also has search_vector, a generated tsvector (migration v0010, app/job_search.py)
+
+    __table_args__ = (
+        # student feed: universityid filter walked in id order
+        db.Index('ix_job_details_universityid_id', 'universityid', 'id'),
+        db.Index('ix_job_details_companyid_universityid', 'companyid', 'universityid'),
+        # admin job listing sorted (and split into active/inactive) by enddate
+        db.Index('ix_job_details_enddate_id', 'enddate', 'id'),
+    )
 #======================= job application ============================================
 class JobApplication(db.Model):
     id = db.Column(db.Integer,primary_key = True)
@@ -108,10 +174,36 @@ class JobApplication(db.Model):
     jobid = db.Column(db.Integer,db.ForeignKey("job_details.id"),nullable = False)
     status = db.Column(db.String(255),nullable =False,default = "pending")
     universityid = db.Column(db.Integer,db.ForeignKey("universitytable.id"),nullable = False)
+    # bumped on every change so the student's applied-jobs page can be revalidated by ETag
+    updated_at = db.Column(
+        db.DateTime,
+        nullable=True,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc)
+    )
     
     # Unique constraint to prevent duplicate applications
-    __table_args__ = (db.UniqueConstraint('studentid', 'jobid', name='unique_student_job_application'),)
-
-
-
-
+    __table_args__ = (
+        db.UniqueConstraint('studentid', 'jobid', name='unique_student_job_application'),
+        # company portal: companyid filter walked in id order
+        db.Index('ix_job_application_companyid_id', 'companyid', 'id'),
+        db.Index('ix_job_application_universityid', 'universityid'),
+    )
+#======================= background jobs ==============================================
+class backgroundJob(db.Model):
+    id = db.Column(db.String(32),primary_key = True)
+    kind = db.Column(db.String(100),nullable = False)
+    status = db.Column(db.String(20),nullable = False,default = "queued")  # queued, running, succeeded, failed
+    processed = db.Column(db.Integer,nullable = False,default = 0)
+    total = db.Column(db.Integer,nullable = True)
+    result = db.Column(db.JSON,nullable = True)  # counts and per-row errors reported by the job
+    message = db.Column(db.Text,nullable = True)
+    created_at = db.Column(db.DateTime,nullable = False)
+    updated_at = db.Column(db.DateTime,nullable = False)
+    finished_at = db.Column(db.DateTime,nullable = True)
+#======================= schema version ==============================================
+class schemaVersion(db.Model):
+    __tablename__ = "schema_version"
+    version = db.Column(db.Integer,primary_key = True,autoincrement = False)
+    description = db.Column(db.String(255),nullable = False)
+    applied_at = db.Column(db.DateTime,nullable = False)
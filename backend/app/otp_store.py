@@ -0,0 +1,212 @@
+"""
+Signup OTP state
+
+An OTP record is {"otp", "createdAt", "expiresAt", "nonce"} (times as epoch seconds), keyed
+by email within a university. The OTP is valid until expiresAt (OTP_TTL_SECONDS); the record
+itself is kept for OTP_RETENTION_SECONDS so a resend can still find it afterwards, then
+expires on its own. Wrong guesses are counted per record and the record is dropped once
+OTP_MAX_ATTEMPTS is reached.
+
+Backends (OTP_STORE_BACKEND):
+    memory    Per-process dict with expiry. Only for a single process (local runs, tests):
+              an OTP issued by one worker is unknown to the others.
+    shared    The shared key-value store (SHARED_STORE_URL); one SET per signup.
+    database  The otpVerification table, one row per email replaced by a single upsert
+              (INSERT ... ON CONFLICT) per signup.
+"""
+import json
+import secrets
+import threading
+import time
+from datetime import datetime, timezone
+from flask import current_app
+
+# check_otp outcome -> (error message, status code) for the verify routes
+OTP_ERRORS = {
+    "missing": ("OTP not found or expired", 404),
+    "expired": ("OTP expired", 400),
+    "invalid": ("Invalid OTP", 400),
+    "locked": ("Too many incorrect attempts. Please signup again.", 429)
+}
+
+def new_otp_record(otp, ttl):
+    now = time.time()
+    return {"otp": otp, "createdAt": now, "expiresAt": now + ttl, "nonce": secrets.token_hex(8)}
+
+#============================== backends ===============================================
+class InProcessOTPStore:
+    """OTP records with expiry in a dict local to one worker process"""
+
+    # expired records are swept on writes, at most this often (seconds)
+    SWEEP_INTERVAL = 60
+
+    def __init__(self):
+        self._records = {}
+        self._lock = threading.Lock()
+        self._swept_at = time.monotonic()
+
+    def put(self, email, university_id, record, retention):
+        now = time.monotonic()
+        with self._lock:
+            if now - self._swept_at >= self.SWEEP_INTERVAL:
+                self._records = {key: entry for key, entry in self._records.items() if entry[1] > now}
+                self._swept_at = now
+            self._records[(str(university_id), email)] = (dict(record, attempts=0), now + retention)
+
+    def get(self, email, university_id):
+        key = (str(university_id), email)
+        with self._lock:
+            entry = self._records.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self._records[key]
+                return None
+            return dict(entry[0])
+
+    def add_attempt(self, email, university_id, record):
+        with self._lock:
+            entry = self._records.get((str(university_id), email))
+            if entry is None or entry[0]["nonce"] != record["nonce"]:
+                return 0
+            entry[0]["attempts"] += 1
+            return entry[0]["attempts"]
+
+    def delete(self, email, university_id):
+        with self._lock:
+            self._records.pop((str(university_id), email), None)
+
+class SharedOTPStore:
+    """OTP records in the shared key-value store, visible to every worker"""
+
+    def __init__(self, client, prefix="startin:otp:"):
+        self.client = client
+        self.prefix = prefix
+
+    def name(self, email, university_id):
+        return f"{self.prefix}{university_id}:{email}"
+
+    def put(self, email, university_id, record, retention):
+        # a plain SET replaces any earlier OTP atomically; its attempt counter is keyed by the nonce
+        self.client.set(self.name(email, university_id), json.dumps(record), ex=int(retention))
+
+    def get(self, email, university_id):
+        raw = self.client.get(self.name(email, university_id))
+        return json.loads(raw) if raw is not None else None
+
+    def add_attempt(self, email, university_id, record):
+        counter = f"{self.name(email, university_id)}:{record['nonce']}:attempts"
+        attempts = self.client.incr(counter)
+        if attempts == 1:
+            self.client.expire(counter, max(1, int(record["expiresAt"] - time.time()) + 1))
+        return attempts
+
+    def delete(self, email, university_id):
+        self.client.delete(self.name(email, university_id))
+
+class DatabaseOTPStore:
+    """OTP records in the otpVerification table (rows past retention are removed by the sweeper)"""
+
+    def put(self, email, university_id, record, retention):
+        from app.models import db, otpVerification
+        if db.engine.dialect.name == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+
+        values = {
+            "email": email,
+            "universityid": university_id,
+            "otp": record["otp"],
+            "created_at": datetime.fromtimestamp(record["createdAt"], timezone.utc),
+            "expires_at": datetime.fromtimestamp(record["expiresAt"], timezone.utc),
+            "attempts": 0
+        }
+        statement = insert(otpVerification).values(values)
+        # the row keeps its id, so wrong guesses are counted against (id, otp), see add_attempt
+        statement = statement.on_conflict_do_update(
+            index_elements=[otpVerification.email, otpVerification.universityid],
+            set_={column: statement.excluded[column] for column in ("otp", "created_at", "expires_at", "attempts")}
+        )
+        db.session.execute(statement)
+        db.session.commit()
+
+    def get(self, email, university_id):
+        from app.models import otpVerification
+        row = otpVerification.query.filter_by(email=email, universityid=university_id).first()
+        if row is None or row.attempts >= current_app.config["OTP_MAX_ATTEMPTS"]:
+            return None
+        created_at, expires_at = (
+            (moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)).timestamp()
+            for moment in (row.created_at, row.expires_at)
+        )
+        if created_at + current_app.config["OTP_RETENTION_SECONDS"] <= time.time():
+            return None
+        return {"otp": row.otp, "createdAt": created_at, "expiresAt": expires_at, "nonce": str(row.id), "attempts": row.attempts}
+
+    def add_attempt(self, email, university_id, record):
+        from app.models import db, otpVerification
+        table = otpVerification.__table__
+        attempts = db.session.execute(
+            db.update(table)
+            .where(table.c.id == int(record["nonce"]), table.c.otp == record["otp"])
+            .values(attempts=table.c.attempts + 1)
+            .returning(table.c.attempts)
+        ).scalar()
+        db.session.commit()
+        return attempts or 0
+
+    def delete(self, email, university_id):
+        from app.models import db, otpVerification
+        otpVerification.query.filter_by(email=email, universityid=university_id).delete()
+        db.session.commit()
+
+def get_otp_store():
+    """Return the app's OTP store, chosen by OTP_STORE_BACKEND ("memory", "shared" or "database")"""
+    store = current_app.extensions.get("otp_store")
+    if store is None:
+        backend = current_app.config.get("OTP_STORE_BACKEND")
+        if backend == "shared":
+            from app.shared_store import get_shared_client
+            store = SharedOTPStore(get_shared_client())
+        elif backend == "memory":
+            store = InProcessOTPStore()
+        else:
+            store = DatabaseOTPStore()
+        current_app.extensions["otp_store"] = store
+    return store
+
+#============================== signup flow ============================================
+def issue_otp(email, university_id, otp):
+    """Store a new OTP for an email, replacing any earlier one (and its attempt count)"""
+    record = new_otp_record(otp, current_app.config["OTP_TTL_SECONDS"])
+    get_otp_store().put(email, university_id, record, current_app.config["OTP_RETENTION_SECONDS"])
+    return record
+
+def find_otp(email, university_id):
+    """Return the OTP record of an email, or None once it is gone"""
+    return get_otp_store().get(email, university_id)
+
+def check_otp(email, university_id, otp):
+    """
+    Check a submitted OTP
+
+    Returns:
+        str: 'valid', 'missing', 'expired', 'invalid' or 'locked' (too many wrong guesses;
+        the record is dropped so the user has to sign up again)
+    """
+    store = get_otp_store()
+    record = store.get(email, university_id)
+    if record is None:
+        return "missing"
+    if time.time() > record["expiresAt"]:
+        return "expired"
+    if secrets.compare_digest(str(record["otp"]), str(otp)):
+        return "valid"
+    if store.add_attempt(email, university_id, record) >= current_app.config["OTP_MAX_ATTEMPTS"]:
+        store.delete(email, university_id)
+        return "locked"
+    return "invalid"
+
+def discard_otp(email, university_id):
+    get_otp_store().delete(email, university_id)
@@ -0,0 +1,178 @@
+import base64
+import json
+from datetime import datetime
+from sqlalchemy import DateTime, func, literal, or_, select, tuple_
+from app.extensions import db
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+# below this many estimated rows an exact count is cheap enough to run instead
+EXACT_COUNT_THRESHOLD = 1000
+
+def encode_cursor(values):
+    """Encode the key values of the last row of a page into an opaque cursor string"""
+    raw = json.dumps(
+        [value.isoformat() if isinstance(value, datetime) else value for value in values],
+        separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor produced by encode_cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    return values
+
+def cursor_value(column, value):
+    """Turn a decoded cursor value back into a bound parameter of the column's type"""
+    if isinstance(column.type, DateTime) and isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            raise ValueError("Invalid cursor")
+    return literal(value, column.type)
+
+def get_page_args(data, default_limit=DEFAULT_PAGE_SIZE, max_limit=MAX_PAGE_SIZE):
+    """
+    Read pagination arguments from a request body or query string
+
+    Args:
+        data: dict-like source (request JSON or request.args)
+        default_limit: Page size used when none is given
+        max_limit: Upper bound on the page size a client can ask for
+
+    Returns:
+        tuple: (cursor: list or None, limit: int)
+
+    Raises:
+        ValueError: If the cursor or limit is invalid
+    """
+    cursor = data.get("cursor")
+    limit = data.get("limit", default_limit)
+
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid limit")
+    if limit < 1:
+        raise ValueError("Invalid limit")
+
+    return (decode_cursor(cursor) if cursor else None), min(limit, max_limit)
+
+def keyset_page(query, key_columns, cursor, limit, descending=False):
+    """
+    Fetch one page of a query using keyset (cursor) pagination
+
+    Rows are ordered by key_columns, which must together be unique (end with the primary key).
+    Only limit + 1 rows are read, so the cost of a page does not grow with the table.
+
+    Args:
+        query: SQLAlchemy query with filters already applied
+        key_columns: Columns the page is ordered and keyed on
+        cursor: Decoded cursor values from the previous page, or None for the first page
+        limit: Page size
+        descending: Walk the key columns from highest to lowest
+
+    Returns:
+        tuple: (rows: list, next_cursor: str or None)
+    """
+    if cursor is not None:
+        if len(cursor) != len(key_columns):
+            raise ValueError("Invalid cursor")
+        values = [cursor_value(column, value) for column, value in zip(key_columns, cursor)]
+        keys = key_columns[0] if len(key_columns) == 1 else tuple_(*key_columns)
+        values = values[0] if len(key_columns) == 1 else tuple_(*values)
+        query = query.filter(keys < values if descending else keys > values)
+
+    order = [column.desc() if descending else column.asc() for column in key_columns]
+    rows = query.order_by(*order).limit(limit + 1).all()
+
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, column.key) for column in key_columns)
+
+def get_sort_arg(data, sorts, default):
+    """
+    Read the sort key from a request (sort=name or sort=-name for descending)
+
+    Args:
+        data: dict-like source (request JSON or request.args)
+        sorts: Map of sort name to key columns; each list must be backed by an index
+            and end with a unique column so it can key a cursor
+        default: Sort name used when none is given
+
+    Returns:
+        tuple: (key_columns: list, descending: bool)
+
+    Raises:
+        ValueError: If the sort name is not one of sorts
+    """
+    sort = data.get("sort") or default
+    descending = sort.startswith("-")
+    name = sort[1:] if descending else sort
+    if name not in sorts:
+        raise ValueError(f"Invalid sort, expected one of: {', '.join(sorts)}")
+    return sorts[name], descending
+
+def search_filter(columns, term):
+    """Case-insensitive substring match of term against any of columns (LIKE wildcards escaped)"""
+    return or_(*[column.icontains(term, autoescape=True) for column in columns])
+
+def estimated_count(query):
+    """
+    Row count of a query, estimated where an exact count would be expensive
+
+    On PostgreSQL the planner's row estimate is read with EXPLAIN, which costs no table scan;
+    small estimates are replaced by an exact count. Other databases always count exactly.
+
+    Returns:
+        tuple: (count: int, estimated: bool)
+    """
+    statement = query.order_by(None).statement
+    if db.engine.dialect.name == "postgresql":
+        compiled = statement.compile(dialect=db.engine.dialect)
+        plan = db.session.connection().exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+        ).scalar()
+        estimate = int(plan[0]["Plan"]["Plan Rows"])
+        if estimate > EXACT_COUNT_THRESHOLD:
+            return estimate, True
+
+    count = db.session.execute(select(func.count()).select_from(statement.subquery())).scalar()
+    return count, False
+
+def listing_page(query, data, sorts, default_sort):
+    """
+    One page of an admin listing: sort, keyset cursor and (on the first page) a total count
+
+    Filters are applied to query by the caller before it is passed in.
+
+    Returns:
+        dict: rows, nextCursor, total and totalEstimated (total is None after the first page)
+
+    Raises:
+        ValueError: If the sort, cursor or limit is invalid
+    """
+    key_columns, descending = get_sort_arg(data, sorts, default_sort)
+    cursor, limit = get_page_args(data)
+
+    total, estimated = (None, False) if cursor is not None else estimated_count(query)
+    rows, next_cursor = keyset_page(query, key_columns, cursor, limit, descending)
+    return {
+        "rows": rows,
+        "nextCursor": next_cursor,
+        "total": total,
+        "totalEstimated": estimated
+    }
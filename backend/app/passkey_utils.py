@@ -0,0 +1,50 @@
+import hmac
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app
+from werkzeug.security import generate_password_hash
+
+# below this many passkeys the cost of starting worker threads outweighs the gain
+PARALLEL_HASH_THRESHOLD = 32
+
+def passkey_fingerprint(passkey: str):
+    """
+    Build the keyed lookup fingerprint for a plain university passkey
+
+    The fingerprint is an HMAC-SHA256 of the passkey, so it can be stored next to
+    the salted hash and indexed without revealing the passkey itself.
+
+    Args:
+        passkey: Plain text passkey as entered by the user or uploaded by the admin
+
+    Returns:
+        str: 64 character hex digest
+
+    Raises:
+        ValueError: If PASSKEY_FINGERPRINT_KEY is not set
+    """
+    key = current_app.config.get("PASSKEY_FINGERPRINT_KEY")
+    if not key:
+        raise ValueError("PASSKEY_FINGERPRINT_KEY must be set to fingerprint university passkeys")
+    return hmac.new(key.encode("utf-8"), passkey.encode("utf-8"), hashlib.sha256).hexdigest()
+
+def hash_passkeys(passkeys):
+    """
+    Hash many plain passkeys with generate_password_hash, spread over a thread pool
+
+    hashlib's scrypt and pbkdf2 release the GIL, so threads hash in parallel. Threads (not
+    forked processes) because this runs inside a background job of a multi-threaded worker,
+    where a fork would copy locks held by other threads and the open DB/HTTP sockets.
+
+    Args:
+        passkeys: List of plain text passkeys
+
+    Returns:
+        list: Hashes in the same order as passkeys
+    """
+    workers = min(current_app.config.get("PASSKEY_HASH_WORKERS", 1), len(passkeys))
+    if workers <= 1 or len(passkeys) < PARALLEL_HASH_THRESHOLD:
+        return [generate_password_hash(passkey) for passkey in passkeys]
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="passkey-hash") as pool:
+        return list(pool.map(generate_password_hash, passkeys))
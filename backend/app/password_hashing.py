@@ -0,0 +1,85 @@
+"""
+Password hashing service
+
+Hashing and verification run on a small per-process thread pool (hashlib's scrypt and
+pbkdf2 release the GIL) with at most PASSWORD_HASH_WORKERS hashes in flight. Requests
+wait up to PASSWORD_HASH_QUEUE_TIMEOUT seconds for a slot and then get a 503, so a login
+peak cannot take every worker thread and starve the rest of the API.
+
+The algorithm and its cost come from PASSWORD_HASH_METHOD (a werkzeug method string such
+as 'scrypt:32768:8:1' or 'pbkdf2:sha256:600000'). Hashes stored under other parameters
+are upgraded the next time their owner logs in successfully.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from flask import current_app
+from werkzeug.security import check_password_hash, generate_password_hash
+
+class HashingBusy(RuntimeError):
+    """Raised when no hashing slot frees up within PASSWORD_HASH_QUEUE_TIMEOUT"""
+    status_code = 503
+
+_executor = None
+_executor_pid = None
+_slots = None
+_executor_lock = threading.Lock()
+
+def get_hash_executor():
+    """Process-wide hashing pool and its slot semaphore, rebuilt after a fork"""
+    global _executor, _executor_pid, _slots
+    with _executor_lock:
+        if _executor is None or _executor_pid != os.getpid():
+            workers = max(1, current_app.config["PASSWORD_HASH_WORKERS"])
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+            _slots = threading.BoundedSemaphore(workers)
+            _executor_pid = os.getpid()
+        return _executor, _slots
+
+def run_hashing(func, *args):
+    executor, slots = get_hash_executor()
+    if not slots.acquire(timeout=current_app.config["PASSWORD_HASH_QUEUE_TIMEOUT"]):
+        raise HashingBusy("Too many sign-ins right now, please try again in a moment")
+    try:
+        return executor.submit(func, *args).result()
+    finally:
+        slots.release()
+
+@lru_cache(maxsize=None)
+def method_prefix(method: str):
+    # the 'scrypt:32768:8:1' part werkzeug stores in front of the salt, with defaults filled in
+    return generate_password_hash("", method=method, salt_length=1).split("$", 1)[0]
+
+def needs_rehash(stored_hash: str, method: str):
+    return stored_hash.split("$", 1)[0] != method_prefix(method)
+
+def check_and_upgrade(stored_hash, password, method):
+    if not check_password_hash(stored_hash, password):
+        return False, None
+    if not needs_rehash(stored_hash, method):
+        return True, None
+    return True, generate_password_hash(password, method=method)
+
+def hash_password(password: str):
+    """
+    Hash a new password with PASSWORD_HASH_METHOD
+
+    Raises:
+        HashingBusy: If every hashing slot stays taken
+    """
+    return run_hashing(generate_password_hash, password, current_app.config["PASSWORD_HASH_METHOD"])
+
+def verify_password(stored_hash: str, password: str):
+    """
+    Check a password against its stored hash
+
+    Returns:
+        tuple: (valid: bool, upgraded_hash: str or None). upgraded_hash is set when the
+        password is valid but was stored under other parameters than PASSWORD_HASH_METHOD;
+        the caller saves it in place of the old hash.
+
+    Raises:
+        HashingBusy: If every hashing slot stays taken
+    """
+    return run_hashing(check_and_upgrade, stored_hash, password, current_app.config["PASSWORD_HASH_METHOD"])
@@ -0,0 +1,158 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from flask import current_app, jsonify, request
+
+# rule -> {key: "capacity/seconds"}. Keys: 'ip' (client address), 'account' (email within a
+# university) and 'university' (every request naming that university). A bucket holds
+# `capacity` requests and refills at capacity/seconds per second.
+RATE_LIMIT_RULES = {
+    "login": {"ip": "30/60", "account": "5/60"},
+    "signup": {"ip": "10/300", "account": "3/300", "university": "300/60"},
+    "otp": {"ip": "20/300", "account": "5/300"},
+    "passkey": {"ip": "10/60"}
+}
+
+def parse_limit(limit):
+    capacity, seconds = limit.split("/")
+    return int(capacity), float(seconds)
+
+#============================== backends ===============================================
+class InProcessBuckets:
+    """Token buckets local to one worker process; least recently used keys are dropped past max_keys"""
+
+    def __init__(self, max_keys=10000):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, limits):
+        """
+        Take one token from every bucket, or from none of them when one is empty
+
+        Args:
+            limits: (key, capacity, seconds) of each bucket
+
+        Returns:
+            float: 0 when allowed, otherwise the seconds until every bucket has a token again
+        """
+        now = time.monotonic()
+        with self._lock:
+            refilled = []
+            wait = 0
+            for key, capacity, seconds in limits:
+                rate = capacity / seconds
+                tokens, updated = self._buckets.get(key, (capacity, now))
+                tokens = min(capacity, tokens + (now - updated) * rate)
+                if tokens < 1:
+                    wait = max(wait, (1 - tokens) / rate)
+                refilled.append((key, tokens))
+            for key, tokens in refilled:
+                self._buckets[key] = (tokens - 1 if not wait else tokens, now)
+                self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return wait
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+class SharedBuckets:
+    """
+    Limits shared by every worker, kept in the shared key-value store
+
+    The store only offers incr/decr/expire, so each bucket is approximated by a fixed window
+    of `seconds` that admits `capacity` requests.
+    """
+
+    def __init__(self, client, prefix="startin:ratelimit:"):
+        self.client = client
+        self.prefix = prefix
+
+    def take(self, limits):
+        """Count the request in every window; when one is over its limit the counts are taken back"""
+        now = time.time()
+        names = []
+        wait = 0
+        for key, capacity, seconds in limits:
+            name = f"{self.prefix}{key}:{int(now // seconds)}"
+            count = self.client.incr(name)
+            if count == 1:
+                self.client.expire(name, int(seconds) + 1)
+            names.append(name)
+            if count > capacity:
+                wait = max(wait, seconds - now % seconds)
+        if wait:
+            for name in names:
+                self.client.decr(name)
+        return wait
+
+def get_buckets():
+    """Return the app's rate limit store, chosen by RATE_LIMIT_BACKEND ("memory" or "shared")"""
+    buckets = current_app.extensions.get("rate_limit")
+    if buckets is None:
+        if current_app.config.get("RATE_LIMIT_BACKEND") == "shared":
+            from app.shared_store import get_shared_client
+            buckets = SharedBuckets(get_shared_client())
+        else:
+            buckets = InProcessBuckets(current_app.config.get("RATE_LIMIT_MAX_KEYS", 10000))
+        current_app.extensions["rate_limit"] = buckets
+    return buckets
+
+#============================== request keys ===========================================
+def client_ip():
+    """
+    Address of the client, taken from X-Forwarded-For when RATE_LIMIT_PROXY_HOPS proxies
+    (e.g. Vercel's edge) sit in front of the app. Only the entry added by the nearest
+    trusted proxy is used, since anything left of it can be set by the client.
+    """
+    hops = current_app.config.get("RATE_LIMIT_PROXY_HOPS", 0)
+    forwarded = [address.strip() for address in request.headers.get("X-Forwarded-For", "").split(",") if address.strip()]
+    if hops and forwarded:
+        return forwarded[-min(hops, len(forwarded))]
+    return request.remote_addr or "unknown"
+
+def request_keys(rule):
+    """Bucket keys of the current request for each key type of a rule (types without a value are skipped)"""
+    body = request.get_json(silent=True)
+    body = body if isinstance(body, dict) else {}
+    email = str(body.get("email") or "").strip().lower()
+    university_id = str(body.get("universityId") or "").strip()
+
+    values = {
+        "ip": client_ip(),
+        "account": f"{university_id}:{email}" if email else None,
+        "university": university_id or None
+    }
+    for key_type, limit in RATE_LIMIT_RULES[rule].items():
+        if values[key_type]:
+            yield f"{rule}:{key_type}:{values[key_type]}", limit
+
+def rate_limit(rule):
+    """
+    Reject requests over the rule's limits with a 429, before the view does any work
+
+    Args:
+        rule: Name of a rule in RATE_LIMIT_RULES
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method == "OPTIONS" or not current_app.config.get("RATE_LIMIT_ENABLED", True):
+                return view(*args, **kwargs)
+
+            # a request refused by one bucket uses up none of the others
+            wait = get_buckets().take([(key, *parse_limit(limit)) for key, limit in request_keys(rule)])
+            if wait:
+                retry_after = max(1, math.ceil(wait))
+                return jsonify({
+                    "success": False,
+                    "message": f"Too many attempts, please try again in {retry_after} seconds"
+                }), 429, {"Retry-After": str(retry_after)}
+
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,23 @@
+from flask import current_app
+
+def get_shared_client():
+    """
+    Return the client for the shared key-value store (Redis protocol)
+
+    A client object placed in config["SHARED_STORE_CLIENT"] is used as-is, so tests or local
+    runs can plug in a stand-in exposing the same get/set/delete/incr/decr/expire methods.
+    Otherwise a redis client is built once from SHARED_STORE_URL (redis is an optional dependency).
+    """
+    client = current_app.config.get("SHARED_STORE_CLIENT")
+    if client is not None:
+        return client
+
+    client = current_app.extensions.get("shared_store")
+    if client is None:
+        url = current_app.config.get("SHARED_STORE_URL")
+        if not url:
+            raise ValueError("SHARED_STORE_URL must be set to use the shared store")
+        import redis
+        client = redis.Redis.from_url(url)
+        current_app.extensions["shared_store"] = client
+    return client
@@ -1,9 +1,59 @@
 import os
-from storage3 import create_client as create_storage_client
+import tempfile
+import threading
+from functools import lru_cache
+from urllib.parse import quote
 from werkzeug.utils import secure_filename
 
-def get_storage_client(use_service_key=True):
-    """Initialize and return Supabase Storage client"""
+# uploads are copied to their staging file in chunks of this size
+UPLOAD_CHUNK_BYTES = 64 * 1024
+# leading bytes a file of each content type starts with; the declared type of an upload
+# is only trusted when its content matches
+CONTENT_SIGNATURES = {
+    'application/pdf': (b"%PDF-",),
+    'application/msword': (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1",),  # OLE compound file
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': (b"PK\x03\x04",),  # ZIP
+}
+
+_clients = {}
+_clients_pid = None
+_clients_lock = threading.Lock()
+
+@lru_cache(maxsize=None)
+def pooled_client_class():
+    """
+    Storage client class whose HTTP session keeps connections alive between calls
+
+    storage3 and httpx are imported on first use rather than with this module, so only
+    requests that actually talk to storage pay for loading them.
+    """
+    import httpx
+    from storage3 import SyncStorageClient
+    from storage3.utils import SyncClient
+
+    # keep-alive pool shared by every storage call of a worker process
+    pool_limits = httpx.Limits(
+        max_connections=int(os.getenv("SUPABASE_POOL_MAX_CONNECTIONS", 10)),
+        max_keepalive_connections=int(os.getenv("SUPABASE_POOL_MAX_KEEPALIVE", 5)),
+        keepalive_expiry=float(os.getenv("SUPABASE_POOL_KEEPALIVE_SECONDS", 60))
+    )
+
+    class PooledStorageClient(SyncStorageClient):
+        def _create_session(self, base_url, headers, timeout, verify=True):
+            return SyncClient(
+                base_url=base_url,
+                headers=headers,
+                timeout=timeout,
+                verify=bool(verify),
+                follow_redirects=True,
+                http2=True,
+                limits=pool_limits
+            )
+
+    return PooledStorageClient
+
+def build_storage_client(use_service_key=True):
+    """Build a new Supabase Storage client from environment variables"""
     url = os.getenv("SUPABASE_URL")
     
     # Use service key for uploads/deletes to bypass RLS
@@ -24,55 +74,146 @@ def get_storage_client(use_service_key=True):
         "apiKey": key,
         "Authorization": f"Bearer {key}"
     }
-    return create_storage_client(storage_url, headers, is_async=False)
+    return pooled_client_class()(storage_url, headers)
+
+def get_storage_client(use_service_key=True):
+    """
+    Return the process-wide Supabase Storage client for a key type
 
-def upload_file_to_supabase(file, folder: str, filename_prefix: str = ""):
+    Clients are built once per process and reused, so calls share warm keep-alive
+    connections instead of paying a new TLS handshake. A forked worker notices the pid
+    change and builds its own clients rather than sharing the parent's sockets.
     """
-    Upload file to Supabase Storage
+    global _clients_pid
+    key_type = "service" if use_service_key else "anon"
     
+    with _clients_lock:
+        if _clients_pid != os.getpid():
+            _clients.clear()
+            _clients_pid = os.getpid()
+        
+        client = _clients.get(key_type)
+        if client is None:
+            client = build_storage_client(use_service_key)
+            _clients[key_type] = client
+        return client
+
+def reset_storage_clients():
+    """Close and forget the cached clients (e.g. after the Supabase keys change)"""
+    global _clients_pid
+    with _clients_lock:
+        if _clients_pid == os.getpid():
+            for client in _clients.values():
+                client.aclose()
+        _clients.clear()
+        _clients_pid = None
+
+class UploadRejected(ValueError):
+    """An upload broke a size or content-type limit; nothing was sent to storage"""
+
+    def __init__(self, message, status_code=400):
+        super().__init__(message)
+        self.status_code = status_code
+
+def upload_content_type(file, allowed_types=None):
+    """
+    Content type an upload will be stored with
+
+    Raises:
+        UploadRejected: If it is not one of allowed_types
+    """
+    content_type = file.mimetype or "application/octet-stream"
+    if allowed_types is not None and content_type not in allowed_types:
+        raise UploadRejected(f"Unsupported file type: {content_type}", 415)
+    return content_type
+
+def copy_upload(file, target, max_bytes=None, signatures=None):
+    """
+    Copy an uploaded file into target chunk by chunk
+
     Args:
-        file: File object from request.files
-        folder: Folder path in the bucket (e.g., 'resumes', 'universities')
-        filename_prefix: Prefix to add to filename (e.g., student_id)
+        signatures: Byte strings the file may start with (None = any content)
+
+    Returns:
+        int: Bytes copied
+
+    Raises:
+        UploadRejected: As soon as more than max_bytes have been read, or when the file does
+            not start with one of signatures
+    """
+    stream = getattr(file, "stream", file)
+    size = 0
+    
+    while True:
+        chunk = stream.read(UPLOAD_CHUNK_BYTES)
+        if size == 0 and signatures is not None and not chunk.startswith(signatures):
+            raise UploadRejected("File content does not match its type", 415)
+        if not chunk:
+            return size
+        size += len(chunk)
+        if max_bytes is not None and size > max_bytes:
+            raise UploadRejected(f"File is larger than {max_bytes // (1024 * 1024)} MB", 413)
+        target.write(chunk)
+
+def stage_upload(file, allowed_types=None, max_bytes=None, prefix="upload_"):
+    """
+    Check an upload against its limits and save it to a temporary file for a background job
+
+    Args:
+        prefix: Start of the temporary file's name (in tempfile.gettempdir())
+
+    Returns:
+        tuple: (temporary file path, content type)
+
+    Raises:
+        UploadRejected: If the file breaks a limit or its content does not match its declared
+            type (for types in CONTENT_SIGNATURES); nothing is left on disk
+    """
+    content_type = upload_content_type(file, allowed_types)
+    handle, path = tempfile.mkstemp(prefix=prefix)
+    try:
+        with os.fdopen(handle, "wb") as target:
+            copy_upload(file, target, max_bytes, CONTENT_SIGNATURES.get(content_type))
+    except Exception:
+        os.remove(path)
+        raise
+    return path, content_type
+
+def storage_file_path(folder: str, filename: str, filename_prefix: str = ""):
+    """Path in the bucket for an uploaded file (e.g. resumes/<student_id>_<filename>)"""
+    # Secure the filename
+    original_filename = secure_filename(filename)
+    
+    # Create unique filename with prefix
+    if filename_prefix:
+        filename = f"{filename_prefix}_{original_filename}"
+    else:
+        filename = original_filename
+    
+    return f"{folder}/{filename}"
+
+def put_file_in_supabase(file_path: str, body, content_type: str):
+    """Write body to file_path in one upsert request, replacing any existing file"""
+    # Use service key to bypass RLS for uploads
+    storage = get_storage_client(use_service_key=True)
+    bucket = os.getenv("SUPABASE_BUCKET", "uploads")
+    storage.from_(bucket).upload(
+        file_path,
+        body,
+        {"content-type": content_type, "upsert": "true"}
+    )
+
+def upload_path_to_supabase(path: str, file_path: str, content_type: str):
+    """
+    Upload a file saved by stage_upload to file_path in Supabase Storage
     
     Returns:
         tuple: (success: bool, file_path: str or error_message: str)
     """
     try:
-        # Use service key to bypass RLS for uploads
-        storage = get_storage_client(use_service_key=True)
-        bucket = os.getenv("SUPABASE_BUCKET", "uploads")
-        
-        # Secure the filename
-        original_filename = secure_filename(file.filename)
-        
-        # Create unique filename with prefix
-        if filename_prefix:
-            filename = f"{filename_prefix}_{original_filename}"
-        else:
-            filename = original_filename
-        
-        # Create full path in bucket
-        file_path = f"{folder}/{filename}"
-        
-        # Read file content
-        file_content = file.read()
-        
-        # Try to remove existing file first (if it exists)
-        try:
-            storage.from_(bucket).remove([file_path])
-        except:
-            pass  # File might not exist, which is fine
-        
-        # Upload to Supabase Storage
-        response = storage.from_(bucket).upload(
-            file_path,
-            file_content
-        )
-        
-        # Return the path that was uploaded
+        with open(path, "rb", buffering=0) as body:  # FileIO, streamed by storage3
+            put_file_in_supabase(file_path, body, content_type)
         return True, file_path
-        
     except Exception as e:
         return False, str(e)
 
@@ -99,25 +240,26 @@ def delete_file_from_supabase(file_path: str):
     except Exception as e:
         return False, str(e)
 
+@lru_cache(maxsize=4096)
+def public_file_url(base_url: str, bucket: str, file_path: str):
+    """Public object URL, built the same way storage3's get_public_url does (memoized per path)"""
+    return f"{base_url.rstrip('/')}/storage/v1/object/public/{bucket}/{quote(file_path)}"
+
 def get_file_url_from_supabase(file_path: str):
     """
     Get public URL for a file in Supabase Storage
     
+    Public URLs are plain string formatting, so they are built locally without a storage client.
+    
     Args:
         file_path: Full path to file in bucket (e.g., 'resumes/student_123_resume.pdf')
     
     Returns:
-        str: Public URL of the file
+        str: Public URL of the file, or None if SUPABASE_URL is not set
     """
-    try:
-        # Can use regular key for reading public URLs
-        storage = get_storage_client(use_service_key=False)
-        bucket = os.getenv("SUPABASE_BUCKET", "uploads")
-        
-        # Get public URL
-        url = storage.from_(bucket).get_public_url(file_path)
-        
-        return url
-        
-    except Exception as e:
+    url = os.getenv("SUPABASE_URL")
+    if not url:
         return None
+    
+    bucket = os.getenv("SUPABASE_BUCKET", "uploads")
+    return public_file_url(url, bucket, file_path)
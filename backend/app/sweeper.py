@@ -0,0 +1,112 @@
+"""
+Sweeper for expired signup OTPs, password reset tokens and abandoned background jobs
+
+Rows are deleted in batches of SWEEP_BATCH_ROWS, each picked through the expires_at
+index and committed on its own, so a large backlog never holds long locks. OTP rows are
+kept until OTP_RETENTION_SECONDS after they were sent (they can still be resent until
+then); reset tokens go once expired or used. Background jobs whose worker stopped sending
+heartbeats are marked failed (see app/jobs.py), and so are the pending resumes they were
+uploading.
+
+Run it with `flask --app run maintenance sweep` (e.g. from cron), or set
+SWEEP_INTERVAL_SECONDS to sweep from a background thread in each worker process.
+"""
+import os
+import threading
+import time
+from datetime import datetime, timezone, timedelta
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from app.extensions import db
+
+maintenance_cli = AppGroup("maintenance", help="Database housekeeping")
+
+def delete_in_batches(model, condition, order_by, batch_rows):
+    """Delete the rows matching condition, batch_rows at a time; returns how many were deleted"""
+    deleted = 0
+    while True:
+        ids = [row.id for row in db.session.query(model.id).filter(condition).order_by(order_by).limit(batch_rows)]
+        if not ids:
+            break
+        deleted += model.query.filter(model.id.in_(ids)).delete(synchronize_session=False)
+        db.session.commit()
+        if len(ids) < batch_rows:
+            break
+    return deleted
+
+def sweep_expired(batch_rows=None):
+    """
+    Delete expired OTPs and expired or used password reset tokens, fail abandoned background jobs
+    and resume uploads
+
+    Returns:
+        dict: Rows deleted (or failed, for abandonedJobs / abandonedResumes) per kind
+            (otps, expiredResetTokens, usedResetTokens, abandonedJobs, abandonedResumes)
+    """
+    from app.models import otpVerification, passwordResetToken
+    from app.jobs import fail_abandoned_jobs
+    from app.StudentProfile.routes import fail_abandoned_resumes
+
+    config = current_app.config
+    batch_rows = batch_rows or config["SWEEP_BATCH_ROWS"]
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    # expires_at is when the OTP stops being valid; the record is kept for resends until retention ends
+    otp_cutoff = now - timedelta(seconds=max(0, config["OTP_RETENTION_SECONDS"] - config["OTP_TTL_SECONDS"]))
+
+    return {
+        "otps": delete_in_batches(
+            otpVerification, otpVerification.expires_at < otp_cutoff, otpVerification.expires_at, batch_rows
+        ),
+        "expiredResetTokens": delete_in_batches(
+            passwordResetToken, passwordResetToken.expires_at < now, passwordResetToken.expires_at, batch_rows
+        ),
+        # what is left after the expired pass is under an hour old, so this stays small;
+        # used = true (not IS TRUE) so the (used, id) index can serve it
+        "usedResetTokens": delete_in_batches(
+            passwordResetToken, passwordResetToken.used == db.true(), passwordResetToken.id, batch_rows
+        ),
+        "abandonedJobs": len(fail_abandoned_jobs()),
+        # after the jobs pass, so resumes of the jobs it just failed are included
+        "abandonedResumes": fail_abandoned_resumes()
+    }
+
+@maintenance_cli.command("sweep")
+@click.option("--batch-rows", type=int, default=None, help="Rows deleted per transaction (default SWEEP_BATCH_ROWS)")
+def sweep_command(batch_rows):
+    """Delete expired OTPs and expired or used password reset tokens, fail abandoned jobs and resume uploads"""
+    deleted = sweep_expired(batch_rows)
+    click.echo(
+        f"Deleted {deleted['otps']} expired OTPs, {deleted['expiredResetTokens']} expired and "
+        f"{deleted['usedResetTokens']} used password reset tokens; "
+        f"marked {deleted['abandonedJobs']} abandoned background jobs and "
+        f"{deleted['abandonedResumes']} resume uploads failed"
+    )
+
+#============================== scheduled sweeps ========================================
+_sweeper_pid = None
+_sweeper_lock = threading.Lock()
+
+def run_sweeper(app, interval):
+    while True:
+        time.sleep(interval)
+        with app.app_context():
+            try:
+                deleted = sweep_expired()
+                app.logger.info("Sweeper deleted %s", deleted)
+            except Exception:
+                db.session.rollback()
+                app.logger.exception("Sweeper run failed")
+            finally:
+                db.session.remove()
+
+def ensure_sweeper(app):
+    """Start this process's sweeper thread if it is not running (threads do not survive a fork)"""
+    global _sweeper_pid
+    with _sweeper_lock:
+        if _sweeper_pid != os.getpid():
+            threading.Thread(
+                target=run_sweeper, args=(app, app.config["SWEEP_INTERVAL_SECONDS"]),
+                name="sweeper", daemon=True
+            ).start()
+            _sweeper_pid = os.getpid()
@@ -1,34 +1,81 @@
-from flask import request, jsonify
+from flask import request, jsonify, current_app
 from . import universityDbUpdate_bp
 from app.models import universitytable
 from app.extensions import db
-import pandas as pd
 import os
 from werkzeug.utils import secure_filename
-from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.security import check_password_hash
+from app.passkey_utils import passkey_fingerprint, hash_passkeys
+from app.cache import invalidate_job_feed
+from app.jobs import submit_job
+from app.rate_limit import rate_limit
+from app.auth import require_auth
+from app.upload_utils import save_upload, check_upload_columns, open_upload_chunks
+from app.pagination import listing_page, search_filter
 
 # Configuration for file uploads
 UPLOAD_FOLDER = 'uploads/universities'
 ALLOWED_EXTENSIONS = {'csv', 'xlsx', 'xls'}
+REQUIRED_COLUMNS = ['universityName', 'passkey']
+# sort keys of the university listing (universityName has a unique index)
+UNIVERSITY_SORTS = {
+    'id': [universitytable.id],
+    'name': [universitytable.universityName]
+}
 
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+def upsert_universities(rows, batch_size=500):
+    """Insert new universities and update the passkey of existing ones with INSERT ... ON CONFLICT"""
+    if db.engine.dialect.name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    
+    for start in range(0, len(rows), batch_size):
+        statement = insert(universitytable).values(rows[start:start + batch_size])
+        statement = statement.on_conflict_do_update(
+            index_elements=[universitytable.universityName],
+            set_={
+                'passkey': statement.excluded.passkey,
+                'passkeyFingerprint': statement.excluded.passkeyFingerprint
+            }
+        )
+        db.session.execute(statement)
+
 @universityDbUpdate_bp.route("/api/admin/universities", methods=['GET'])
 def get_universities():
-    """Get all universities from the database"""
+    """Page through universities (limit, cursor, sort=id|name, search by name)"""
+    data = request.args
+    try:
+        universities_query = universitytable.query.with_entities(universitytable.id, universitytable.universityName)
+        if data.get('search'):
+            universities_query = universities_query.filter(
+                search_filter([universitytable.universityName], data['search'].strip())
+            )
+        
+        page = listing_page(universities_query, data, UNIVERSITY_SORTS, 'id')
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 400
+    
     try:
-        universities = universitytable.query.all()
         universities_list = [{
             'id': uni.id,
             'universityName': uni.universityName,
             'passkey': '********'  # Hide hashed passkey for security
-        } for uni in universities]
+        } for uni in page['rows']]
         
         return jsonify({
             'success': True,
             'universities': universities_list,
-            'count': len(universities_list)
+            'count': len(universities_list),
+            'nextCursor': page['nextCursor'],
+            'total': page['total'],
+            'totalEstimated': page['totalEstimated']
         }), 200
     except Exception as e:
         return jsonify({
@@ -37,8 +84,9 @@ def get_universities():
         }), 500
 
 @universityDbUpdate_bp.route("/api/admin/universities/upload", methods=['POST'])
+@require_auth("admin")
 def upload_universities():
-    """Upload CSV or Excel file to update university database"""
+    """Upload CSV or Excel file to update university database (runs as a background job)"""
     try:
         # Check if file is present in request
         if 'file' not in request.files:
@@ -63,93 +111,97 @@ def upload_universities():
                 'message': 'Invalid file type. Please upload CSV or Excel file'
             }), 400
         
-        # Read the file based on extension
+        # Keep the file past the request and validate its columns before queueing
         filename = secure_filename(file.filename)
-        file_ext = filename.rsplit('.', 1)[1].lower()
+        path = save_upload(file, filename)
         
         try:
-            if file_ext == 'csv':
-                df = pd.read_csv(file)
-            else:  # xlsx or xls
-                df = pd.read_excel(file)
+            check_upload_columns(path, filename, REQUIRED_COLUMNS)
         except Exception as e:
+            os.remove(path)
+            message = str(e) if isinstance(e, ValueError) else f'Error reading file: {str(e)}'
             return jsonify({
                 'success': False,
-                'message': f'Error reading file: {str(e)}'
+                'message': message
             }), 400
         
-        # Validate required columns
-        required_columns = ['universityName', 'passkey']
-        if not all(col in df.columns for col in required_columns):
-            return jsonify({
-                'success': False,
-                'message': f'File must contain columns: {", ".join(required_columns)}'
-            }), 400
+        job_id = submit_job("university_upload", import_universities, path, filename)
+        
+        return jsonify({
+            'success': True,
+            'message': 'University upload started',
+            'jobId': job_id
+        }), 202
         
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({
+            'success': False,
+            'message': f'Error processing file: {str(e)}'
+        }), 500
+
+def import_universities(progress, path, filename):
+    """Background job: upsert every university in a saved upload file"""
+    try:
         # Process the data
         added_count = 0
         updated_count = 0
         errors = []
         
-        for index, row in df.iterrows():
-            try:
-                university_name = str(row['universityName']).strip()
-                passkey = str(row['passkey']).strip()
-                
-                if not university_name or not passkey:
-                    errors.append(f"Row {index + 2}: Empty universityName or passkey")
-                    continue
-                
-                # Hash the passkey before storing
-                hashed_passkey = generate_password_hash(passkey)
-                
-                # Check if university already exists by name (since passkey will be hashed)
-                existing_uni = universitytable.query.filter_by(universityName=university_name).first()
-                
-                if existing_uni:
-                    # Update existing university with new hashed passkey
-                    existing_uni.passkey = hashed_passkey
-                    updated_count += 1
-                else:
-                    # Add new university with hashed passkey
-                    new_uni = universitytable(
-                        universityName=university_name,
-                        passkey=hashed_passkey
-                    )
-                    db.session.add(new_uni)
-                    added_count += 1
+        # Existing names in one query instead of one SELECT per row
+        existing_names = {name for (name,) in db.session.query(universitytable.universityName)}
+        passkeys_by_name = {}  # later rows for the same name win, as before
+        processed = 0
+        
+        chunks = open_upload_chunks(path, filename, REQUIRED_COLUMNS, current_app.config["UPLOAD_CHUNK_ROWS"])
+        for chunk in chunks:
+            for row_number, values in chunk:
+                try:
+                    university_name = str(values['universityName']).strip()
+                    passkey = str(values['passkey']).strip()
+                    
+                    if not university_name or not passkey:
+                        errors.append(f"Row {row_number}: Empty universityName or passkey")
+                        continue
                     
-            except Exception as e:
-                errors.append(f"Row {index + 2}: {str(e)}")
+                    if university_name in existing_names or university_name in passkeys_by_name:
+                        updated_count += 1
+                    else:
+                        added_count += 1
+                    passkeys_by_name[university_name] = passkey
+                        
+                except Exception as e:
+                    errors.append(f"Row {row_number}: {str(e)}")
+            processed += len(chunk)
+            progress.update(processed=processed)
+        
+        # Hash the passkeys before storing (spread across worker processes)
+        names = list(passkeys_by_name)
+        hashed_passkeys = hash_passkeys([passkeys_by_name[name] for name in names])
+        
+        upsert_universities([{
+            'universityName': name,
+            'passkey': hashed_passkey,
+            'passkeyFingerprint': passkey_fingerprint(passkeys_by_name[name])
+        } for name, hashed_passkey in zip(names, hashed_passkeys)])
         
         # Commit changes
         db.session.commit()
         
-        return jsonify({
-            'success': True,
+        return {
             'message': 'Universities updated successfully',
             'added': added_count,
             'updated': updated_count,
             'errors': errors if errors else None
-        }), 200
-        
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({
-            'success': False,
-            'message': f'Error processing file: {str(e)}'
-        }), 500
+        }
+    finally:
+        os.remove(path)
 
 @universityDbUpdate_bp.route("/api/admin/universities/<int:university_id>", methods=['DELETE'])
+@require_auth("admin")
 def delete_university(university_id):
-    """Delete a university by ID and all related records"""
+    """Delete a university by ID and all related records (runs as a background job)"""
     try:
-        # Import all models that have university relationships
-        from app.models import (
-            studentAuth, otpVerification, companyAuth, 
-            CompanyProfile, StudentProfile, JobDetails, JobApplication
-        )
-        
         university = universitytable.query.get(university_id)
         
         if not university:
@@ -158,38 +210,13 @@ def delete_university(university_id):
                 'message': 'University not found'
             }), 404
         
-        # Delete all related records in the correct order (respecting foreign key constraints)
-        # 1. Delete job applications first (depends on jobs, students, companies)
-        JobApplication.query.filter_by(universityid=university_id).delete()
-        
-        # 2. Delete job details (depends on companies)
-        JobDetails.query.filter_by(universityid=university_id).delete()
-        
-        # 3. Delete student profiles
-        StudentProfile.query.filter_by(universityid=university_id).delete()
-        
-        # 4. Delete company profiles
-        CompanyProfile.query.filter_by(universityid=university_id).delete()
-        
-        # 5. Delete student authentication records
-        studentAuth.query.filter_by(universityid=university_id).delete()
-        
-        # 6. Delete company authentication records
-        companyAuth.query.filter_by(universityid=university_id).delete()
-        
-        # 7. Delete OTP verification records
-        otpVerification.query.filter_by(universityid=university_id).delete()
-        
-        # 8. Finally, delete the university itself
-        db.session.delete(university)
-        
-        # Commit all deletions
-        db.session.commit()
+        job_id = submit_job("university_delete", remove_university, university_id)
         
         return jsonify({
             'success': True,
-            'message': 'University and all related records deleted successfully'
-        }), 200
+            'message': 'University deletion started',
+            'jobId': job_id
+        }), 202
         
     except Exception as e:
         db.session.rollback()
@@ -198,7 +225,58 @@ def delete_university(university_id):
             'message': f'Error deleting university: {str(e)}'
         }), 500
 
+def remove_university(progress, university_id):
+    """Background job: delete a university and every record that belongs to it"""
+    # Import all models that have university relationships
+    from app.models import (
+        studentAuth, otpVerification, companyAuth, 
+        CompanyProfile, StudentProfile, JobDetails, JobApplication
+    )
+    
+    # Delete all related records in the correct order (respecting foreign key constraints)
+    # 1. job applications (depend on jobs, students, companies), 2. job details (depend on companies),
+    # then profiles, auth records and OTPs
+    dependants = [
+        ('jobApplications', JobApplication),
+        ('jobs', JobDetails),
+        ('studentProfiles', StudentProfile),
+        ('companyProfiles', CompanyProfile),
+        ('students', studentAuth),
+        ('companies', companyAuth),
+        ('otps', otpVerification)
+    ]
+    # everything goes in one transaction, so progress is only reported around it
+    progress.update(total=len(dependants) + 1)
+    
+    deleted = {}
+    for name, model in dependants:
+        deleted[name] = model.query.filter_by(universityid=university_id).delete()
+    
+    # Finally, delete the university itself
+    universitytable.query.filter_by(id=university_id).delete()
+    
+    # Commit all deletions
+    db.session.commit()
+    invalidate_job_feed(university_id)
+    progress.update(processed=len(dependants) + 1)
+    
+    return {
+        'message': 'University and all related records deleted successfully',
+        'deleted': deleted
+    }
+
+def passkey_verified_response(university):
+    return jsonify({
+        'success': True,
+        'message': 'Passkey verified successfully',
+        'university': {
+            'id': university.id,
+            'universityName': university.universityName
+        }
+    }), 200
+
 @universityDbUpdate_bp.route("/api/universities/verify-passkey", methods=['POST'])
+@rate_limit("passkey")
 def verify_university_passkey():
     """Verify a university passkey and return university details if valid"""
     try:
@@ -211,19 +289,13 @@ def verify_university_passkey():
                 'message': 'Passkey is required'
             }), 400
         
-        # Get all universities and check passkey against each hashed value
-        universities = universitytable.query.all()
-        
-        for university in universities:
-            if check_password_hash(university.passkey, passkey):
-                return jsonify({
-                    'success': True,
-                    'message': 'Passkey verified successfully',
-                    'university': {
-                        'id': university.id,
-                        'universityName': university.universityName
-                    }
-                }), 200
+        # Look the university up by its passkey fingerprint, then confirm with the stored hash.
+        # Rows without a fingerprint (uploaded before fingerprints existed) never match:
+        # `schema backfill-passkeys` or a re-upload stamps them.
+        university = universitytable.query.filter_by(passkeyFingerprint=passkey_fingerprint(passkey)).first()
+        
+        if university and check_password_hash(university.passkey, passkey):
+            return passkey_verified_response(university)
         
         # No match found
         return jsonify({
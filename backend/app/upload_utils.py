@@ -0,0 +1,153 @@
+import itertools
+import os
+import shutil
+import tempfile
+
+def is_missing(value):
+    return value is None or (isinstance(value, float) and value != value)  # None or NaN
+
+def upload_extension(filename: str):
+    return filename.rsplit('.', 1)[1].lower() if '.' in filename else ''
+
+def open_upload_chunks(file, filename: str, required_columns, chunk_size: int = 500):
+    """
+    Open an uploaded CSV/Excel file for streaming, chunked reading
+
+    The header is read and validated up front; rows are then read lazily, chunk_size at
+    a time, so memory stays bounded however large the file is. .xls files have no
+    streaming reader and are loaded whole before being chunked.
+
+    Args:
+        file: File object from request.files (or any binary file object)
+        filename: Original filename, used to pick the reader
+        required_columns: Column names every row must provide
+        chunk_size: Rows per chunk
+
+    Returns:
+        iterator: Lists of (row_number, {column: value}) with row numbers as seen in a
+        spreadsheet (header is row 1) and missing cells as ""
+
+    Raises:
+        ValueError: If the format is not supported or required columns are missing
+    """
+    extension = upload_extension(filename)
+
+    if extension == 'csv':
+        import pandas as pd
+        reader = pd.read_csv(file, chunksize=chunk_size, dtype=str)
+        try:
+            first = next(reader, None)
+            check_columns(list(first.columns) if first is not None else [], required_columns)
+        except BaseException:
+            reader.close()
+            raise
+        return dataframe_chunks(reader, first, required_columns)
+
+    if extension == 'xlsx':
+        from openpyxl import load_workbook
+        workbook = load_workbook(file, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = [str(cell).strip() if cell is not None else '' for cell in next(rows, ())]
+            check_columns(header, required_columns)
+        except BaseException:
+            workbook.close()
+            raise
+        return worksheet_chunks(workbook, rows, header, required_columns, chunk_size)
+
+    if extension == 'xls':
+        import pandas as pd
+        df = pd.read_excel(file, dtype=str)
+        check_columns(list(df.columns), required_columns)
+        return (
+            dataframe_rows(df.iloc[start:start + chunk_size], required_columns)
+            for start in range(0, len(df), chunk_size)
+        )
+
+    raise ValueError("Invalid file format. Only CSV and Excel files are allowed")
+
+def save_upload(file, filename: str):
+    """
+    Copy an uploaded file to a temporary file so it outlives the request (for background jobs)
+
+    Returns:
+        str: Path of the temporary file, keeping the original extension
+    """
+    suffix = '.' + filename.rsplit('.', 1)[1].lower() if '.' in filename else ''
+    handle, path = tempfile.mkstemp(prefix="upload_", suffix=suffix)
+    with os.fdopen(handle, "wb") as target:
+        shutil.copyfileobj(file.stream, target, 64 * 1024)
+    return path
+
+def read_upload_header(file, filename: str):
+    """
+    Column names of an uploaded CSV/Excel file, read without touching its data rows
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    extension = upload_extension(filename)
+
+    if extension == 'csv':
+        import pandas as pd
+        return [str(column) for column in pd.read_csv(file, nrows=0, dtype=str).columns]
+
+    if extension == 'xlsx':
+        from openpyxl import load_workbook
+        workbook = load_workbook(file, read_only=True, data_only=True)
+        try:
+            header = next(workbook.active.iter_rows(max_row=1, values_only=True), ())
+            return [str(cell).strip() if cell is not None else '' for cell in header]
+        finally:
+            workbook.close()
+
+    if extension == 'xls':
+        import pandas as pd
+        return [str(column) for column in pd.read_excel(file, nrows=0, dtype=str).columns]
+
+    raise ValueError("Invalid file format. Only CSV and Excel files are allowed")
+
+def check_upload_columns(path, filename: str, required_columns):
+    """
+    Validate the format and header of a saved upload, before any data row is read
+
+    A file with only a header row passes (its upload simply has no rows).
+
+    Raises:
+        ValueError: If the format is not supported or required columns are missing
+    """
+    check_columns(read_upload_header(path, filename), required_columns)
+
+def check_columns(columns, required_columns):
+    if not all(column in columns for column in required_columns):
+        raise ValueError(f"File must contain columns: {', '.join(required_columns)}")
+
+def dataframe_rows(chunk, required_columns):
+    return [
+        (index + 2, {column: '' if is_missing(row[column]) else row[column] for column in required_columns})
+        for index, row in chunk.iterrows()
+    ]
+
+def dataframe_chunks(reader, first, required_columns):
+    try:
+        for chunk in itertools.chain([first], reader):
+            yield dataframe_rows(chunk, required_columns)
+    finally:
+        reader.close()
+
+def worksheet_chunks(workbook, rows, header, required_columns, chunk_size):
+    positions = {column: header.index(column) for column in required_columns}
+    try:
+        chunk = []
+        for offset, row in enumerate(rows):
+            chunk.append((offset + 2, {
+                column: '' if position >= len(row) or is_missing(row[position]) else row[position]
+                for column, position in positions.items()
+            }))
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    finally:
+        workbook.close()
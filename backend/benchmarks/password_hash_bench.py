@@ -0,0 +1,76 @@
+"""
+Logins per second per core under different password hashing parameters
+
+For each werkzeug method string, times password verification on one thread (the cost
+of one login on one core) and then through app.password_hashing with --workers hashing
+slots, the way login requests use it. Pick PASSWORD_HASH_METHOD from the slowest
+parameters that still give the peak login rate needed per core.
+
+Usage (from the backend folder):
+    python -m benchmarks.password_hash_bench [--seconds 2] [--workers N] [--method scrypt:32768:8:1 ...]
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from werkzeug.security import check_password_hash, generate_password_hash
+
+DEFAULT_METHODS = (
+    "pbkdf2:sha256:600000",
+    "pbkdf2:sha256:1000000",
+    "scrypt:16384:8:1",
+    "scrypt:32768:8:1",
+    "scrypt:65536:8:1"
+)
+PASSWORD = "correct horse battery staple"
+
+def single_core_rate(stored_hash, seconds):
+    """Verifications per second on one thread"""
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        check_password_hash(stored_hash, PASSWORD)
+        count += 1
+    return count / (time.perf_counter() - start)
+
+def pooled_rate(app, stored_hash, method, seconds, workers):
+    """Verifications per second through verify_password with `workers` slots busy"""
+    from app.password_hashing import verify_password
+
+    app.config["PASSWORD_HASH_METHOD"] = method
+    with app.app_context():
+        # warm up the pool and the cached method prefix
+        verify_password(stored_hash, PASSWORD)
+    deadline = time.perf_counter() + seconds
+
+    def client():
+        count = 0
+        with app.app_context():
+            while time.perf_counter() < deadline:
+                verify_password(stored_hash, PASSWORD)
+                count += 1
+        return count
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as clients:
+        total = sum(clients.map(lambda _: client(), range(workers)))
+    return total / (time.perf_counter() - start)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=2)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--method", action="append", dest="methods")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DATABASE_URL", "sqlite://")
+    os.environ["PASSWORD_HASH_WORKERS"] = str(args.workers)
+    from app import create_app
+    app = create_app()
+
+    print(f"{'method':<24} {'ms/login':>9} {'logins/s/core':>14} {f'logins/s x{args.workers}':>16} {'scaling':>8}")
+    for method in args.methods or DEFAULT_METHODS:
+        stored_hash = generate_password_hash(PASSWORD, method=method)
+        per_core = single_core_rate(stored_hash, args.seconds)
+        pooled = pooled_rate(app, stored_hash, method, args.seconds, args.workers)
+        print(f"{method:<24} {1000 / per_core:9.1f} {per_core:14.1f} {pooled:16.1f} {pooled / per_core:7.2f}x")
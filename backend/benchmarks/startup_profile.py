@@ -0,0 +1,67 @@
+"""
+Cold-start profile of the serverless entry point (api/index.py)
+
+Imports api.index in a fresh interpreter with -X importtime, reports the slowest modules
+by cumulative import time and fails when the cold start exceeds the budget or when a
+dependency that should load lazily (pandas, openpyxl, storage3, httpx) is imported.
+
+Usage (from the backend folder):
+    python -m benchmarks.startup_profile [--budget-ms 1500] [--top 15] [--runs 3]
+
+The budget defaults to STARTUP_BUDGET_MS (1500 ms). The best of --runs is compared against it.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# only the routes that need these may import them
+LAZY_MODULES = ("pandas", "openpyxl", "storage3", "httpx")
+
+COLD_START = "import time; start = time.perf_counter(); import api.index; print(time.perf_counter() - start)"
+
+def profile_once():
+    """
+    Returns:
+        tuple: (seconds: float, modules: list of (name, self_us, cumulative_us))
+    """
+    env = dict(os.environ)
+    env.setdefault("DATABASE_URL", "sqlite://")
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", COLD_START],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+    )
+
+    modules = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append((name.rstrip(), int(self_us), int(cumulative_us)))
+    return float(completed.stdout.strip().splitlines()[-1]), modules
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("STARTUP_BUDGET_MS", 1500)))
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    seconds, modules = min((profile_once() for _ in range(args.runs)), key=lambda run: run[0])
+
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for name, self_us, cumulative_us in sorted(modules, key=lambda module: -module[2])[:args.top]:
+        print(f"{cumulative_us / 1000:14.1f} {self_us / 1000:9.1f}  {name}")
+
+    failures = []
+    loaded = sorted({name.strip() for name, _, _ in modules if name.strip() in LAZY_MODULES})
+    if loaded:
+        failures.append(f"imported at startup but should load lazily: {', '.join(loaded)}")
+    if seconds * 1000 > args.budget_ms:
+        failures.append(f"cold start {seconds * 1000:.0f} ms is over the {args.budget_ms:.0f} ms budget")
+
+    print(f"\ncold start (best of {args.runs}): {seconds * 1000:.0f} ms, budget {args.budget_ms:.0f} ms")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,139 @@
+"""
+Per-call cost of Supabase storage operations with a fresh client per call (the old
+behaviour) versus the cached, pooled client from app.storage_utils.
+
+Client construction and the request itself are timed separately: a fresh client pays
+for building its HTTP session and for a new connection (TCP + TLS handshake) on every
+call, while the cached client is a dict lookup followed by a request on a warm
+keep-alive connection.
+
+By default the calls go to a local HTTPS stub server with a throwaway self-signed
+certificate (made with the openssl command line tool), so the handshake saving shows
+up; --plain uses plain HTTP instead. Use --live to run against SUPABASE_URL /
+SUPABASE_KEY, where each handshake also pays the network round trips.
+
+Usage (from the backend folder):
+    python -m benchmarks.storage_client_bench [--calls 200] [--plain | --live]
+"""
+import argparse
+import os
+import shutil
+import ssl
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import certifi
+from app.storage_utils import build_storage_client, get_storage_client, reset_storage_clients
+
+class StubStorageHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+    # headers and body go out in separate writes; without this, Nagle's algorithm and
+    # delayed ACKs add ~40 ms to every response and hide everything else
+    disable_nagle_algorithm = True
+
+    def reply(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        body = b"[]"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_DELETE = reply
+
+    def log_message(self, *args):
+        pass
+
+def self_signed_certificate(directory):
+    """Write a certificate/key pair for 127.0.0.1 into directory; returns (cert, key) paths"""
+    cert, key = os.path.join(directory, "cert.pem"), os.path.join(directory, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+         "-subj", "/CN=127.0.0.1", "-addext", "subjectAltName=IP:127.0.0.1",
+         "-keyout", key, "-out", cert],
+        check=True, capture_output=True
+    )
+    return cert, key
+
+def start_stub_server(tls):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubStorageHandler)
+    scheme = "http"
+    if tls:
+        cert, key = self_signed_certificate(tempfile.mkdtemp(prefix="storage-bench-"))
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert, key)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+        # httpx trusts SSL_CERT_FILE; the full CA bundle plus the stub's certificate keeps
+        # client construction (which loads the bundle) as expensive as against the real API
+        bundle = os.path.join(os.path.dirname(cert), "ca-bundle.pem")
+        with open(bundle, "w") as out, open(certifi.where()) as cas, open(cert) as own:
+            out.write(cas.read() + own.read())
+        os.environ["SSL_CERT_FILE"] = bundle
+        scheme = "https"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ["SUPABASE_URL"] = f"{scheme}://127.0.0.1:{server.server_address[1]}"
+    os.environ.setdefault("SUPABASE_KEY", "bench-key")
+    return server
+
+def time_calls(get_client, calls, bucket, close=False):
+    """Returns (construction ms, request ms) samples, one pair per call"""
+    construct, request = [], []
+    for _ in range(calls):
+        start = time.perf_counter()
+        client = get_client()
+        built = time.perf_counter()
+        client.from_(bucket).list("resumes", {"limit": 1})
+        done = time.perf_counter()
+        construct.append((built - start) * 1000)
+        request.append((done - built) * 1000)
+        if close:
+            # the old code leaked these until garbage collection; close outside the timing
+            client.session.close()
+    return construct, request
+
+def report(label, samples):
+    samples = sorted(samples)
+    p95 = samples[max(0, int(len(samples) * 0.95) - 1)]
+    print(f"{label:<36} mean {statistics.mean(samples):8.3f} ms   p50 {statistics.median(samples):8.3f} ms   p95 {p95:8.3f} ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200)
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--plain", action="store_true", help="stub over plain HTTP instead of HTTPS")
+    target.add_argument("--live", action="store_true", help="use SUPABASE_URL instead of a local stub")
+    args = parser.parse_args()
+
+    if not args.live:
+        tls = not args.plain
+        if tls and not shutil.which("openssl"):
+            print("openssl not found, falling back to a plain HTTP stub")
+            tls = False
+        start_stub_server(tls)
+    bucket = os.getenv("SUPABASE_BUCKET", "uploads")
+
+    reset_storage_clients()
+    # one untimed call each, so imports and the pooled connection are warm
+    time_calls(lambda: build_storage_client(use_service_key=True), 1, bucket, close=True)
+    time_calls(lambda: get_storage_client(use_service_key=True), 1, bucket)
+
+    fresh_construct, fresh_request = time_calls(
+        lambda: build_storage_client(use_service_key=True), args.calls, bucket, close=True
+    )
+    cached_construct, cached_request = time_calls(
+        lambda: get_storage_client(use_service_key=True), args.calls, bucket
+    )
+
+    print(f"{args.calls} storage list calls against {os.environ['SUPABASE_URL']}")
+    report("new client per call: construction", fresh_construct)
+    report("new client per call: request", fresh_request)
+    report("new client per call: total", [a + b for a, b in zip(fresh_construct, fresh_request)])
+    report("cached pooled client: lookup", cached_construct)
+    report("cached pooled client: request", cached_request)
+    report("cached pooled client: total", [a + b for a, b in zip(cached_construct, cached_request)])
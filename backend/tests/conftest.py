@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+from app import create_app
+from app.auth import issue_token
+from app.extensions import db
+from app.migrations import upgrade
+from app.models import CompanyProfile, JobDetails, universitytable
+
+@pytest.fixture
+def empty_app(tmp_path, monkeypatch):
+    """App on a fresh SQLite file, before any migration has run"""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'test.db'}")
+    app = create_app()
+    app.config.update(
+        TESTING=True,
+        JWT_SECRET="test-jwt-secret-at-least-32-bytes-long",
+        PASSKEY_FINGERPRINT_KEY="test-fingerprint-key"
+    )
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+@pytest.fixture
+def app(empty_app):
+    """App with its schema upgraded to the latest revision"""
+    with empty_app.app_context():
+        upgrade()
+    return empty_app
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+@pytest.fixture
+def auth_headers(app):
+    """auth_headers(role, subject_id, university_id=None) -> Authorization header of a fresh token"""
+    def make_headers(role, subject_id, university_id=None):
+        with app.app_context():
+            token = issue_token(role, subject_id, f"{role}{subject_id}@example.com", university_id)
+        return {"Authorization": f"Bearer {token}"}
+    return make_headers
+
+def add_university(name):
+    university = universitytable(universityName=name, passkey="not-a-real-hash")
+    db.session.add(university)
+    db.session.flush()
+    return university.id
+
+def add_company(university_id, name="Acme"):
+    company = CompanyProfile(name=name, website="https://example.com", location="Remote", about="About", universityid=university_id)
+    db.session.add(company)
+    db.session.flush()
+    return company.id
+
+def add_job(company_id, university_id, title="Engineer", description="Description", requirements="Requirements", days_left=30):
+    """Add a job ending days_left days from now (negative for an expired job)"""
+    job = JobDetails(
+        title=title,
+        type="Internship",
+        salary="1000",
+        description=description,
+        requirements=requirements,
+        enddate=(datetime.now(timezone.utc) + timedelta(days=days_left)).replace(tzinfo=None),
+        companyid=company_id,
+        universityid=university_id
+    )
+    db.session.add(job)
+    db.session.flush()
+    return job.id
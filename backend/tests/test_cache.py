@@ -0,0 +1,122 @@
+import time
+import pytest
+from app.cache import InProcessCache, SharedCache, get_cache, invalidate_job_feed, job_feed_key
+from app.extensions import db
+from conftest import add_company, add_job, add_university
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+class FakeSharedClient:
+    """Stand-in for the shared key-value store (the calls SharedCache makes)"""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, name):
+        return self.values.get(name)
+
+    def set(self, name, value, ex=None):
+        self.values[name] = value
+
+    def delete(self, name):
+        self.values.pop(name, None)
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(time, "monotonic", fake)
+    return fake
+
+@pytest.fixture
+def feed(app):
+    """University 1 with two active jobs and one expired one; returns (university id, company id)"""
+    with app.app_context():
+        university_id = add_university("Feed University")
+        company_id = add_company(university_id)
+        add_job(company_id, university_id, title="First")
+        add_job(company_id, university_id, title="Second")
+        add_job(company_id, university_id, title="Expired", days_left=-1)
+        db.session.commit()
+    return university_id, company_id
+
+def get_feed(client, headers, university_id, **params):
+    response = client.get("/get/JobDetails", query_string=dict(params, universityId=university_id), headers=headers)
+    assert response.status_code == 200
+    return response.get_json()
+
+def test_in_process_cache_drops_least_recently_used(clock):
+    cache = InProcessCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+def test_in_process_cache_expires_entries(clock):
+    cache = InProcessCache()
+    cache.set("page", {"data": []}, ttl=30)
+    clock.now += 29
+    assert cache.get("page") == {"data": []}
+    clock.now += 1
+    assert cache.get("page") is None
+
+def test_shared_cache_round_trips_json():
+    client = FakeSharedClient()
+    cache = SharedCache(client)
+    cache.set("page", {"data": [1, 2]}, ttl=60)
+    assert client.values == {"startin:cache:page": '{"data": [1, 2]}'}
+    assert cache.get("page") == {"data": [1, 2]}
+    cache.delete("page")
+    assert cache.get("page") is None
+
+def test_invalidation_moves_the_feed_to_a_new_generation(app):
+    with app.app_context():
+        key = job_feed_key(1, None, 50)
+        assert job_feed_key(1, None, 50) == key
+        other_university = job_feed_key(2, None, 50)
+
+        invalidate_job_feed(1)
+
+        assert job_feed_key(1, None, 50) != key
+        assert job_feed_key(2, None, 50) == other_university
+
+def test_feed_is_served_from_cache_until_invalidated(app, client, auth_headers, feed):
+    university_id, company_id = feed
+    student = auth_headers("student", 1, university_id)
+    assert [job["title"] for job in get_feed(client, student, university_id)["data"]] == ["First", "Second"]
+
+    # written behind the app's back, so the cached page is still served
+    with app.app_context():
+        add_job(company_id, university_id, title="Unannounced")
+        db.session.commit()
+    assert [job["title"] for job in get_feed(client, student, university_id)["data"]] == ["First", "Second"]
+
+    response = client.post("/set/JobDetails", headers=auth_headers("company", company_id, university_id), json={
+        "companyid": company_id,
+        "universityId": university_id,
+        "title": "Posted",
+        "type": "Internship",
+        "salary": "1000",
+        "description": "Description",
+        "requirements": "Requirements",
+        "enddate": "2999-01-01T00:00:00Z"
+    })
+    assert response.status_code == 200
+    assert [job["title"] for job in get_feed(client, student, university_id)["data"]] == ["First", "Second", "Unannounced", "Posted"]
+
+def test_feed_pages_are_cached_separately(app, client, auth_headers, feed):
+    university_id, _ = feed
+    student = auth_headers("student", 1, university_id)
+    first = get_feed(client, student, university_id, limit=1)
+    second = get_feed(client, student, university_id, limit=1, cursor=first["nextCursor"])
+    assert [job["title"] for job in first["data"] + second["data"]] == ["First", "Second"]
+    assert second["nextCursor"] is None
+
+    with app.app_context():
+        assert get_cache().get(job_feed_key(university_id, None, 1)) == first
+        assert get_cache().get(job_feed_key(university_id, first["nextCursor"], 1)) == second
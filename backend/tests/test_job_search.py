@@ -0,0 +1,95 @@
+import pytest
+from app.extensions import db
+from app.job_search import MAX_QUERY_LENGTH, JobSearchIndex, stem, tokenize
+from conftest import add_company, add_job, add_university
+
+class Job:
+    def __init__(self, id, title="", requirements="", description=""):
+        self.id = id
+        self.title = title
+        self.requirements = requirements
+        self.description = description
+
+@pytest.fixture
+def jobs(app):
+    """Two universities' jobs; returns (university id, other university id, {title: job id})"""
+    with app.app_context():
+        university_id = add_university("Search University")
+        other_university_id = add_university("Other University")
+        company_id = add_company(university_id)
+        other_company_id = add_company(other_university_id, name="Other")
+        titles = {
+            "Python Developer": add_job(company_id, university_id, title="Python Developer", requirements="Flask", description="APIs"),
+            "Backend Engineer": add_job(company_id, university_id, title="Backend Engineer", requirements="Python and SQL", description="Services"),
+            "Data Analyst": add_job(company_id, university_id, title="Data Analyst", requirements="SQL", description="Dashboards written in Python"),
+            "Old Python Role": add_job(company_id, university_id, title="Old Python Role", days_left=-1),
+            "Other Python Role": add_job(other_company_id, other_university_id, title="Other Python Role")
+        }
+        db.session.commit()
+    return university_id, other_university_id, titles
+
+def search(client, headers, university_id, q, **params):
+    response = client.get("/search/jobs", query_string=dict(params, universityId=university_id, q=q), headers=headers)
+    return response.status_code, response.get_json()
+
+def test_tokenize_drops_stop_words_and_stems():
+    assert tokenize("Building the APIs, in C++ and C#") == ["build", "api", "c++", "c#"]
+    assert stem("tests") == "test"
+    assert stem("is") == "is"
+
+def test_index_needs_every_term_and_weights_fields():
+    index = JobSearchIndex([
+        Job(1, title="Python"),
+        Job(2, requirements="Python"),
+        Job(3, description="Python"),
+        Job(4, title="Python", description="Flask")
+    ])
+    assert [job_id for _, job_id in index.search("python")] == [1, 4, 2, 3]
+    assert [job_id for _, job_id in index.search("python flask")] == [4]
+    assert index.search("the") == []
+
+def test_results_are_ranked_title_then_requirements_then_description(client, auth_headers, jobs):
+    university_id, _, _ = jobs
+    status, body = search(client, auth_headers("student", 1, university_id), university_id, "python")
+    assert status == 200
+    assert [job["title"] for job in body["data"]] == ["Python Developer", "Backend Engineer", "Data Analyst"]
+    assert body["data"][0]["rank"] > body["data"][1]["rank"] > body["data"][2]["rank"]
+    assert body["data"][0]["companyname"] == "Acme"
+    assert body["nextCursor"] is None
+
+def test_search_skips_expired_jobs_and_other_universities(client, auth_headers, jobs):
+    university_id, other_university_id, _ = jobs
+    _, body = search(client, auth_headers("student", 1, university_id), university_id, "role")
+    assert body["data"] == []
+    assert body["message"] == "No jobs match your search"
+
+    _, body = search(client, auth_headers("student", 2, other_university_id), other_university_id, "role")
+    assert [job["title"] for job in body["data"]] == ["Other Python Role"]
+
+def test_search_pages_follow_the_ranking(client, auth_headers, jobs):
+    university_id, _, _ = jobs
+    headers = auth_headers("company", 1, university_id)
+    titles, cursor = [], None
+    while True:
+        status, body = search(client, headers, university_id, "python", limit=1, **({"cursor": cursor} if cursor else {}))
+        assert status == 200
+        assert len(body["data"]) == 1
+        titles += [job["title"] for job in body["data"]]
+        cursor = body["nextCursor"]
+        if cursor is None:
+            break
+    assert titles == ["Python Developer", "Backend Engineer", "Data Analyst"]
+
+@pytest.mark.parametrize("q, message", [
+    ("   ", "Search text is required"),
+    ("x" * (MAX_QUERY_LENGTH + 1), f"Search text is limited to {MAX_QUERY_LENGTH} characters")
+])
+def test_invalid_search_text_is_a_400(client, auth_headers, jobs, q, message):
+    university_id, _, _ = jobs
+    status, body = search(client, auth_headers("student", 1, university_id), university_id, q)
+    assert (status, body["message"]) == (400, message)
+
+def test_search_needs_a_student_or_company_token(client, auth_headers, jobs):
+    university_id, _, _ = jobs
+    assert search(client, {}, university_id, "python")[0] == 401
+    assert search(client, auth_headers("admin", 1), university_id, "python")[0] == 403
@@ -0,0 +1,40 @@
+from app.extensions import db
+from app.migrations import current_revision, head_revision, upgrade
+
+def test_upgrade_from_empty_database_reaches_head(empty_app):
+    with empty_app.app_context():
+        assert current_revision() is None
+
+        applied = upgrade()
+
+        assert applied == list(range(1, head_revision() + 1))
+        assert current_revision() == head_revision()
+
+def test_upgrade_creates_every_model_index(empty_app):
+    with empty_app.app_context():
+        upgrade()
+        inspector = db.inspect(db.engine)
+        for table in db.metadata.sorted_tables:
+            existing = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                assert index.name in existing, f"{table.name} is missing {index.name}"
+
+def test_upgrade_at_head_applies_nothing(app):
+    with app.app_context():
+        assert upgrade() == []
+        assert current_revision() == head_revision()
+
+def test_upgrade_stops_at_target(empty_app):
+    with empty_app.app_context():
+        assert upgrade(3) == [1, 2, 3]
+        assert current_revision() == 3
+        assert upgrade() == list(range(4, head_revision() + 1))
+
+def test_requests_are_refused_until_the_schema_is_upgraded(empty_app):
+    client = empty_app.test_client()
+    response = client.get("/api/admin/universities")
+    assert response.status_code == 503
+
+    with empty_app.app_context():
+        upgrade()
+    assert client.get("/api/admin/universities").status_code == 200
@@ -0,0 +1,68 @@
+import pytest
+from app.extensions import db
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decode_cursor, encode_cursor, get_page_args
+from conftest import add_university
+
+@pytest.fixture
+def universities(app):
+    names = ["Delta", "Alpha", "Charlie", "Echo", "Bravo", "Foxtrot", "Golf"]
+    with app.app_context():
+        ids = [add_university(name) for name in names]
+        db.session.commit()
+    return dict(zip(ids, names))
+
+def walk(client, **params):
+    """Every row of /api/admin/universities, following nextCursor page by page"""
+    rows, cursor, pages = [], None, 0
+    while True:
+        query = dict(params, **({"cursor": cursor} if cursor else {}))
+        response = client.get("/api/admin/universities", query_string=query)
+        assert response.status_code == 200
+        body = response.get_json()
+        assert len(body["universities"]) <= int(params["limit"])
+        rows += [(row["id"], row["universityName"]) for row in body["universities"]]
+        pages += 1
+        cursor = body["nextCursor"]
+        if cursor is None:
+            return rows, pages
+
+def test_cursor_round_trip():
+    values = [42, "Bravo", None]
+    assert decode_cursor(encode_cursor(values)) == values
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "bm90IGpzb24=", "eyJhIjoxfQ=="])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor)
+
+@pytest.mark.parametrize("limit", ["0", "-1", "abc"])
+def test_invalid_limit_is_rejected(limit):
+    with pytest.raises(ValueError, match="Invalid limit"):
+        get_page_args({"limit": limit})
+
+def test_limit_is_capped():
+    assert get_page_args({}) == (None, DEFAULT_PAGE_SIZE)
+    assert get_page_args({"limit": "1000"}) == (None, MAX_PAGE_SIZE)
+
+def test_pages_by_id_without_gaps_or_duplicates(client, universities):
+    rows, pages = walk(client, limit="3")
+    assert [row[0] for row in rows] == sorted(universities)
+    assert pages == 3
+
+def test_pages_by_descending_name(client, universities):
+    rows, _ = walk(client, limit="2", sort="-name")
+    assert [name for _, name in rows] == sorted(universities.values(), reverse=True)
+
+def test_rows_added_before_the_cursor_do_not_shift_the_next_page(app, client, universities):
+    query = {"limit": "3", "sort": "name"}
+    first = client.get("/api/admin/universities", query_string=query).get_json()
+    with app.app_context():
+        add_university("Aardvark")
+        db.session.commit()
+    second = client.get("/api/admin/universities", query_string=dict(query, cursor=first["nextCursor"])).get_json()
+    assert [row["universityName"] for row in second["universities"]] == ["Delta", "Echo", "Foxtrot"]
+
+def test_bad_cursor_sort_or_limit_is_a_400(client, universities):
+    assert client.get("/api/admin/universities", query_string={"cursor": "garbage"}).status_code == 400
+    assert client.get("/api/admin/universities", query_string={"sort": "passkey"}).status_code == 400
+    assert client.get("/api/admin/universities", query_string={"limit": "abc"}).status_code == 400
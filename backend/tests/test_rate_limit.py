@@ -0,0 +1,92 @@
+import time
+import pytest
+from app.rate_limit import InProcessBuckets, RATE_LIMIT_RULES, SharedBuckets, parse_limit
+
+class FakeSharedClient:
+    """Stand-in for the shared key-value store (the calls SharedBuckets makes)"""
+
+    def __init__(self):
+        self.counts = {}
+        self.expiries = {}
+
+    def incr(self, name):
+        self.counts[name] = self.counts.get(name, 0) + 1
+        return self.counts[name]
+
+    def decr(self, name):
+        self.counts[name] -= 1
+        return self.counts[name]
+
+    def expire(self, name, seconds):
+        self.expiries[name] = seconds
+
+def login(client, email, university_id=1):
+    return client.post("/auth/CompanyLogin", json={"email": email, "password": "wrong", "universityId": university_id})
+
+def test_login_is_refused_past_the_account_limit(client):
+    account_limit, _ = parse_limit(RATE_LIMIT_RULES["login"]["account"])
+    for _ in range(account_limit):
+        assert login(client, "company@example.com").status_code == 400
+
+    response = login(client, "company@example.com")
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    assert response.get_json()["success"] is False
+
+    # other accounts from the same address are still let through
+    assert login(client, "other@example.com").status_code == 400
+
+def test_login_is_refused_past_the_ip_limit(client):
+    ip_limit, _ = parse_limit(RATE_LIMIT_RULES["login"]["ip"])
+    for attempt in range(ip_limit):
+        assert login(client, f"company{attempt}@example.com").status_code == 400
+    assert login(client, "another@example.com").status_code == 429
+
+def test_rate_limits_can_be_turned_off(app, client):
+    app.config["RATE_LIMIT_ENABLED"] = False
+    account_limit, _ = parse_limit(RATE_LIMIT_RULES["login"]["account"])
+    for _ in range(account_limit + 1):
+        assert login(client, "company@example.com").status_code == 400
+
+def test_in_process_deny_takes_no_token_from_other_buckets(monkeypatch):
+    monkeypatch.setattr(time, "monotonic", lambda: 1000.0)
+    buckets = InProcessBuckets()
+    assert buckets.take([("ip", 3, 60), ("account", 1, 60)]) == 0
+
+    wait = buckets.take([("ip", 3, 60), ("account", 1, 60)])
+    assert wait == pytest.approx(60)
+    # only the first request was counted against the ip bucket
+    assert buckets.take([("ip", 3, 60)]) == 0
+    assert buckets.take([("ip", 3, 60)]) == 0
+    assert buckets.take([("ip", 3, 60)]) > 0
+
+def test_in_process_buckets_refill(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    buckets = InProcessBuckets()
+    assert buckets.take([("account", 2, 60)]) == 0
+    assert buckets.take([("account", 2, 60)]) == 0
+    assert buckets.take([("account", 2, 60)]) == pytest.approx(30)
+    now[0] += 30
+    assert buckets.take([("account", 2, 60)]) == 0
+
+def test_shared_deny_takes_back_every_count(monkeypatch):
+    monkeypatch.setattr(time, "time", lambda: 6000.0)
+    client = FakeSharedClient()
+    buckets = SharedBuckets(client)
+    assert buckets.take([("ip", 3, 60), ("account", 1, 60)]) == 0
+
+    assert buckets.take([("ip", 3, 60), ("account", 1, 60)]) == pytest.approx(60)
+    assert client.counts == {"startin:ratelimit:ip:100": 1, "startin:ratelimit:account:100": 1}
+    assert client.expiries == {"startin:ratelimit:ip:100": 61, "startin:ratelimit:account:100": 61}
+
+def test_shared_backend_is_used_by_the_decorator(app, client):
+    store = FakeSharedClient()
+    app.config.update(RATE_LIMIT_BACKEND="shared", SHARED_STORE_CLIENT=store)
+    account_limit, _ = parse_limit(RATE_LIMIT_RULES["login"]["account"])
+    for _ in range(account_limit):
+        login(client, "company@example.com")
+
+    assert login(client, "company@example.com").status_code == 429
+    counts = {name.split(":")[3]: count for name, count in store.counts.items()}
+    assert counts == {"ip": account_limit, "account": account_limit}
@@ -0,0 +1,106 @@
+import { useCallback, useEffect, useRef, useState } from 'react';
+import { getPage } from '../services/api';
+
+// filters typed into search boxes are sent once typing pauses for this long
+const FILTER_DEBOUNCE_MS = 300;
+
+/**
+ * One keyset-paginated listing: the first page is fetched when the list is enabled or
+ * its filters change, later pages only when loadMore() is called.
+ *
+ * @param url Listing endpoint (e.g. '/students')
+ * @param key Field of the response holding the rows (e.g. 'students')
+ * @param params Filters and sort sent with every page (empty values are left out)
+ * @param enabled Fetch only while true (e.g. while the modal showing the list is open)
+ * @param headers Request headers sent with every page (e.g. the admin Authorization header)
+ */
+export const usePagedList = <T,>(
+  url: string,
+  key: string,
+  params: Record<string, string> = {},
+  enabled: boolean = true,
+  headers: Record<string, string> = {}
+) => {
+  const [rows, setRows] = useState<T[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [total, setTotal] = useState<number | null>(null);
+  const [totalEstimated, setTotalEstimated] = useState(false);
+  const [loading, setLoading] = useState(false);
+  const [error, setError] = useState<string | null>(null);
+  // false until the first page (or its error) arrives
+  const [loaded, setLoaded] = useState(false);
+  const loadedRef = useRef(false);
+  // only the latest request may update the list (an older search can answer last)
+  const requestId = useRef(0);
+
+  const paramsKey = JSON.stringify(params);
+  const headersKey = JSON.stringify(headers);
+
+  const load = useCallback(async (cursor: string | null) => {
+    const id = ++requestId.current;
+    setLoading(true);
+    setError(null);
+    try {
+      const filters = Object.fromEntries(
+        Object.entries(JSON.parse(paramsKey) as Record<string, string>).filter(([, value]) => value)
+      );
+      const data = await getPage(
+        url,
+        { ...filters, ...(cursor ? { cursor } : {}) },
+        JSON.parse(headersKey) as Record<string, string>
+      );
+      if (id !== requestId.current) {
+        return;
+      }
+      if (!data.success) {
+        setError(data.message || 'Failed to load');
+        return;
+      }
+      setRows((previous) => (cursor ? [...previous, ...data[key]] : data[key]));
+      setNextCursor(data.nextCursor);
+      if (!cursor) {
+        setTotal(data.total ?? null);
+        setTotalEstimated(Boolean(data.totalEstimated));
+      }
+    } catch (err: any) {
+      if (id === requestId.current) {
+        setError(err.response?.data?.message || 'Failed to load');
+      }
+    } finally {
+      if (id === requestId.current) {
+        setLoading(false);
+        setLoaded(true);
+        loadedRef.current = true;
+      }
+    }
+  }, [url, key, paramsKey, headersKey]);
+
+  const reload = useCallback(() => load(null), [load]);
+
+  const loadMore = useCallback(() => {
+    if (nextCursor && !loading) {
+      load(nextCursor);
+    }
+  }, [load, nextCursor, loading]);
+
+  useEffect(() => {
+    if (!enabled) {
+      return;
+    }
+    // the first page is fetched right away, filter changes after a pause
+    const timer = setTimeout(reload, loadedRef.current ? FILTER_DEBOUNCE_MS : 0);
+    return () => clearTimeout(timer);
+  }, [enabled, reload]);
+
+  return {
+    rows,
+    total,
+    totalEstimated,
+    hasMore: nextCursor !== null,
+    loading,
+    loaded,
+    error,
+    reload,
+    loadMore
+  };
+};
@@ -3,7 +3,7 @@ import { useNavigate, Link } from 'react-router-dom';
 import { motion, AnimatePresence } from 'framer-motion';
 import { Mail, Lock, ArrowLeft, ChevronRight, Building } from 'lucide-react';
 import { connectToBackend } from '../services/api';
-import { setCompanyId, setUniversityId, setUniversityName } from '../utils/auth';
+import { setToken, setCompanyId, setUniversityId, setUniversityName } from '../utils/auth';
 import ColorBends from '../components/ui/ColorBends';
 import '../App.css';
 
@@ -43,6 +43,7 @@ const CompanyLogin: React.FC = () => {
 
       if (response.success && response.token) {
         localStorage.setItem('companyToken', response.token);
+        setToken(response.token);
         if (response.company_id) setCompanyId(response.company_id);
         if (response.university_id) {
           setUniversityId(response.university_id);
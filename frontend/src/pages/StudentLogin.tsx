@@ -3,7 +3,7 @@ import { useNavigate, Link } from 'react-router-dom';
 import { motion, AnimatePresence } from 'framer-motion';
 import { Mail, Lock, ArrowLeft, ChevronRight, LogIn } from 'lucide-react';
 import { connectToBackend } from '../services/api';
-import { setStudentId, setUniversityId, setUniversityName } from '../utils/auth';
+import { setToken, setStudentId, setUniversityId, setUniversityName } from '../utils/auth';
 import ColorBends from '../components/ui/ColorBends';
 import '../App.css';
 
@@ -37,6 +37,7 @@ const StudentLogin: React.FC = () => {
 
       if (response.success && response.token) {
         localStorage.setItem('studentToken', response.token);
+        setToken(response.token);
         if (response.student_id) setStudentId(response.student_id);
         if (response.university_id) {
           setUniversityId(response.university_id);
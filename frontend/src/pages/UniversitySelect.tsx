@@ -1,8 +1,9 @@
-import { useState, useEffect } from 'react';
+import { useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { motion, AnimatePresence } from 'framer-motion';
 import { Search, School, ShieldCheck, ArrowRight, ArrowLeft, Loader2 } from 'lucide-react';
 import axios from 'axios';
+import { usePagedList } from '../hooks/usePagedList';
 import DotGrid from '../components/ui/DotGrid';
 import '../App.css';
 
@@ -15,35 +16,17 @@ interface University {
 
 const UniversitySelect = () => {
   const [searchTerm, setSearchTerm] = useState('');
-  const [universities, setUniversities] = useState<University[]>([]);
-  const [loading, setLoading] = useState(true);
   const [selectedUniversity, setSelectedUniversity] = useState<University | null>(null);
   const [passkey, setPasskey] = useState('');
   const [error, setError] = useState('');
   const [verifying, setVerifying] = useState(false);
   const navigate = useNavigate();
 
-  useEffect(() => {
-    fetchUniversities();
-  }, []);
-
-  const fetchUniversities = async () => {
-    try {
-      const response = await axios.get(`${API_BASE_URL}/api/admin/universities`);
-      if (response.data.success) {
-        setUniversities(response.data.universities);
-      }
-    } catch (error) {
-      console.error('Error fetching universities:', error);
-      setError('Failed to load universities');
-    } finally {
-      setLoading(false);
-    }
-  };
-
-  const filteredUnis = universities.filter((uni) =>
-    uni.universityName.toLowerCase().includes(searchTerm.toLowerCase())
-  );
+  // the directory is searched on the server, one page at a time
+  const universities = usePagedList<University>('/api/admin/universities', 'universities', {
+    sort: 'name',
+    search: searchTerm.trim()
+  });
 
   const handleSelectUniversity = (uni: University) => {
     setSelectedUniversity(uni);
@@ -85,7 +68,8 @@ const UniversitySelect = () => {
     setError('');
   };
 
-  if (loading) {
+  // full-screen loader only until the first page arrives
+  if (!universities.loaded) {
     return (
       <div style={{
         height: '100vh',
@@ -389,7 +373,7 @@ const UniversitySelect = () => {
               </div>
 
               <AnimatePresence>
-                {error && (
+                {(error || universities.error) && (
                   <motion.div
                     initial={{ opacity: 0, y: -10 }}
                     animate={{ opacity: 1, y: 0 }}
@@ -404,7 +388,7 @@ const UniversitySelect = () => {
                       fontSize: '0.9rem',
                     }}
                   >
-                    {error}
+                    {error || universities.error}
                   </motion.div>
                 )}
               </AnimatePresence>
@@ -418,13 +402,13 @@ const UniversitySelect = () => {
                 gap: '10px',
                 paddingRight: '6px',
               }}>
-                {filteredUnis.length > 0 ? (
-                  filteredUnis.map((uni, index) => (
+                {universities.rows.length > 0 ? (
+                  universities.rows.map((uni, index) => (
                     <motion.div
                       key={uni.id}
                       initial={{ opacity: 0, x: -20 }}
                       animate={{ opacity: 1, x: 0 }}
-                      transition={{ delay: index * 0.05 }}
+                      transition={{ delay: (index % 50) * 0.05 }}
                       onClick={() => handleSelectUniversity(uni)}
                       style={{
                         display: 'flex',
@@ -458,7 +442,7 @@ const UniversitySelect = () => {
                       <ArrowRight size={18} color="var(--accent-purple)" />
                     </motion.div>
                   ))
-                ) : (
+                ) : !universities.loading && (
                   <p style={{
                     textAlign: 'center',
                     color: 'var(--text-muted)',
@@ -468,6 +452,24 @@ const UniversitySelect = () => {
                     No university found. Contact admin to add your university.
                   </p>
                 )}
+                {universities.hasMore && (
+                  <button
+                    onClick={universities.loadMore}
+                    disabled={universities.loading}
+                    style={{
+                      background: 'rgba(255, 255, 255, 0.05)',
+                      border: '1px solid rgba(255, 255, 255, 0.1)',
+                      color: 'var(--text-secondary)',
+                      padding: '0.75rem',
+                      borderRadius: 'var(--radius-lg)',
+                      cursor: universities.loading ? 'not-allowed' : 'pointer',
+                      fontSize: '0.85rem',
+                      fontFamily: 'inherit',
+                    }}
+                  >
+                    {universities.loading ? 'Loading...' : 'Show more universities'}
+                  </button>
+                )}
               </div>
 
               {/* Admin Login */}
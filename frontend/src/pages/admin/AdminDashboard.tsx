@@ -2,6 +2,7 @@ import React, { useEffect, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { getAdminId } from '../../utils/auth';
 import axios from 'axios';
+import { usePagedList } from '../../hooks/usePagedList';
 import '../../App.css';
 
 const API_BASE_URL = import.meta.env.VITE_API_URL || 'http://localhost:5000';
@@ -44,8 +45,7 @@ interface Job {
   title: string;
   type: string;
   salary: string;
-  description: string;
-  requirements: string;
+  descriptionPreview: string;
   enddate: string;
   companyName: string;
   companyId: number;
@@ -54,6 +54,97 @@ interface Job {
   status: 'active' | 'inactive';
 }
 
+type PagedList = ReturnType<typeof usePagedList<any>>;
+
+// Every admin route except the public university listing needs the admin token
+const adminAuthHeaders = () => ({
+  Authorization: `Bearer ${localStorage.getItem('adminToken')}`
+});
+
+// Header count of a listing: the server's total when it sent one, otherwise what is loaded so far
+const listCount = (list: PagedList) =>
+  list.total !== null
+    ? `${list.totalEstimated ? '~' : ''}${list.total}`
+    : `${list.rows.length}${list.hasMore ? '+' : ''}`;
+
+const filterControlStyle: React.CSSProperties = {
+  padding: '8px',
+  border: '1px solid #d1d5db',
+  borderRadius: '5px',
+  fontSize: '0.9rem'
+};
+
+interface ListingFiltersProps {
+  search: string;
+  onSearch: (value: string) => void;
+  placeholder: string;
+  status?: string;
+  onStatus?: (value: string) => void;
+  statusOptions?: [string, string][];
+  sort?: string;
+  onSort?: (value: string) => void;
+  sortOptions?: [string, string][];
+}
+
+// Search box and optional status / sort pickers of a listing; the server applies them
+const ListingFilters: React.FC<ListingFiltersProps> = ({
+  search, onSearch, placeholder, status, onStatus, statusOptions, sort, onSort, sortOptions
+}) => (
+  <div style={{ display: 'flex', gap: '10px', marginBottom: '15px', flexWrap: 'wrap' }}>
+    <input
+      type="text"
+      value={search}
+      onChange={(e) => onSearch(e.target.value)}
+      placeholder={placeholder}
+      style={{ ...filterControlStyle, flex: 1, minWidth: '200px' }}
+    />
+    {statusOptions && onStatus && (
+      <select value={status} onChange={(e) => onStatus(e.target.value)} style={filterControlStyle}>
+        {statusOptions.map(([value, label]) => (
+          <option key={value} value={value}>{label}</option>
+        ))}
+      </select>
+    )}
+    {sortOptions && onSort && (
+      <select value={sort} onChange={(e) => onSort(e.target.value)} style={filterControlStyle}>
+        {sortOptions.map(([value, label]) => (
+          <option key={value} value={value}>{label}</option>
+        ))}
+      </select>
+    )}
+  </div>
+);
+
+// Fetches the next page of a listing when clicked; hidden on the last page
+const LoadMoreButton: React.FC<{ list: PagedList }> = ({ list }) => (
+  list.hasMore ? (
+    <div style={{ textAlign: 'center', padding: '10px' }}>
+      <button
+        onClick={list.loadMore}
+        disabled={list.loading}
+        style={{
+          padding: '8px 20px',
+          background: list.loading ? '#d1d5db' : '#f3f4f6',
+          color: '#333',
+          border: '1px solid #d1d5db',
+          borderRadius: '5px',
+          cursor: list.loading ? 'not-allowed' : 'pointer',
+          fontSize: '0.9rem'
+        }}
+      >
+        {list.loading ? 'Loading...' : 'Load more'}
+      </button>
+    </div>
+  ) : null
+);
+
+// Shown instead of a listing's table while its first page loads, on errors or when it is empty
+const ListingPlaceholder: React.FC<{ list: PagedList; empty: string }> = ({ list, empty }) => (
+  <p style={{ textAlign: 'center', color: list.error ? '#dc2626' : '#666' }}>
+    {list.loading ? 'Loading...' : list.error || empty}
+  </p>
+);
+
 const AdminDashboard: React.FC = () => {
   const navigate = useNavigate();
   const [adminId, setAdminId] = useState<string | null>(null);
@@ -61,11 +152,6 @@ const AdminDashboard: React.FC = () => {
   const [showCompanyModal, setShowCompanyModal] = useState(false);
   const [showStudentModal, setShowStudentModal] = useState(false);
   const [showJobModal, setShowJobModal] = useState(false);
-  const [universities, setUniversities] = useState<University[]>([]);
-  const [companies, setCompanies] = useState<Company[]>([]);
-  const [registeredCompanies, setRegisteredCompanies] = useState<RegisteredCompany[]>([]);
-  const [students, setStudents] = useState<Student[]>([]);
-  const [jobs, setJobs] = useState<Job[]>([]);
   const [loading, setLoading] = useState(false);
   const [uploadFile, setUploadFile] = useState<File | null>(null);
   const [uploadMessage, setUploadMessage] = useState<{type: 'success' | 'error', text: string} | null>(null);
@@ -77,6 +163,26 @@ const AdminDashboard: React.FC = () => {
     name: ''
   });
 
+  // Listings load one page when their modal (or tab) opens and again whenever a filter changes
+  const [universitySearch, setUniversitySearch] = useState('');
+  const [verificationSearch, setVerificationSearch] = useState('');
+  const [registeredFilters, setRegisteredFilters] = useState({ search: '', status: '', sort: 'id' });
+  const [studentFilters, setStudentFilters] = useState({ search: '', status: '', sort: 'id' });
+  const [jobFilters, setJobFilters] = useState({ search: '', status: '', sort: 'id' });
+  const universities = usePagedList<University>(
+    '/api/admin/universities', 'universities', { search: universitySearch }, showUniversityModal
+  );
+  const companies = usePagedList<Company>(
+    '/admin/companies/verification', 'companies', { search: verificationSearch },
+    showCompanyModal && companyTab === 'verification', adminAuthHeaders()
+  );
+  const registeredCompanies = usePagedList<RegisteredCompany>(
+    '/admin/companies/registered', 'companies', registeredFilters,
+    showCompanyModal && companyTab === 'registered', adminAuthHeaders()
+  );
+  const students = usePagedList<Student>('/students', 'students', studentFilters, showStudentModal, adminAuthHeaders());
+  const jobs = usePagedList<Job>('/api/admin/jobs', 'jobs', jobFilters, showJobModal, adminAuthHeaders());
+
   useEffect(() => {
     // Check if admin is authenticated
     const token = localStorage.getItem('adminToken');
@@ -96,18 +202,40 @@ const AdminDashboard: React.FC = () => {
     navigate('/admin/login');
   };
 
-  const fetchUniversities = async () => {
-    setLoading(true);
-    try {
-      const response = await axios.get(`${API_BASE_URL}/api/admin/universities`);
-      if (response.data.success) {
-        setUniversities(response.data.universities);
+  // Uploads and deletions run as background jobs: poll until the job finishes
+  const waitForJob = async (jobId: string) => {
+    while (true) {
+      const response = await axios.get(`${API_BASE_URL}/api/admin/jobs/${jobId}/status`, {
+        headers: adminAuthHeaders()
+      });
+      const job = response.data.job;
+      if (job.status === 'succeeded') {
+        return job.result;
       }
+      if (job.status === 'failed') {
+        throw { response: { data: { message: job.message } } };
+      }
+      await new Promise((resolve) => setTimeout(resolve, 1000));
+    }
+  };
+
+  // Exports need the admin token, so download them through axios instead of a plain link
+  const downloadExport = async (kind: 'students' | 'jobs') => {
+    try {
+      const response = await axios.get(`${API_BASE_URL}/api/admin/exports/${kind}`, {
+        params: { format: 'csv' },
+        headers: adminAuthHeaders(),
+        responseType: 'blob'
+      });
+      const url = URL.createObjectURL(response.data);
+      const link = document.createElement('a');
+      link.href = url;
+      link.download = `${kind}.csv`;
+      link.click();
+      URL.revokeObjectURL(url);
     } catch (error) {
-      console.error('Error fetching universities:', error);
-      setUploadMessage({ type: 'error', text: 'Failed to fetch universities' });
-    } finally {
-      setLoading(false);
+      console.error(`Error exporting ${kind}:`, error);
+      setUploadMessage({ type: 'error', text: `Failed to export ${kind}` });
     }
   };
 
@@ -134,18 +262,20 @@ const AdminDashboard: React.FC = () => {
         formData,
         {
           headers: {
+            ...adminAuthHeaders(),
             'Content-Type': 'multipart/form-data',
           },
         }
       );
 
       if (response.data.success) {
+        const result = await waitForJob(response.data.jobId);
         setUploadMessage({
           type: 'success',
-          text: `Successfully added ${response.data.added} and updated ${response.data.updated} universities`
+          text: `Successfully added ${result.added} and updated ${result.updated} universities`
         });
         setUploadFile(null);
-        fetchUniversities();
+        universities.reload();
       }
     } catch (error: any) {
       setUploadMessage({
@@ -164,10 +294,13 @@ const AdminDashboard: React.FC = () => {
 
     setLoading(true);
     try {
-      const response = await axios.delete(`${API_BASE_URL}/api/admin/universities/${id}`);
+      const response = await axios.delete(`${API_BASE_URL}/api/admin/universities/${id}`, {
+        headers: adminAuthHeaders()
+      });
       if (response.data.success) {
+        await waitForJob(response.data.jobId);
         setUploadMessage({ type: 'success', text: 'University deleted successfully' });
-        fetchUniversities();
+        universities.reload();
       }
     } catch (error: any) {
       setUploadMessage({
@@ -182,7 +315,6 @@ const AdminDashboard: React.FC = () => {
   const openUniversityModal = () => {
     setShowUniversityModal(true);
     setUploadMessage(null);
-    fetchUniversities();
   };
 
   const closeUniversityModal = () => {
@@ -191,41 +323,9 @@ const AdminDashboard: React.FC = () => {
     setUploadMessage(null);
   };
 
-  const fetchCompanies = async () => {
-    setLoading(true);
-    try {
-      const response = await axios.get(`${API_BASE_URL}/admin/companies/verification`);
-      if (response.data.success) {
-        setCompanies(response.data.companies);
-      }
-    } catch (error) {
-      console.error('Error fetching companies:', error);
-      setUploadMessage({ type: 'error', text: 'Failed to fetch companies' });
-    } finally {
-      setLoading(false);
-    }
-  };
-
-  const fetchRegisteredCompanies = async () => {
-    setLoading(true);
-    try {
-      const response = await axios.get(`${API_BASE_URL}/admin/companies/registered`);
-      if (response.data.success) {
-        setRegisteredCompanies(response.data.companies);
-      }
-    } catch (error) {
-      console.error('Error fetching registered companies:', error);
-      setUploadMessage({ type: 'error', text: 'Failed to fetch registered companies' });
-    } finally {
-      setLoading(false);
-    }
-  };
-
   const openCompanyModal = () => {
     setShowCompanyModal(true);
     setUploadMessage(null);
-    fetchCompanies();
-    fetchRegisteredCompanies();
   };
 
   const closeCompanyModal = () => {
@@ -252,27 +352,20 @@ const AdminDashboard: React.FC = () => {
         formData,
         {
           headers: {
+            ...adminAuthHeaders(),
             'Content-Type': 'multipart/form-data',
           },
         }
       );
 
       if (response.data.success) {
+        const result = await waitForJob(response.data.jobId);
         setUploadMessage({
           type: 'success',
-          text: response.data.message
+          text: result.message
         });
         setUploadFile(null);
-        // Add newly uploaded companies
-        if (response.data.addedCompanies && response.data.addedCompanies.length > 0) {
-          const newCompanies = response.data.addedCompanies.map((c: any) => ({
-            ...c,
-            registered: false
-          }));
-          setCompanies([...newCompanies, ...companies]);
-        } else {
-          fetchCompanies();
-        }
+        companies.reload();
       }
     } catch (error: any) {
       setUploadMessage({
@@ -286,7 +379,9 @@ const AdminDashboard: React.FC = () => {
 
   const handleGeneratePasskey = async () => {
     try {
-      const response = await axios.get(`${API_BASE_URL}/admin/companies/generate-passkey`);
+      const response = await axios.get(`${API_BASE_URL}/admin/companies/generate-passkey`, {
+        headers: adminAuthHeaders()
+      });
       if (response.data.success) {
         setNewCompany({ ...newCompany, passkey: response.data.passkey });
       }
@@ -299,14 +394,13 @@ const AdminDashboard: React.FC = () => {
     e.preventDefault();
     setLoading(true);
     try {
-      const response = await axios.post(`${API_BASE_URL}/admin/companies/add`, newCompany);
+      const response = await axios.post(`${API_BASE_URL}/admin/companies/add`, newCompany, {
+        headers: adminAuthHeaders()
+      });
       if (response.data.success) {
         setUploadMessage({ type: 'success', text: 'Company added successfully' });
         setShowAddCompanyForm(false);
-        // Add the new company to the list
-        if (response.data.company) {
-          setCompanies([response.data.company, ...companies]);
-        }
+        companies.reload();
         setNewCompany({ passkey: '', mailId: '', name: '' });
       }
     } catch (error: any) {
@@ -319,40 +413,9 @@ const AdminDashboard: React.FC = () => {
     }
   };
 
-  const fetchStudents = async () => {
-    setLoading(true);
-    try {
-      const response = await axios.get(`${API_BASE_URL}/students`);
-      if (response.data.success) {
-        setStudents(response.data.students);
-      }
-    } catch (error) {
-      console.error('Error fetching students:', error);
-      setUploadMessage({ type: 'error', text: 'Failed to fetch students' });
-    } finally {
-      setLoading(false);
-    }
-  };
-
-  const fetchJobs = async () => {
-    setLoading(true);
-    try {
-      const response = await axios.get(`${API_BASE_URL}/api/admin/jobs`);
-      if (response.data.success) {
-        setJobs(response.data.jobs);
-      }
-    } catch (error) {
-      console.error('Error fetching jobs:', error);
-      setUploadMessage({ type: 'error', text: 'Failed to fetch job postings' });
-    } finally {
-      setLoading(false);
-    }
-  };
-
   const openStudentModal = () => {
     setShowStudentModal(true);
     setUploadMessage(null);
-    fetchStudents();
   };
 
   const closeStudentModal = () => {
@@ -363,7 +426,6 @@ const AdminDashboard: React.FC = () => {
   const openJobModal = () => {
     setShowJobModal(true);
     setUploadMessage(null);
-    fetchJobs();
   };
 
   const closeJobModal = () => {
@@ -379,10 +441,13 @@ const AdminDashboard: React.FC = () => {
     setLoading(true);
     try {
       // Use plain passkey for deletion
-      const response = await axios.delete(`${API_BASE_URL}/admin/companies/${encodeURIComponent(company.passkey)}`);
+      const response = await axios.delete(`${API_BASE_URL}/admin/companies/${encodeURIComponent(company.passkey)}`, {
+        headers: adminAuthHeaders()
+      });
       if (response.data.success) {
+        await waitForJob(response.data.jobId);
         setUploadMessage({ type: 'success', text: 'Company deleted successfully' });
-        fetchCompanies();
+        companies.reload();
       }
     } catch (error: any) {
       setUploadMessage({
@@ -652,13 +717,17 @@ const AdminDashboard: React.FC = () => {
               {/* Universities List */}
               <div>
                 <h3 style={{ color: '#059669', marginBottom: '15px' }}>
-                  Existing Universities ({universities.length})
+                  Existing Universities ({listCount(universities)})
                 </h3>
+
+                <ListingFilters
+                  search={universitySearch}
+                  onSearch={setUniversitySearch}
+                  placeholder="Search universities by name"
+                />
                 
-                {loading ? (
-                  <p style={{ textAlign: 'center', color: '#666' }}>Loading...</p>
-                ) : universities.length === 0 ? (
-                  <p style={{ textAlign: 'center', color: '#666' }}>No universities found</p>
+                {universities.rows.length === 0 ? (
+                  <ListingPlaceholder list={universities} empty="No universities found" />
                 ) : (
                   <div style={{ maxHeight: '300px', overflow: 'auto' }}>
                     <table style={{
@@ -674,7 +743,7 @@ const AdminDashboard: React.FC = () => {
                         </tr>
                       </thead>
                       <tbody>
-                        {universities.map((uni) => (
+                        {universities.rows.map((uni) => (
                           <tr key={uni.id} style={{ borderBottom: '1px solid #e5e7eb' }}>
                             <td style={{ padding: '10px' }}>{uni.id}</td>
                             <td style={{ padding: '10px' }}>{uni.universityName}</td>
@@ -700,6 +769,7 @@ const AdminDashboard: React.FC = () => {
                         ))}
                       </tbody>
                     </table>
+                    <LoadMoreButton list={universities} />
                   </div>
                 )}
               </div>
@@ -764,7 +834,6 @@ const AdminDashboard: React.FC = () => {
                 <button
                   onClick={() => {
                     setCompanyTab('verification');
-                    fetchCompanies();
                   }}
                   style={{
                     padding: '10px 20px',
@@ -776,12 +845,11 @@ const AdminDashboard: React.FC = () => {
                     fontWeight: companyTab === 'verification' ? 'bold' : 'normal'
                   }}
                 >
-                  Company Verification ({companies.length})
+                  Company Verification{companies.loaded ? ` (${listCount(companies)})` : ''}
                 </button>
                 <button
                   onClick={() => {
                     setCompanyTab('registered');
-                    fetchRegisteredCompanies();
                   }}
                   style={{
                     padding: '10px 20px',
@@ -793,7 +861,7 @@ const AdminDashboard: React.FC = () => {
                     fontWeight: companyTab === 'registered' ? 'bold' : 'normal'
                   }}
                 >
-                  Registered Companies ({registeredCompanies.length})
+                  Registered Companies{registeredCompanies.loaded ? ` (${listCount(registeredCompanies)})` : ''}
                 </button>
               </div>
 
@@ -972,11 +1040,15 @@ const AdminDashboard: React.FC = () => {
                     <h3 style={{ color: '#0f766e', marginBottom: '15px' }}>
                       Companies in Verification Table
                     </h3>
+
+                    <ListingFilters
+                      search={verificationSearch}
+                      onSearch={setVerificationSearch}
+                      placeholder="Search by company name or email"
+                    />
                     
-                    {loading ? (
-                      <p style={{ textAlign: 'center', color: '#666' }}>Loading...</p>
-                    ) : companies.length === 0 ? (
-                      <p style={{ textAlign: 'center', color: '#666' }}>No companies found</p>
+                    {companies.rows.length === 0 ? (
+                      <ListingPlaceholder list={companies} empty="No companies found" />
                     ) : (
                       <div style={{ maxHeight: '300px', overflow: 'auto' }}>
                         <table style={{
@@ -993,7 +1065,7 @@ const AdminDashboard: React.FC = () => {
                             </tr>
                           </thead>
                           <tbody>
-                            {companies.map((company, index) => (
+                            {companies.rows.map((company, index) => (
                               <tr key={`${company.passkey}-${index}`} style={{ borderBottom: '1px solid #e5e7eb' }}>
                                 <td style={{ padding: '10px', fontSize: '0.8rem', fontFamily: 'monospace' }}>
                                   {company.passkey}
@@ -1044,6 +1116,7 @@ const AdminDashboard: React.FC = () => {
                             ))}
                           </tbody>
                         </table>
+                        <LoadMoreButton list={companies} />
                       </div>
                     )}
                   </div>
@@ -1056,11 +1129,21 @@ const AdminDashboard: React.FC = () => {
                   <h3 style={{ color: '#0f766e', marginBottom: '15px' }}>
                     Registered Companies
                   </h3>
+
+                  <ListingFilters
+                    search={registeredFilters.search}
+                    onSearch={(search) => setRegisteredFilters({ ...registeredFilters, search })}
+                    placeholder="Search by email or company name"
+                    status={registeredFilters.status}
+                    onStatus={(status) => setRegisteredFilters({ ...registeredFilters, status })}
+                    statusOptions={[['', 'All profiles'], ['complete', 'Complete'], ['incomplete', 'Incomplete']]}
+                    sort={registeredFilters.sort}
+                    onSort={(sort) => setRegisteredFilters({ ...registeredFilters, sort })}
+                    sortOptions={[['id', 'Oldest first'], ['-id', 'Newest first'], ['email', 'Email A-Z'], ['-email', 'Email Z-A']]}
+                  />
                   
-                  {loading ? (
-                    <p style={{ textAlign: 'center', color: '#666' }}>Loading...</p>
-                  ) : registeredCompanies.length === 0 ? (
-                    <p style={{ textAlign: 'center', color: '#666' }}>No registered companies found</p>
+                  {registeredCompanies.rows.length === 0 ? (
+                    <ListingPlaceholder list={registeredCompanies} empty="No registered companies found" />
                   ) : (
                     <div style={{ maxHeight: '400px', overflow: 'auto' }}>
                       <table style={{
@@ -1077,7 +1160,7 @@ const AdminDashboard: React.FC = () => {
                           </tr>
                         </thead>
                         <tbody>
-                          {registeredCompanies.map((company) => (
+                          {registeredCompanies.rows.map((company) => (
                             <tr key={company.id} style={{ borderBottom: '1px solid #e5e7eb' }}>
                               <td style={{ padding: '10px' }}>{company.id}</td>
                               <td style={{ padding: '10px' }}>{company.email}</td>
@@ -1110,6 +1193,7 @@ const AdminDashboard: React.FC = () => {
                           ))}
                         </tbody>
                       </table>
+                      <LoadMoreButton list={registeredCompanies} />
                     </div>
                   )}
                 </div>
@@ -1168,7 +1252,14 @@ const AdminDashboard: React.FC = () => {
               {/* Students List */}
               <div>
                 <h3 style={{ color: '#4f46e5', marginBottom: '15px' }}>
-                  Registered Students ({students.length})
+                  Registered Students ({listCount(students)})
+                  <a
+                    href={`${API_BASE_URL}/api/admin/exports/students?format=csv`}
+                    onClick={(e) => { e.preventDefault(); downloadExport('students'); }}
+                    style={{ marginLeft: '15px', fontSize: '0.85rem', color: '#4f46e5' }}
+                  >
+                    Export CSV
+                  </a>
                 </h3>
                 
                 {uploadMessage && (
@@ -1184,10 +1275,20 @@ const AdminDashboard: React.FC = () => {
                   </div>
                 )}
                 
-                {loading ? (
-                  <p style={{ textAlign: 'center', color: '#666' }}>Loading...</p>
-                ) : students.length === 0 ? (
-                  <p style={{ textAlign: 'center', color: '#666' }}>No students found</p>
+                <ListingFilters
+                  search={studentFilters.search}
+                  onSearch={(search) => setStudentFilters({ ...studentFilters, search })}
+                  placeholder="Search by email or name"
+                  status={studentFilters.status}
+                  onStatus={(status) => setStudentFilters({ ...studentFilters, status })}
+                  statusOptions={[['', 'All profiles'], ['complete', 'Profile created'], ['incomplete', 'Profile not created']]}
+                  sort={studentFilters.sort}
+                  onSort={(sort) => setStudentFilters({ ...studentFilters, sort })}
+                  sortOptions={[['id', 'Oldest first'], ['-id', 'Newest first'], ['email', 'Email A-Z'], ['-email', 'Email Z-A']]}
+                />
+
+                {students.rows.length === 0 ? (
+                  <ListingPlaceholder list={students} empty="No students found" />
                 ) : (
                   <div style={{ maxHeight: '500px', overflow: 'auto' }}>
                     <table style={{
@@ -1204,7 +1305,7 @@ const AdminDashboard: React.FC = () => {
                         </tr>
                       </thead>
                       <tbody>
-                        {students.map((student) => (
+                        {students.rows.map((student) => (
                           <tr key={student.id} style={{ borderBottom: '1px solid #e5e7eb' }}>
                             <td style={{ padding: '12px', verticalAlign: 'middle' }}>{student.id}</td>
                             <td style={{ 
@@ -1237,6 +1338,7 @@ const AdminDashboard: React.FC = () => {
                         ))}
                       </tbody>
                     </table>
+                    <LoadMoreButton list={students} />
                   </div>
                 )}
               </div>
@@ -1274,7 +1376,16 @@ const AdminDashboard: React.FC = () => {
                 alignItems: 'center',
                 marginBottom: '20px'
               }}>
-                <h2 style={{ color: '#7c3aed', margin: 0 }}>Job Postings</h2>
+                <h2 style={{ color: '#7c3aed', margin: 0 }}>
+                  Job Postings ({listCount(jobs)})
+                  <a
+                    href={`${API_BASE_URL}/api/admin/exports/jobs?format=csv`}
+                    onClick={(e) => { e.preventDefault(); downloadExport('jobs'); }}
+                    style={{ marginLeft: '15px', fontSize: '0.85rem', color: '#7c3aed' }}
+                  >
+                    Export CSV
+                  </a>
+                </h2>
                 <button
                   onClick={closeJobModal}
                   style={{
@@ -1303,123 +1414,128 @@ const AdminDashboard: React.FC = () => {
                 </div>
               )}
 
-              {loading ? (
-                <div style={{ textAlign: 'center', padding: '40px' }}>
-                  <p>Loading job postings...</p>
+              <ListingFilters
+                search={jobFilters.search}
+                onSearch={(search) => setJobFilters({ ...jobFilters, search })}
+                placeholder="Search by job title or company name"
+                status={jobFilters.status}
+                onStatus={(status) => setJobFilters({ ...jobFilters, status })}
+                statusOptions={[['', 'All postings'], ['active', 'Active'], ['inactive', 'Inactive']]}
+                sort={jobFilters.sort}
+                onSort={(sort) => setJobFilters({ ...jobFilters, sort })}
+                sortOptions={[['id', 'Oldest first'], ['-id', 'Newest first'], ['enddate', 'Closing soonest'], ['-enddate', 'Closing latest']]}
+              />
+
+              {jobs.rows.length === 0 ? (
+                <div style={{ padding: '40px' }}>
+                  <ListingPlaceholder list={jobs} empty="No job postings found" />
                 </div>
               ) : (
-                <div>
-                  {jobs.length === 0 ? (
-                    <p style={{ textAlign: 'center', color: '#666', padding: '40px' }}>
-                      No job postings found
-                    </p>
-                  ) : (
-                    <div style={{ overflowX: 'auto' }}>
-                      <table style={{
-                        width: '100%',
-                        borderCollapse: 'collapse',
-                        marginTop: '20px'
+                <div style={{ overflowX: 'auto' }}>
+                  <table style={{
+                    width: '100%',
+                    borderCollapse: 'collapse',
+                    marginTop: '20px'
+                  }}>
+                    <thead>
+                      <tr style={{
+                        background: '#f3f4f6',
+                        borderBottom: '2px solid #7c3aed'
                       }}>
-                        <thead>
-                          <tr style={{
-                            background: '#f3f4f6',
-                            borderBottom: '2px solid #7c3aed'
+                        <th style={{ padding: '12px', textAlign: 'left', color: '#7c3aed' }}>ID</th>
+                        <th style={{ padding: '12px', textAlign: 'left', color: '#7c3aed' }}>Job Title</th>
+                        <th style={{ padding: '12px', textAlign: 'left', color: '#7c3aed' }}>Company Name</th>
+                        <th style={{ padding: '12px', textAlign: 'left', color: '#7c3aed' }}>University</th>
+                        <th style={{ padding: '12px', textAlign: 'left', color: '#7c3aed' }}>Status</th>
+                        <th style={{ padding: '12px', textAlign: 'left', color: '#7c3aed' }}>Close Date</th>
+                        <th style={{ padding: '12px', textAlign: 'left', color: '#7c3aed' }}>Type</th>
+                        <th style={{ padding: '12px', textAlign: 'left', color: '#7c3aed' }}>Salary</th>
+                      </tr>
+                    </thead>
+                    <tbody>
+                      {jobs.rows.map((job) => (
+                        <tr key={job.id} style={{ borderBottom: '1px solid #e5e7eb' }}>
+                          <td style={{ padding: '12px', verticalAlign: 'middle' }}>{job.id}</td>
+                          <td style={{ 
+                            padding: '12px',
+                            verticalAlign: 'middle',
+                            fontWeight: '500',
+                            color: '#333'
                           }}>
-                            <th style={{ padding: '12px', textAlign: 'left', color: '#7c3aed' }}>ID</th>
-                            <th style={{ padding: '12px', textAlign: 'left', color: '#7c3aed' }}>Job Title</th>
-                            <th style={{ padding: '12px', textAlign: 'left', color: '#7c3aed' }}>Company Name</th>
-                            <th style={{ padding: '12px', textAlign: 'left', color: '#7c3aed' }}>University</th>
-                            <th style={{ padding: '12px', textAlign: 'left', color: '#7c3aed' }}>Status</th>
-                            <th style={{ padding: '12px', textAlign: 'left', color: '#7c3aed' }}>Close Date</th>
-                            <th style={{ padding: '12px', textAlign: 'left', color: '#7c3aed' }}>Type</th>
-                            <th style={{ padding: '12px', textAlign: 'left', color: '#7c3aed' }}>Salary</th>
-                          </tr>
-                        </thead>
-                        <tbody>
-                          {jobs.map((job) => (
-                            <tr key={job.id} style={{ borderBottom: '1px solid #e5e7eb' }}>
-                              <td style={{ padding: '12px', verticalAlign: 'middle' }}>{job.id}</td>
-                              <td style={{ 
-                                padding: '12px',
-                                verticalAlign: 'middle',
-                                fontWeight: '500',
-                                color: '#333'
-                              }}>
-                                {job.title}
-                              </td>
-                              <td style={{ 
-                                padding: '12px', 
-                                verticalAlign: 'middle',
-                                color: '#059669',
-                                fontWeight: '500'
-                              }}>
-                                {job.companyName}
-                              </td>
-                              <td style={{ padding: '12px', verticalAlign: 'middle' }}>
-                                <span style={{
-                                  display: 'inline-block',
-                                  background: '#dbeafe',
-                                  color: '#1e40af',
-                                  padding: '4px 12px',
-                                  borderRadius: '12px',
-                                  fontSize: '0.85rem',
-                                  fontWeight: '500',
-                                  whiteSpace: 'nowrap'
-                                }}>
-                                  {job.universityName}
-                                </span>
-                              </td>
-                              <td style={{ padding: '12px', verticalAlign: 'middle' }}>
-                                <span style={{
-                                  display: 'inline-block',
-                                  background: job.status === 'active' ? '#d1fae5' : '#fee2e2',
-                                  color: job.status === 'active' ? '#065f46' : '#991b1b',
-                                  padding: '4px 12px',
-                                  borderRadius: '12px',
-                                  fontSize: '0.85rem',
-                                  fontWeight: '500',
-                                  textTransform: 'capitalize'
-                                }}>
-                                  {job.status === 'active' ? '✓ Active' : '✗ Inactive'}
-                                </span>
-                              </td>
-                              <td style={{ 
-                                padding: '12px', 
-                                verticalAlign: 'middle',
-                                color: job.status === 'inactive' ? '#991b1b' : '#333'
-                              }}>
-                                {new Date(job.enddate).toLocaleDateString('en-US', {
-                                  year: 'numeric',
-                                  month: 'short',
-                                  day: 'numeric'
-                                })}
-                              </td>
-                              <td style={{ padding: '12px', verticalAlign: 'middle' }}>
-                                <span style={{
-                                  display: 'inline-block',
-                                  background: '#f3f4f6',
-                                  color: '#374151',
-                                  padding: '4px 8px',
-                                  borderRadius: '8px',
-                                  fontSize: '0.85rem'
-                                }}>
-                                  {job.type}
-                                </span>
-                              </td>
-                              <td style={{ 
-                                padding: '12px', 
-                                verticalAlign: 'middle',
-                                color: '#059669',
-                                fontWeight: '500'
-                              }}>
-                                {job.salary}
-                              </td>
-                            </tr>
-                          ))}
-                        </tbody>
-                      </table>
-                    </div>
-                  )}
+                            {job.title}
+                          </td>
+                          <td style={{ 
+                            padding: '12px', 
+                            verticalAlign: 'middle',
+                            color: '#059669',
+                            fontWeight: '500'
+                          }}>
+                            {job.companyName}
+                          </td>
+                          <td style={{ padding: '12px', verticalAlign: 'middle' }}>
+                            <span style={{
+                              display: 'inline-block',
+                              background: '#dbeafe',
+                              color: '#1e40af',
+                              padding: '4px 12px',
+                              borderRadius: '12px',
+                              fontSize: '0.85rem',
+                              fontWeight: '500',
+                              whiteSpace: 'nowrap'
+                            }}>
+                              {job.universityName}
+                            </span>
+                          </td>
+                          <td style={{ padding: '12px', verticalAlign: 'middle' }}>
+                            <span style={{
+                              display: 'inline-block',
+                              background: job.status === 'active' ? '#d1fae5' : '#fee2e2',
+                              color: job.status === 'active' ? '#065f46' : '#991b1b',
+                              padding: '4px 12px',
+                              borderRadius: '12px',
+                              fontSize: '0.85rem',
+                              fontWeight: '500',
+                              textTransform: 'capitalize'
+                            }}>
+                              {job.status === 'active' ? '✓ Active' : '✗ Inactive'}
+                            </span>
+                          </td>
+                          <td style={{ 
+                            padding: '12px', 
+                            verticalAlign: 'middle',
+                            color: job.status === 'inactive' ? '#991b1b' : '#333'
+                          }}>
+                            {new Date(job.enddate).toLocaleDateString('en-US', {
+                              year: 'numeric',
+                              month: 'short',
+                              day: 'numeric'
+                            })}
+                          </td>
+                          <td style={{ padding: '12px', verticalAlign: 'middle' }}>
+                            <span style={{
+                              display: 'inline-block',
+                              background: '#f3f4f6',
+                              color: '#374151',
+                              padding: '4px 8px',
+                              borderRadius: '8px',
+                              fontSize: '0.85rem'
+                            }}>
+                              {job.type}
+                            </span>
+                          </td>
+                          <td style={{ 
+                            padding: '12px', 
+                            verticalAlign: 'middle',
+                            color: '#059669',
+                            fontWeight: '500'
+                          }}>
+                            {job.salary}
+                          </td>
+                        </tr>
+                      ))}
+                    </tbody>
+                  </table>
+                  <LoadMoreButton list={jobs} />
                 </div>
               )}
             </div>
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import CompanyNavbar from '../../components/CompanyNavbar';
 import { api } from '../../services/api';
 import { getCompanyId } from '../../utils/auth';
@@ -21,16 +21,49 @@ interface Applicant {
   applicationid: number;
 }
 
+interface PostedJob {
+  id: number;
+  title: string;
+}
+
 const CompanyApplicants: React.FC = () => {
   const [applicants, setApplicants] = useState<Applicant[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string>('');
+  // Filters applied on the server, and the cursor of the next page (null on the last page)
+  const [postedJobs, setPostedJobs] = useState<PostedJob[]>([]);
+  const [jobFilter, setJobFilter] = useState<string>('');
+  const [statusFilter, setStatusFilter] = useState<string>('');
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  // only the latest request may update the list (a slower earlier filter can answer last)
+  const requestId = useRef(0);
 
   useEffect(() => {
-    fetchApplicants();
+    const fetchPostedJobs = async () => {
+      const companyId = getCompanyId();
+      if (!companyId) return;
+      try {
+        const response = await api.company.getJobs({ company_id: companyId });
+        if (response.data.success) {
+          setPostedJobs(response.data.data);
+        }
+      } catch (err) {
+        console.error('Error fetching jobs:', err);
+      }
+    };
+
+    fetchPostedJobs();
   }, []);
 
-  const fetchApplicants = async () => {
+  useEffect(() => {
+    setApplicants([]);
+    setNextCursor(null);
+    fetchApplicants(null);
+  }, [jobFilter, statusFilter]);
+
+  // First page when cursor is null, otherwise the page after cursor appended to the list
+  const fetchApplicants = async (cursor: string | null) => {
+    const id = ++requestId.current;
     try {
       setLoading(true);
       setError('');
@@ -44,19 +77,29 @@ const CompanyApplicants: React.FC = () => {
         return;
       }
       
-      const response = await api.company.getApplicants({ companyid: companyId });
+      const response = await api.company.getApplicants({
+        companyid: companyId,
+        ...(jobFilter ? { jobid: jobFilter } : {}),
+        ...(statusFilter ? { status: statusFilter } : {}),
+        ...(cursor ? { cursor } : {})
+      });
+      if (id !== requestId.current) return;
       
       if (response.data.success) {
-        // Backend now returns an array of all applicants
-        setApplicants(response.data.data || []);
+        const page = response.data.data || [];
+        setApplicants((previous) => (cursor ? [...previous, ...page] : page));
+        setNextCursor(response.data.nextCursor);
       } else {
         setError(response.data.message || 'Failed to fetch applicants');
       }
     } catch (err: any) {
+      if (id !== requestId.current) return;
       console.error('Error fetching applicants:', err);
       setError(err.response?.data?.message || 'Failed to load applicants. Please try again.');
     } finally {
-      setLoading(false);
+      if (id === requestId.current) {
+        setLoading(false);
+      }
     }
   };
 
@@ -94,19 +137,6 @@ const CompanyApplicants: React.FC = () => {
     }
   };
 
-  if (loading) {
-    return (
-      <>
-        <CompanyNavbar />
-        <div className="page-container">
-          <div style={{ textAlign: 'center', padding: '40px' }}>
-            <p>Loading applicants...</p>
-          </div>
-        </div>
-      </>
-    );
-  }
-
   return (
     <>
       <CompanyNavbar />
@@ -128,8 +158,35 @@ const CompanyApplicants: React.FC = () => {
           </div>
         )}
 
+        <div style={{ display: 'flex', gap: '10px', justifyContent: 'center', flexWrap: 'wrap', marginBottom: '25px' }}>
+          <select
+            value={jobFilter}
+            onChange={(e) => setJobFilter(e.target.value)}
+            style={{ padding: '8px 12px', borderRadius: '6px', border: '1px solid #ddd', fontSize: '0.9rem' }}
+          >
+            <option value="">All jobs</option>
+            {postedJobs.map((job) => (
+              <option key={job.id} value={String(job.id)}>{job.title}</option>
+            ))}
+          </select>
+          <select
+            value={statusFilter}
+            onChange={(e) => setStatusFilter(e.target.value)}
+            style={{ padding: '8px 12px', borderRadius: '6px', border: '1px solid #ddd', fontSize: '0.9rem' }}
+          >
+            <option value="">All statuses</option>
+            <option value="pending">Pending</option>
+            <option value="rejected">Rejected</option>
+            <option value="interview scheduled">Interview Scheduled</option>
+          </select>
+        </div>
+
         <div className="profile-container" style={{ maxWidth: '1100px', padding: '0' }}>
-          {applicants.length > 0 ? (
+          {loading && applicants.length === 0 ? (
+            <div style={{ textAlign: 'center', padding: '40px' }}>
+              <p>Loading applicants...</p>
+            </div>
+          ) : applicants.length > 0 ? (
             <div style={{ display: 'flex', flexDirection: 'column', gap: '20px' }}>
               {applicants.map((applicant, index) => (
                 <div 
@@ -236,6 +293,18 @@ const CompanyApplicants: React.FC = () => {
                   </div>
                 </div>
               ))}
+              {nextCursor && (
+                <div style={{ textAlign: 'center' }}>
+                  <button
+                    className="btn"
+                    onClick={() => fetchApplicants(nextCursor)}
+                    disabled={loading}
+                    style={{ padding: '8px 16px', fontSize: '0.9rem', backgroundColor: '#0f766e' }}
+                  >
+                    {loading ? 'Loading...' : 'Load more applicants'}
+                  </button>
+                </div>
+              )}
             </div>
           ) : (
             <div style={{ padding: '40px', textAlign: 'center', color: '#888' }}>
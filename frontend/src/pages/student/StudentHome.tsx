@@ -26,6 +26,12 @@ const StudentHome: React.FC = () => {
   // 3. State to track which jobs user has applied to
   // Now fetched from backend instead of localStorage
   const [appliedJobIds, setAppliedJobIds] = useState<number[]>([]);
+  // Server-side search results (null while the search box is empty)
+  const [searchResults, setSearchResults] = useState<Job[] | null>(null);
+  // Cursors of the next feed / search page (null on the last page)
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [searchCursor, setSearchCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState<boolean>(false);
 
   // Fetch jobs and applied jobs on component mount
   useEffect(() => {
@@ -42,6 +48,7 @@ const StudentHome: React.FC = () => {
         
         if (jobsResponse.data.success) {
           setJobs(jobsResponse.data.data);
+          setNextCursor(jobsResponse.data.nextCursor);
         } else {
           setError(jobsResponse.data.message || 'Failed to load jobs');
         }
@@ -100,11 +107,57 @@ const StudentHome: React.FC = () => {
     }
   };
 
-  // 5. Filter Logic
-  const filteredJobs = jobs.filter(job => 
-    job.title.toLowerCase().includes(searchTerm.toLowerCase()) || 
-    job.companyname.toLowerCase().includes(searchTerm.toLowerCase())
-  );
+  // 5. Search Logic - ranked search on the backend, debounced while typing
+  useEffect(() => {
+    const query = searchTerm.trim();
+    if (!query) {
+      setSearchResults(null);
+      return;
+    }
+
+    const timer = setTimeout(async () => {
+      try {
+        const response = await api.student.searchJobs(query);
+        if (response.data.success) {
+          setSearchResults(response.data.data);
+          setSearchCursor(response.data.nextCursor);
+        }
+      } catch (err) {
+        console.error('Error searching jobs:', err);
+      }
+    }, 300);
+
+    return () => clearTimeout(timer);
+  }, [searchTerm]);
+
+  const filteredJobs = searchResults ?? jobs;
+  const moreCursor = searchResults !== null ? searchCursor : nextCursor;
+
+  // 6. Next page of the feed (or of the search results), fetched only when the student asks
+  const handleLoadMore = async () => {
+    const searching = searchResults !== null;
+    if (!moreCursor) return;
+
+    setLoadingMore(true);
+    try {
+      const response = searching
+        ? await api.student.searchJobs(searchTerm.trim(), moreCursor)
+        : await api.student.getJobs(moreCursor);
+      if (response.data.success) {
+        if (searching) {
+          setSearchResults((previous) => [...(previous ?? []), ...response.data.data]);
+          setSearchCursor(response.data.nextCursor);
+        } else {
+          setJobs((previous) => [...previous, ...response.data.data]);
+          setNextCursor(response.data.nextCursor);
+        }
+      }
+    } catch (err) {
+      console.error('Error loading more jobs:', err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
 
   return (
     <>
@@ -120,7 +173,7 @@ const StudentHome: React.FC = () => {
             <input 
               type="text" 
               className="search-input"
-              placeholder="Search roles or companies..." 
+              placeholder="Search roles, skills or keywords..." 
               value={searchTerm}
               onChange={(e) => setSearchTerm(e.target.value)}
             />
@@ -186,6 +239,14 @@ const StudentHome: React.FC = () => {
           </div>
         )}
 
+        {!loading && !error && moreCursor && (
+          <div style={{ textAlign: 'center', padding: '2rem' }}>
+            <button className="apply-btn" onClick={handleLoadMore} disabled={loadingMore}>
+              {loadingMore ? 'Loading...' : 'Load more jobs'}
+            </button>
+          </div>
+        )}
+
       </div>
     </>
   );
@@ -25,6 +25,7 @@ const StudentProfile: React.FC = () => {
   
   const [resumeFile, setResumeFile] = useState<File | null>(null);
   const [resumeName, setResumeName] = useState<string>(""); 
+  const [resumeStatus, setResumeStatus] = useState<string | null>(null);
 
   // 1. LOAD DATA ON COMPONENT MOUNT
   useEffect(() => {
@@ -44,6 +45,7 @@ const StudentProfile: React.FC = () => {
                 linkedin: profile.linkedin || ''
               });
               setResumeName(profile.resume || '');
+              setResumeStatus(profile.resumeStatus || null);
               setIsEditing(false);
             }
           }
@@ -106,6 +108,10 @@ const StudentProfile: React.FC = () => {
       } else {
         // Update existing profile
         await api.student.updateProfile(formDataToSend);
+        if (resumeFile) {
+          // the resume is uploaded in the background; checkProfile reports when it is ready
+          setResumeStatus('pending');
+        }
         setSuccess('Profile updated successfully!');
         setIsEditing(false);
       }
@@ -294,6 +300,8 @@ const StudentProfile: React.FC = () => {
                 <span className="view-label">Resume</span>
                 <p className="view-content">
                   {resumeName ? `📄 ${resumeName}` : "No resume uploaded."}
+                  {resumeStatus === 'pending' && " (processing...)"}
+                  {resumeStatus === 'failed' && " (upload failed, please upload it again)"}
                 </p>
               </div>
             </div>
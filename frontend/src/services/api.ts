@@ -125,6 +125,22 @@ export const connectToBackend = async (actionType: string, data: any) => {
   }
 };
 
+// Rows requested per page of a paginated listing
+export const PAGE_SIZE = 50;
+
+// Listings are keyset-paginated GETs: fetch one page, passing the previous page's nextCursor as `cursor`
+export const getPage = async (
+  url: string,
+  params: Record<string, any> = {},
+  headers: Record<string, string> = {}
+) => {
+  const response = await axios.get(`${API_BASE_URL}${url}`, {
+    params: { limit: PAGE_SIZE, ...params },
+    headers
+  });
+  return response.data;
+};
+
 // Protected API calls (automatically includes JWT token and university ID)
 export const api = {
   // Student endpoints
@@ -147,8 +163,16 @@ export const api = {
       });
     },
     getProfile: () => apiClient.get('/student/profile'),
-    getJobs: () => apiClient.post('/get/JobDetails', {
-      universityId: getUniversityId()
+    // one page of the feed; pass the previous page's nextCursor for the next one
+    getJobs: (cursor?: string | null) => apiClient.post('/get/JobDetails', {
+      universityId: getUniversityId(),
+      ...(cursor ? { cursor } : {})
+    }),
+    // ranked full-text search over title, requirements and description (one page, best match first)
+    searchJobs: (q: string, cursor?: string | null) => apiClient.post('/search/jobs', {
+      universityId: getUniversityId(),
+      q,
+      ...(cursor ? { cursor } : {})
     }),
     applyJob: (data: { studentid: string | number; companyid: string | number; jobid: string | number }) => 
       apiClient.post('/get/applicants', {
@@ -158,8 +182,9 @@ export const api = {
     getAppliedJobs: () => apiClient.get('/student/applied-jobs'),
     getAppliedJobIds: (data: { studentid: string | number }) => 
       apiClient.post('/get/student/appliedJobs', data),
+    // GET so the browser can revalidate with the ETag and reuse its cached copy on 304
     getAppliedJobsDetails: (data: { studentid: string | number }) => 
-      apiClient.post('/get/student/appliedJobsDetails', data),
+      apiClient.get('/get/student/appliedJobsDetails', { params: data }),
   },
   
   // Company endpoints
@@ -188,7 +213,8 @@ export const api = {
       ...data,
       universityId: getUniversityId()
     }),
-    getApplicants: (data: { companyid: string | number }) => 
+    // one page of applicants, optionally only for one job / status; pass nextCursor as cursor for the next
+    getApplicants: (data: { companyid: string | number; jobid?: string; status?: string; cursor?: string | null }) =>
       apiClient.post('/set/jobApplicantData/companyportal', data),
     updateApplicationStatus: (data: { application_id: number; status: string }) =>
       apiClient.post('/update/applicationStatus', data),